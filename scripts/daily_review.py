@@ -15,7 +15,9 @@ the system automatically adapts its behavior based on past performance.
 """
 import logging
 import sys
-from datetime import datetime, timedelta, timezone
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
 # Add src to path
@@ -30,12 +32,15 @@ from src.pipeline.market_config import US_MARKET
 from src.pipeline.review import (
     adjust_thresholds_for_strategies,
     adjust_factor_weights,
-    populate_judgment_outcomes,
-    get_unprocessed_outcome_dates,
+    populate_judgment_outcomes_for_passes,
+    get_unprocessed_outcome_dates_multi,
     check_batch_gap,
     get_current_price,
-    calculate_all_returns,
+    calculate_returns_for_passes,
     log_return_summary,
+    run_for_strategies,
+    strategies_with_returns,
+    PriceCache,
 )
 from src.portfolio import PortfolioManager
 from src.batch_logger import BatchLogger, BatchType
@@ -48,9 +53,14 @@ logger = get_logger(__name__)
 
 def main():
     """Main review pipeline."""
+    # Single clock snapshot so every step agrees on "today" (even across midnight)
+    now = datetime.now(timezone.utc)
+    today_date = now.date()
+    today = today_date.isoformat()
+
     logger.info("=" * 60)
     logger.info("Starting daily review batch (ALL STOCKS)")
-    logger.info(f"Timestamp: {datetime.utcnow().isoformat()}")
+    logger.info(f"Timestamp: {now.isoformat()}")
     logger.info("=" * 60)
 
     market_config = US_MARKET
@@ -70,51 +80,66 @@ def main():
         BatchLogger.finish(batch_ctx, error=str(e))
         sys.exit(1)
 
-    # Build price fetcher using shared function
-    def price_fetcher(symbol: str) -> float | None:
+    # Build price fetcher using shared function; cached so every pass
+    # (backfill, 5d, 1d) quotes each symbol once
+    def fetch_price(symbol: str) -> float | None:
         return get_current_price(symbol, market_config, finnhub=finnhub, yf_client=yf_client)
 
+    price_fetcher = PriceCache(fetch_price)
+
     # Initialize results in case of unexpected exceptions
     results_5d = {"error": "Not executed"}
     results_1d = {"error": "Not executed"}
 
     # Step 0: Check for batch gaps and backfill missed outcomes
-    check_batch_gap(supabase, market_type=market_config.market_type)
+    check_batch_gap(supabase, market_type=market_config.market_type, now=now)
 
+    # Backfill passes for missed dates; today's 5d/1d dates are covered by Steps 1-2
+    backfill_passes: list[tuple[int, str]] = []
     try:
-        today_date = datetime.now(timezone.utc).date()
         MAX_BACKFILL_DATES = 2
-
-        unprocessed_5d = get_unprocessed_outcome_dates(supabase, return_field="5d", strategy_modes=strategies)
-        for missed_date in unprocessed_5d[:MAX_BACKFILL_DATES]:
-            days_ago = (today_date - datetime.strptime(missed_date, "%Y-%m-%d").date()).days
-            logger.info(f"Backfilling 5d outcomes for {missed_date} (days_ago={days_ago})")
-            backfill_results = calculate_all_returns(price_fetcher, supabase, market_config, days_ago=days_ago, return_field="5d")
-            populate_judgment_outcomes(supabase, backfill_results, return_field="5d")
-
-        unprocessed_1d = get_unprocessed_outcome_dates(supabase, return_field="1d", min_age_days=1, strategy_modes=strategies)
-        for missed_date in unprocessed_1d[:MAX_BACKFILL_DATES]:
-            days_ago = (today_date - datetime.strptime(missed_date, "%Y-%m-%d").date()).days
-            logger.info(f"Backfilling 1d outcomes for {missed_date} (days_ago={days_ago})")
-            backfill_results = calculate_all_returns(price_fetcher, supabase, market_config, days_ago=days_ago, return_field="1d")
-            populate_judgment_outcomes(supabase, backfill_results, return_field="1d")
+        regular_days_ago = {"5d": 5, "1d": 1}
+
+        unprocessed = get_unprocessed_outcome_dates_multi(
+            supabase, min_age_days_by_field={"5d": 5, "1d": 1}, strategy_modes=strategies, now=now
+        )
+        for return_field in ("5d", "1d"):
+            missed = [
+                (missed_date, days_ago)
+                for missed_date in unprocessed[return_field]
+                if (days_ago := (today_date - date.fromisoformat(missed_date)).days) != regular_days_ago[return_field]
+            ]
+            for missed_date, days_ago in missed[:MAX_BACKFILL_DATES]:
+                logger.info(f"Backfilling {return_field} outcomes for {missed_date} (days_ago={days_ago})")
+                backfill_passes.append((days_ago, return_field))
+
+        if not backfill_passes:
+            logger.info("No outcome backfill needed")
     except Exception as e:
         logger.error(f"Outcome backfill failed (non-fatal): {e}")
 
     # 1. Calculate returns for ALL stocks (5-day review)
-    logger.info("Step 1: Calculating 5-day returns for ALL scored stocks...")
-    results_5d = calculate_all_returns(price_fetcher, supabase, market_config, days_ago=5, return_field="5d")
-    log_return_summary(results_5d, "5-day")
-
-    # 1b. Record judgment outcomes for 5-day returns
-    populate_judgment_outcomes(supabase, results_5d, return_field="5d")
-
     # 2. Also do 1-day review (for faster feedback)
-    logger.info("Step 2: Calculating 1-day returns for ALL scored stocks...")
-    results_1d = calculate_all_returns(price_fetcher, supabase, market_config, days_ago=1, return_field="1d")
+    # Every pass (backfill, 5d, 1d) prices against the current quote, so they
+    # share one sweep: one scores query, one round of quotes, one bulk write.
+    logger.info("Steps 1-2: Calculating 5-day and 1-day returns for ALL scored stocks...")
+    review_passes = backfill_passes + [(5, "5d"), (1, "1d")]
+    pass_results = calculate_returns_for_passes(
+        price_fetcher, supabase, market_config, review_passes, now=now,
+    )
+    *backfill_results, results_5d, results_1d = pass_results
+    backfill_results_5d = [
+        results for results, (_, return_field) in zip(backfill_results, backfill_passes)
+        if return_field == "5d"
+    ]
+    log_return_summary(results_5d, "5-day")
 
-    # 2b. Record judgment outcomes for 1-day returns
-    populate_judgment_outcomes(supabase, results_1d, return_field="1d")
+    # 1b/2b. Record judgment outcomes for every pass (backfill included)
+    populate_judgment_outcomes_for_passes(
+        supabase,
+        [(results, return_field) for results, (_, return_field) in zip(pass_results, review_passes)],
+        now=now,
+    )
 
     # 3. PAPER TRADING: Evaluate exit signals and close positions
     logger.info("Step 3: Evaluating exit signals for open positions...")
@@ -125,14 +150,21 @@ def main():
         market_config=market_config,
     )
 
+    # Market regime, thresholds and open positions are independent reads,
+    # so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        future_regime = executor.submit(supabase.get_market_regime, today)
+        future_configs = executor.submit(supabase.get_scoring_configs_bulk, strategies)
+        future_positions = executor.submit(portfolio.get_open_positions)
+
     # Get current market regime
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    current_regime = supabase.get_market_regime(today)
+    current_regime = future_regime.result()
     market_regime_str = current_regime.get("market_regime") if current_regime else None
 
     # Get current thresholds
-    v1_config = supabase.get_scoring_config(market_config.v1_strategy_mode)
-    v2_config = supabase.get_scoring_config(market_config.v2_strategy_mode)
+    configs = future_configs.result()
+    v1_config = configs.get(market_config.v1_strategy_mode)
+    v2_config = configs.get(market_config.v2_strategy_mode)
     thresholds = {
         market_config.v1_strategy_mode: float(v1_config.get("threshold", market_config.default_v1_threshold)) if v1_config else market_config.default_v1_threshold,
         market_config.v2_strategy_mode: float(v2_config.get("threshold", market_config.default_v2_threshold)) if v2_config else market_config.default_v2_threshold,
@@ -158,8 +190,11 @@ def main():
             scores_by_strategy[strategy] = {}
 
     # Get all open positions
-    all_positions = portfolio.get_open_positions()
+    all_positions = future_positions.result()
     logger.info(f"Found {len(all_positions)} open positions")
+    positions_by_strategy: dict[str, list] = defaultdict(list)
+    for position in all_positions:
+        positions_by_strategy[position.strategy_mode].append(position)
 
     exit_signals = []
 
@@ -168,10 +203,9 @@ def main():
         exit_judgments: dict[str, object] = {}
         if config.llm.enable_judgment:
             try:
-                judgment_service = JudgmentService()
                 all_soft_candidates = []
                 for strategy in strategies:
-                    strategy_positions = [p for p in all_positions if p.strategy_mode == strategy]
+                    strategy_positions = positions_by_strategy[strategy]
                     current_scores = scores_by_strategy.get(strategy, {})
                     soft_candidates = portfolio.get_soft_exit_candidates(
                         positions=strategy_positions,
@@ -183,6 +217,8 @@ def main():
 
                 if all_soft_candidates:
                     logger.info(f"Consulting AI for {len(all_soft_candidates)} soft exit candidates")
+                    # Built only when needed so quiet days skip LLM client setup
+                    judgment_service = JudgmentService()
                     ai_results = judgment_service.judge_exits(
                         positions_for_review=all_soft_candidates,
                         market_regime=market_regime_str or "normal",
@@ -194,7 +230,7 @@ def main():
 
         # Step 3b: Evaluate exit signals with AI judgments
         for strategy in strategies:
-            strategy_positions = [p for p in all_positions if p.strategy_mode == strategy]
+            strategy_positions = positions_by_strategy[strategy]
             if not strategy_positions:
                 continue
 
@@ -237,18 +273,18 @@ def main():
     else:
         logger.warning("Could not get S&P500 daily return")
 
-    # Update portfolio snapshots
+    # Update portfolio snapshots (independent per strategy, run concurrently)
     logger.info("Updating portfolio snapshots...")
-    for strategy in strategies:
-        closed_today = len([s for s in exit_signals if s.position.strategy_mode == strategy]) if exit_signals else 0
-        try:
-            portfolio.update_portfolio_snapshot(
-                strategy_mode=strategy,
-                closed_today=closed_today,
-                benchmark_daily_pct=sp500_daily_pct,
-            )
-        except Exception as e:
-            logger.error(f"Failed to update snapshot for {strategy}: {e}")
+    closed_counts = Counter(s.position.strategy_mode for s in exit_signals)
+    run_for_strategies(
+        lambda strategy: portfolio.update_portfolio_snapshot(
+            strategy_mode=strategy,
+            closed_today=closed_counts[strategy],
+            benchmark_daily_pct=sp500_daily_pct,
+        ),
+        strategies,
+        label="Snapshot update",
+    )
 
     # 4. FEEDBACK LOOP: Adjust thresholds based on performance
     if not results_5d.get("error"):
@@ -258,14 +294,29 @@ def main():
         logger.info("Step 4: Skipping threshold adjustment (no 5-day data)")
 
     # 5. FEEDBACK LOOP: Adjust factor weights based on outcome correlations
+    # Weights move incrementally from stock_scores.return_5d; when no 5d returns
+    # were written (e.g. the date 5 days ago was a weekend) the data is unchanged,
+    # so skip rather than nudge the weights again on the same inputs
     logger.info("Step 5: Adjusting factor weights (FEEDBACK LOOP)...")
+    updated_strategies = strategies_with_returns(results_5d, *backfill_results_5d)
     for strategy in strategies:
-        adjust_factor_weights(supabase, strategy)
+        if strategy not in updated_strategies:
+            logger.info(f"Factor weight adjustment skipped ({strategy}): no new 5d returns")
+    run_for_strategies(
+        lambda strategy: adjust_factor_weights(supabase, strategy),
+        [s for s in strategies if s in updated_strategies],
+        label="Factor weight adjustment",
+    )
 
     # 6. Get and log performance summary
     logger.info("Step 6: Getting overall performance summary...")
+    # Not isolated per strategy: a failed summary query fails the batch
+    with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+        summaries = dict(zip(strategies, executor.map(
+            lambda s: supabase.get_performance_summary(days=30, strategy_mode=s), strategies
+        )))
     for strategy in strategies:
-        summary = supabase.get_performance_summary(days=30, strategy_mode=strategy)
+        summary = summaries[strategy]
         logger.info(f"\n{strategy.upper()} Summary (30 days):")
         logger.info(f"  Picked: {summary.get('picked_count', 0)} stocks, avg return: {summary.get('picked_avg_return', 0):.2f}%")
         logger.info(f"  Not Picked: {summary.get('not_picked_count', 0)} stocks, avg return: {summary.get('not_picked_avg_return', 0):.2f}%")
@@ -273,12 +324,16 @@ def main():
 
     # 7. META-MONITOR: Detect degradation and auto-correct
     logger.info("Step 7: Running meta-monitor (autonomous improvement)...")
-    from src.meta_monitor import run_meta_monitor
-    for strategy in strategies:
-        try:
-            run_meta_monitor(supabase, strategy)
-        except Exception as e:
-            logger.error(f"Meta-monitor failed for {strategy}: {e}")
+    from src.meta_monitor import compute_rolling_metrics_bulk, run_meta_monitor
+    # Rolling metrics for every strategy come from one pass over the outcomes
+    metrics_by_strategy = compute_rolling_metrics_bulk(supabase, strategies)
+    run_for_strategies(
+        lambda strategy: run_meta_monitor(
+            supabase, strategy, metrics=metrics_by_strategy.get(strategy)
+        ),
+        strategies,
+        label="Meta-monitor",
+    )
 
     logger.info("=" * 60)
     logger.info("Daily review batch completed")
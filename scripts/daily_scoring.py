@@ -16,12 +16,13 @@ Data Source Strategy:
 - If both fail: Batch fails with clear error (no fake data)
 """
 import argparse
+import gc
 import json
 import logging
 import os
 import sys
-import time
-from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -37,26 +38,28 @@ from src.data.supabase_client import (
     DailyPick,
     MarketRegimeRecord,
 )
-from src.scoring.market_regime import decide_market_regime, calculate_sma, calculate_volatility
+from src.scoring.market_regime import decide_market_regime, calculate_regime_features
 from src.scoring.agents import StockData
 from src.scoring.agents_v2 import V2StockData
 from src.scoring.composite_v2 import run_dual_scoring
 from src.portfolio import PortfolioManager
-from src.judgment import (
-    JudgmentService,
-    run_judgment_for_candidates,
-    filter_picks_by_judgment,
-    select_final_picks,
-)
-from src.scoring.composite_v2 import get_threshold_passed_symbols
 from src.batch_logger import BatchLogger, BatchType
 from src.monitoring import BatchMetrics, record_batch_metrics, check_and_alert, send_alert, AlertLevel
 from src.pipeline import US_MARKET, load_dynamic_thresholds, load_factor_weights, run_llm_judgment_phase, open_positions_and_snapshot
-from src.logging_config import setup_logging, set_batch_id, get_logger, create_symbol_logger
+from src.logging_config import setup_logging, get_logger
 
 
 # Checkpoint configuration
 CHECKPOINT_DIR = Path("/tmp/ai_pick_daily_checkpoints")
+# Sync mode appends to the checkpoint log every N fetched symbols (and on loop exit)
+CHECKPOINT_EVERY = 5
+# Ignore the checkpoint log if more than this share of its lines are malformed
+CHECKPOINT_MAX_CORRUPT_RATIO = 0.1
+# Checkpoints not updated within this window are stale and discarded
+CHECKPOINT_MAX_AGE = timedelta(hours=24)
+
+# Worker threads for sync-mode stock data fetching
+SYNC_FETCH_WORKERS = 4
 
 
 @dataclass
@@ -68,7 +71,18 @@ class BatchCheckpoint:
     # Store fetched stock data (V1 and V2) keyed by symbol
     v1_stock_data: dict[str, dict] = field(default_factory=dict)
     v2_stock_data: dict[str, dict] = field(default_factory=dict)
+    # Symbols with upcoming earnings (None until the calendar has been fetched)
+    earnings_symbols: list[str] | None = None
     last_updated: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    # Set mirror of processed_symbols for O(1) lookups (not serialized)
+    _processed_set: set[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._processed_set = set(self.processed_symbols)
+
+    def is_processed(self, symbol: str) -> bool:
+        """Whether symbol already has a checkpointed result."""
+        return symbol in self._processed_set
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -78,9 +92,28 @@ class BatchCheckpoint:
             "failed_symbols": self.failed_symbols,
             "v1_stock_data": self.v1_stock_data,
             "v2_stock_data": self.v2_stock_data,
+            "earnings_symbols": self.earnings_symbols,
             "last_updated": self.last_updated,
         }
 
+    def apply_record(self, record: dict) -> None:
+        """Apply one per-symbol checkpoint log record.
+
+        Replaying a record for an already processed symbol is a no-op, so a
+        log that overlaps the snapshot can be replayed safely.
+        """
+        symbol = record["symbol"]
+        if symbol in self._processed_set:
+            return
+
+        if record["status"] == "ok":
+            self.v1_stock_data[symbol] = record["v1"]
+            self.v2_stock_data[symbol] = record["v2"]
+        else:
+            self.failed_symbols.append(symbol)
+        self.processed_symbols.append(symbol)
+        self._processed_set.add(symbol)
+
     @classmethod
     def from_dict(cls, data: dict) -> "BatchCheckpoint":
         """Create from dictionary."""
@@ -90,17 +123,95 @@ class BatchCheckpoint:
             failed_symbols=data.get("failed_symbols", []),
             v1_stock_data=data.get("v1_stock_data", {}),
             v2_stock_data=data.get("v2_stock_data", {}),
+            earnings_symbols=data.get("earnings_symbols"),
             last_updated=data.get("last_updated", datetime.now(timezone.utc).isoformat()),
         )
 
 
 def get_checkpoint_path(batch_date: str) -> Path:
-    """Get the checkpoint file path for a given batch date."""
+    """Get the checkpoint snapshot path for a given batch date."""
     return CHECKPOINT_DIR / f"checkpoint_{batch_date}.json"
 
 
+def get_checkpoint_log_path(batch_date: str) -> Path:
+    """Get the append-only checkpoint log path for a given batch date."""
+    return CHECKPOINT_DIR / f"checkpoint_{batch_date}.ndjson"
+
+
+def checkpoint_record(
+    symbol: str,
+    result: tuple["StockData", "V2StockData"] | None,
+) -> dict:
+    """Build the checkpoint log record for one fetched symbol."""
+    if result:
+        v1_data, v2_data = result
+        return {
+            "symbol": symbol,
+            "status": "ok",
+            "v1": stock_data_to_dict(v1_data),
+            "v2": v2_stock_data_to_dict(v2_data),
+        }
+    return {"symbol": symbol, "status": "fail"}
+
+
+def append_checkpoint_records(batch_date: str, records: list[dict]) -> None:
+    """Append per-symbol records to the checkpoint log as JSON lines."""
+    if not records:
+        return
+
+    CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
+    # Leading newline so a line torn by an earlier crash is not glued onto
+    # the first new record; blank lines are skipped on replay
+    lines = "\n" + "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records)
+    with open(get_checkpoint_log_path(batch_date), "a") as f:
+        f.write(lines)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def replay_checkpoint_log(checkpoint: BatchCheckpoint) -> bool:
+    """Replay the checkpoint log for the checkpoint's batch date onto it.
+
+    Malformed lines are logged and skipped. A malformed final line is treated
+    as a write torn by a crash and not counted as corruption.
+
+    Returns:
+        False if the log is too corrupted to trust, True otherwise
+    """
+    log_path = get_checkpoint_log_path(checkpoint.batch_date)
+    if not log_path.exists():
+        return True
+
+    log = logging.getLogger(__name__)
+    with open(log_path, "r") as f:
+        lines = [line for line in f.read().split("\n") if line.strip()]
+
+    corrupt = 0
+    for i, line in enumerate(lines):
+        try:
+            checkpoint.apply_record(json.loads(line))
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            if i == len(lines) - 1:
+                log.warning(f"Dropping torn last line of checkpoint log {log_path}: {e}")
+            else:
+                log.warning(f"Malformed line {i + 1} in checkpoint log {log_path}: {e}")
+                corrupt += 1
+
+    if lines and corrupt / len(lines) > CHECKPOINT_MAX_CORRUPT_RATIO:
+        log.warning(
+            f"Checkpoint log {log_path} has {corrupt}/{len(lines)} malformed lines, ignoring"
+        )
+        return False
+
+    if lines:
+        checkpoint.last_updated = datetime.fromtimestamp(
+            log_path.stat().st_mtime, tz=timezone.utc
+        ).isoformat()
+    return True
+
+
 def save_checkpoint(checkpoint: BatchCheckpoint) -> None:
-    """Save checkpoint to file."""
+    """Save a compacted checkpoint snapshot and drop the now-redundant log."""
     CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
     checkpoint.last_updated = datetime.now(timezone.utc).isoformat()
     checkpoint_path = get_checkpoint_path(checkpoint.batch_date)
@@ -108,8 +219,9 @@ def save_checkpoint(checkpoint: BatchCheckpoint) -> None:
     # Write to temp file first, then rename for atomicity
     temp_path = checkpoint_path.with_suffix(".tmp")
     try:
-        with open(temp_path, "w") as f:
-            json.dump(checkpoint.to_dict(), f, indent=2)
+        # Compact separators: the file is dominated by price arrays. One-shot
+        # dumps runs the C encoder in a single pass, unlike dump's chunked writes
+        temp_path.write_text(json.dumps(checkpoint.to_dict(), separators=(",", ":")))
         temp_path.rename(checkpoint_path)
     except Exception as e:
         # Clean up temp file if it exists
@@ -117,32 +229,64 @@ def save_checkpoint(checkpoint: BatchCheckpoint) -> None:
             temp_path.unlink()
         raise e
 
+    # Everything in the log is now in the snapshot (replay is idempotent if
+    # we stop before the unlink)
+    get_checkpoint_log_path(checkpoint.batch_date).unlink(missing_ok=True)
+
 
-def load_checkpoint(batch_date: str) -> BatchCheckpoint | None:
-    """Load checkpoint if exists."""
+def load_checkpoint(batch_date: str, now: datetime | None = None) -> BatchCheckpoint | None:
+    """Load checkpoint if exists: the snapshot, then the log replayed on top.
+
+    Checkpoints last updated more than CHECKPOINT_MAX_AGE before now (defaults
+    to current UTC time) are stale: they are deleted and None is returned.
+    """
     checkpoint_path = get_checkpoint_path(batch_date)
+    log_path = get_checkpoint_log_path(batch_date)
 
-    if not checkpoint_path.exists():
+    if not checkpoint_path.exists() and not log_path.exists():
         return None
 
+    if checkpoint_path.exists():
+        try:
+            with open(checkpoint_path, "r") as f:
+                data = json.load(f)
+            checkpoint = BatchCheckpoint.from_dict(data)
+        except (json.JSONDecodeError, KeyError) as e:
+            # Corrupted checkpoint file - log and return None
+            logging.getLogger(__name__).warning(
+                f"Corrupted checkpoint file {checkpoint_path}, ignoring: {e}"
+            )
+            return None
+    else:
+        checkpoint = BatchCheckpoint(batch_date=batch_date)
+
+    if not replay_checkpoint_log(checkpoint):
+        return None
+
+    now = now or datetime.now(timezone.utc)
     try:
-        with open(checkpoint_path, "r") as f:
-            data = json.load(f)
-        return BatchCheckpoint.from_dict(data)
-    except (json.JSONDecodeError, KeyError) as e:
-        # Corrupted checkpoint file - log and return None
+        age = now - datetime.fromisoformat(checkpoint.last_updated)
+    except (TypeError, ValueError):
+        age = None
+    if age is None or age > CHECKPOINT_MAX_AGE:
         logging.getLogger(__name__).warning(
-            f"Corrupted checkpoint file {checkpoint_path}, ignoring: {e}"
+            f"Checkpoint for {batch_date} is stale (last updated: {checkpoint.last_updated}), discarding"
         )
+        clear_checkpoint(batch_date)
         return None
 
+    return checkpoint
+
 
 def clear_checkpoint(batch_date: str) -> None:
     """Clear checkpoint after successful completion."""
-    checkpoint_path = get_checkpoint_path(batch_date)
+    cleared = False
+    for path in (get_checkpoint_path(batch_date), get_checkpoint_log_path(batch_date)):
+        if path.exists():
+            path.unlink()
+            cleared = True
 
-    if checkpoint_path.exists():
-        checkpoint_path.unlink()
+    if cleared:
         logging.getLogger(__name__).info(f"Cleared checkpoint for {batch_date}")
 
 
@@ -165,8 +309,13 @@ def stock_data_to_dict(stock_data: "StockData") -> dict:
 
 
 def v2_stock_data_to_dict(stock_data: "V2StockData") -> dict:
-    """Convert V2StockData to a JSON-serializable dictionary."""
+    """Convert V2StockData to a JSON-serializable dictionary.
+
+    Prices and volumes are left out: they are the same lists as the symbol's
+    V1 entry, which dict_to_v2_stock_data restores them from.
+    """
     base = stock_data_to_dict(stock_data)
+    del base["prices"], base["volumes"]
     base.update({
         "vix_level": stock_data.vix_level,
         "gap_pct": stock_data.gap_pct,
@@ -194,12 +343,12 @@ def dict_to_stock_data(data: dict) -> "StockData":
     )
 
 
-def dict_to_v2_stock_data(data: dict) -> "V2StockData":
-    """Convert dictionary back to V2StockData."""
+def dict_to_v2_stock_data(data: dict, v1_data: dict) -> "V2StockData":
+    """Convert dictionary back to V2StockData, taking price history from v1_data."""
     return V2StockData(
         symbol=data["symbol"],
-        prices=data["prices"],
-        volumes=data["volumes"],
+        prices=data.get("prices", v1_data["prices"]),
+        volumes=data.get("volumes", v1_data["volumes"]),
         open_price=data["open_price"],
         pe_ratio=data.get("pe_ratio"),
         pb_ratio=data.get("pb_ratio"),
@@ -230,102 +379,123 @@ logger = get_logger(__name__)
 SP500_TOP_SYMBOLS = DEFAULT_US_SYMBOLS
 
 
-def fetch_market_regime_data(finnhub: FinnhubClient, yf_client: YFinanceClient) -> dict:
+def fetch_market_regime_data(
+    finnhub: FinnhubClient,
+    yf_client: YFinanceClient,
+    now: datetime | None = None,
+) -> dict:
     """
     Fetch data needed for market regime determination.
 
     Uses Finnhub as primary source, yfinance as fallback.
     Raises DataFetchError if critical data cannot be obtained from any source.
+    Candle windows are measured back from now (defaults to current UTC time).
     """
     logger.info("Fetching market regime data...")
+    now = now or datetime.now(timezone.utc)
 
-    vix = None
-    sp500_price = None
-    prices = []
-
-    # === Get VIX ===
-    # Try Finnhub first
-    try:
-        vix = finnhub.get_vix()
-        if vix == 0 or vix is None:
-            logger.warning("Finnhub VIX returned 0/None, trying yfinance...")
-            vix = None
-        else:
-            logger.info(f"VIX from Finnhub: {vix}")
-    except Exception as e:
-        logger.warning(f"Finnhub VIX failed: {e}")
-
-    # Fallback to yfinance
-    if vix is None:
+    def _get_vix() -> float | None:
+        # Try Finnhub first
+        vix = None
         try:
-            vix = yf_client.get_vix()
-            if vix and vix > 0:
-                logger.info(f"VIX from yfinance: {vix}")
-            else:
+            vix = finnhub.get_vix()
+            if vix == 0 or vix is None:
+                logger.warning("Finnhub VIX returned 0/None, trying yfinance...")
                 vix = None
+            else:
+                logger.info(f"VIX from Finnhub: {vix}")
         except Exception as e:
-            logger.warning(f"yfinance VIX failed: {e}")
+            logger.warning(f"Finnhub VIX failed: {e}")
 
-    if vix is None:
-        raise DataFetchError("Failed to get VIX from both Finnhub and yfinance")
+        # Fallback to yfinance
+        if vix is None:
+            try:
+                vix = yf_client.get_vix()
+                if vix and vix > 0:
+                    logger.info(f"VIX from yfinance: {vix}")
+                else:
+                    vix = None
+            except Exception as e:
+                logger.warning(f"yfinance VIX failed: {e}")
 
-    # === Get S&P 500 price ===
-    # Try Finnhub first
-    try:
-        sp500 = finnhub.get_sp500()
-        sp500_price = sp500.current_price
-        if sp500_price and sp500_price > 0:
-            logger.info(f"S&P 500 (SPY) from Finnhub: {sp500_price}")
-        else:
-            sp500_price = None
-    except Exception as e:
-        logger.warning(f"Finnhub S&P 500 failed: {e}")
+        return vix
 
-    # Fallback to yfinance
-    if sp500_price is None:
+    def _get_sp500() -> float | None:
+        # Try Finnhub first
+        sp500_price = None
         try:
-            sp500_price = yf_client.get_sp500_price()
+            sp500 = finnhub.get_sp500()
+            sp500_price = sp500.current_price
             if sp500_price and sp500_price > 0:
-                logger.info(f"S&P 500 (SPY) from yfinance: {sp500_price}")
+                logger.info(f"S&P 500 (SPY) from Finnhub: {sp500_price}")
             else:
                 sp500_price = None
         except Exception as e:
-            logger.warning(f"yfinance S&P 500 failed: {e}")
+            logger.warning(f"Finnhub S&P 500 failed: {e}")
 
-    if sp500_price is None:
-        raise DataFetchError("Failed to get S&P 500 price from both Finnhub and yfinance")
+        # Fallback to yfinance
+        if sp500_price is None:
+            try:
+                sp500_price = yf_client.get_sp500_price()
+                if sp500_price and sp500_price > 0:
+                    logger.info(f"S&P 500 (SPY) from yfinance: {sp500_price}")
+                else:
+                    sp500_price = None
+            except Exception as e:
+                logger.warning(f"yfinance S&P 500 failed: {e}")
 
-    # === Get historical prices for SMA and volatility ===
-    # Try Finnhub first
-    try:
-        candles = finnhub.get_stock_candles(
-            "SPY",
-            resolution="D",
-            from_timestamp=int((datetime.now(timezone.utc) - timedelta(days=60)).timestamp()),
-        )
-        prices = candles.get("close", [])
-        if prices:
-            logger.info(f"SPY candles from Finnhub: {len(prices)} days")
-    except Exception as e:
-        logger.warning(f"Finnhub SPY candles failed: {e}")
+        return sp500_price
 
-    # Fallback to yfinance
-    if not prices:
+    def _get_spy_candles() -> list[float]:
+        # Try Finnhub first
+        prices = []
         try:
-            yf_candles = yf_client.get_candles("SPY", period="3mo", interval="1d")
-            if yf_candles and yf_candles.closes:
-                prices = yf_candles.closes
-                logger.info(f"SPY candles from yfinance: {len(prices)} days")
+            candles = finnhub.get_stock_candles(
+                "SPY",
+                resolution="D",
+                from_timestamp=int((now - timedelta(days=60)).timestamp()),
+            )
+            prices = candles.get("close", [])
+            if prices:
+                logger.info(f"SPY candles from Finnhub: {len(prices)} days")
         except Exception as e:
-            logger.warning(f"yfinance SPY candles failed: {e}")
+            logger.warning(f"Finnhub SPY candles failed: {e}")
+
+        # Fallback to yfinance
+        if not prices:
+            try:
+                yf_candles = yf_client.get_candles("SPY", period="3mo", interval="1d")
+                if yf_candles and yf_candles.closes:
+                    prices = yf_candles.closes
+                    logger.info(f"SPY candles from yfinance: {len(prices)} days")
+            except Exception as e:
+                logger.warning(f"yfinance SPY candles failed: {e}")
+
+        return prices
+
+    # The three lookups are independent; the clients pace their own requests
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        vix_future = executor.submit(_get_vix)
+        sp500_future = executor.submit(_get_sp500)
+        candles_future = executor.submit(_get_spy_candles)
+        vix = vix_future.result()
+        sp500_price = sp500_future.result()
+        prices = candles_future.result()
 
+    if vix is None:
+        raise DataFetchError("Failed to get VIX from both Finnhub and yfinance")
+    if sp500_price is None:
+        raise DataFetchError("Failed to get S&P 500 price from both Finnhub and yfinance")
     if not prices:
         raise DataFetchError("Failed to get SPY historical data from both Finnhub and yfinance")
 
     # Calculate metrics
-    sp500_sma20 = calculate_sma(prices, 20)
-    volatility_5d = calculate_volatility(prices, 5)
-    volatility_30d = calculate_volatility(prices, 30)
+    sp500_sma20, volatility_5d, volatility_30d = calculate_regime_features(prices)
+
+    # Latest daily return doubles as the paper trading benchmark
+    sp500_daily_pct = None
+    if len(prices) >= 2 and prices[-2]:
+        sp500_daily_pct = ((prices[-1] - prices[-2]) / prices[-2]) * 100
 
     logger.info(f"Market data: VIX={vix:.2f}, SP500={sp500_price:.2f}, SMA20={sp500_sma20:.2f}")
 
@@ -335,6 +505,7 @@ def fetch_market_regime_data(finnhub: FinnhubClient, yf_client: YFinanceClient)
         "sp500_sma20": sp500_sma20,
         "volatility_5d": volatility_5d,
         "volatility_30d": volatility_30d,
+        "sp500_daily_pct": sp500_daily_pct,
     }
 
 
@@ -343,13 +514,17 @@ def fetch_stock_data(
     yf_client: YFinanceClient,
     symbol: str,
     vix_level: float,
+    now: datetime | None = None,
 ) -> tuple[StockData, V2StockData] | None:
     """
     Fetch all data needed to score a stock for both V1 and V2 strategies.
 
     Uses Finnhub as primary source, yfinance as fallback.
     Returns None if data cannot be obtained from any source.
+    The candle window is measured back from now (defaults to current UTC time),
+    so a batch passes one as-of time for every symbol.
     """
+    now = now or datetime.now(timezone.utc)
     prices = []
     volumes = []
     open_price = 0.0
@@ -367,14 +542,14 @@ def fetch_stock_data(
         candles = finnhub.get_stock_candles(
             symbol,
             resolution="D",
-            from_timestamp=int((datetime.now(timezone.utc) - timedelta(days=250)).timestamp()),
+            from_timestamp=int((now - timedelta(days=250)).timestamp()),
         )
         prices = candles.get("close", [])
         volumes = candles.get("volume", [])
         if prices:
-            logger.debug(f"{symbol}: candles from Finnhub ({len(prices)} days)")
+            logger.debug("%s: candles from Finnhub (%d days)", symbol, len(prices))
     except Exception as e:
-        logger.debug(f"{symbol}: Finnhub candles failed: {e}")
+        logger.debug("%s: Finnhub candles failed: %s", symbol, e)
 
     # Fallback to yfinance
     if not prices:
@@ -383,12 +558,12 @@ def fetch_stock_data(
             if yf_candles and yf_candles.closes:
                 prices = yf_candles.closes
                 volumes = yf_candles.volumes
-                logger.debug(f"{symbol}: candles from yfinance ({len(prices)} days)")
+                logger.debug("%s: candles from yfinance (%d days)", symbol, len(prices))
         except Exception as e:
-            logger.debug(f"{symbol}: yfinance candles failed: {e}")
+            logger.debug("%s: yfinance candles failed: %s", symbol, e)
 
     if not prices:
-        logger.warning(f"{symbol}: No price data from either source, skipping")
+        logger.warning("%s: No price data from either source, skipping", symbol)
         return None
 
     # === Get quote ===
@@ -398,7 +573,7 @@ def fetch_stock_data(
         open_price = quote.open
         previous_close = quote.previous_close
     except Exception as e:
-        logger.debug(f"{symbol}: Finnhub quote failed: {e}")
+        logger.debug("%s: Finnhub quote failed: %s", symbol, e)
 
     # Fallback to yfinance
     if open_price == 0:
@@ -408,7 +583,7 @@ def fetch_stock_data(
                 open_price = yf_quote.open_price
                 previous_close = yf_quote.previous_close
         except Exception as e:
-            logger.debug(f"{symbol}: yfinance quote failed: {e}")
+            logger.debug("%s: yfinance quote failed: %s", symbol, e)
 
     # Use last close price as fallback for open
     if open_price == 0 and prices:
@@ -424,7 +599,7 @@ def fetch_stock_data(
         week_52_high = financials.week_52_high
         week_52_low = financials.week_52_low
     except Exception as e:
-        logger.debug(f"{symbol}: Finnhub financials failed: {e}")
+        logger.debug("%s: Finnhub financials failed: %s", symbol, e)
 
     # Fallback to yfinance
     if pe_ratio is None:
@@ -437,7 +612,7 @@ def fetch_stock_data(
                 week_52_high = yf_financials.get("week_52_high")
                 week_52_low = yf_financials.get("week_52_low")
         except Exception as e:
-            logger.debug(f"{symbol}: yfinance financials failed: {e}")
+            logger.debug("%s: yfinance financials failed: %s", symbol, e)
 
     # === Get news count (Finnhub only) ===
     try:
@@ -458,9 +633,9 @@ def fetch_stock_data(
         if surprises:
             # Use the most recent earnings surprise
             earnings_surprise_pct = surprises[0].surprise_pct
-            logger.debug(f"{symbol}: earnings surprise {earnings_surprise_pct:.1f}%")
+            logger.debug("%s: earnings surprise %.1f%%", symbol, earnings_surprise_pct)
     except Exception as e:
-        logger.debug(f"{symbol}: earnings surprise failed: {e}")
+        logger.debug("%s: earnings surprise failed: %s", symbol, e)
 
     # === Get analyst price target revision (V2 catalyst data) ===
     analyst_revision_score = None
@@ -471,9 +646,9 @@ def fetch_stock_data(
             # Calculate upside potential as revision score
             # Positive = analysts expect upside, Negative = downside
             analyst_revision_score = ((price_target.target_mean - current_price) / current_price) * 100
-            logger.debug(f"{symbol}: analyst target upside {analyst_revision_score:.1f}%")
+            logger.debug("%s: analyst target upside %.1f%%", symbol, analyst_revision_score)
     except Exception as e:
-        logger.debug(f"{symbol}: price target failed: {e}")
+        logger.debug("%s: price target failed: %s", symbol, e)
 
     # V1 Stock Data
     v1_data = StockData(
@@ -514,31 +689,45 @@ def fetch_stock_data(
     return v1_data, v2_data
 
 
-def filter_earnings(
+def fetch_earnings_symbols(
     finnhub: FinnhubClient,
-    symbols: list[str],
     within_days: int = 3,
-) -> list[str]:
-    """Filter out stocks with upcoming earnings."""
+    now: datetime | None = None,
+) -> list[str] | None:
+    """Fetch symbols with earnings within within_days of now (defaults to current UTC time).
+
+    Returns None if the calendar could not be fetched.
+    """
+    now = now or datetime.now(timezone.utc)
     try:
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        end_date = (datetime.now(timezone.utc) + timedelta(days=within_days)).strftime("%Y-%m-%d")
+        today = now.strftime("%Y-%m-%d")
+        end_date = (now + timedelta(days=within_days)).strftime("%Y-%m-%d")
 
         earnings = finnhub.get_earnings_calendar(from_date=today, to_date=end_date)
-        earnings_symbols = {e.symbol for e in earnings}
+        return sorted({e.symbol for e in earnings})
 
-        filtered = [s for s in symbols if s not in earnings_symbols]
-        removed = len(symbols) - len(filtered)
-
-        if removed > 0:
-            logger.info(f"Filtered out {removed} stocks with upcoming earnings")
+    except Exception as e:
+        logger.warning(f"Earnings calendar fetch failed: {e}")
+        return None
 
-        return filtered
 
-    except Exception as e:
-        logger.warning(f"Earnings filter failed: {e}, returning all symbols")
+def filter_earnings(symbols: list[str], earnings_symbols: list[str] | None) -> list[str]:
+    """Filter out stocks with upcoming earnings (all symbols kept if unknown)."""
+    if earnings_symbols is None:
+        logger.warning("Earnings filter unavailable, returning all symbols")
+        return symbols
+    if not earnings_symbols:
         return symbols
 
+    excluded = frozenset(earnings_symbols)
+    filtered = [s for s in symbols if s not in excluded]
+    removed = len(symbols) - len(filtered)
+
+    if removed > 0:
+        logger.info(f"Filtered out {removed} stocks with upcoming earnings")
+
+    return filtered
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -633,6 +822,10 @@ def main():
     """Main scoring pipeline."""
     args = parse_args()
 
+    # Move import-time objects (pandas, yfinance, supabase, LLM SDKs) into the
+    # permanent generation so full collections during the batch skip them
+    gc.freeze()
+
     # Track batch timing for monitoring
     batch_start_time = datetime.now(timezone.utc)
     batch_id = batch_start_time.strftime("%Y%m%d_%H%M%S")
@@ -682,7 +875,7 @@ def main():
         # 1. Determine market regime
         logger.info("Step 1: Determining market regime...")
         try:
-            regime_data = fetch_market_regime_data(finnhub, yf_client)
+            regime_data = fetch_market_regime_data(finnhub, yf_client, now=batch_start_time)
         except DataFetchError as e:
             logger.error(
                 "Cannot fetch market regime data - batch failed",
@@ -703,12 +896,13 @@ def main():
             volatility_5d_avg=regime_data["volatility_5d"],
             volatility_30d_avg=regime_data["volatility_30d"],
         )
+        regime = market_regime.regime.value
 
         logger.info(
             "Market regime determined",
             extra={
                 "event": "market_regime",
-                "regime": market_regime.regime.value,
+                "regime": regime,
                 "max_picks": market_regime.max_picks,
                 "vix_level": market_regime.vix_level,
                 "sp500_deviation_pct": market_regime.sp500_deviation_pct,
@@ -716,12 +910,12 @@ def main():
             }
         )
 
-        # Save market regime
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        # Save market regime (the batch start time is the as-of time for the whole run)
+        today = batch_start_time.strftime("%Y-%m-%d")
         supabase.save_market_regime(MarketRegimeRecord(
             check_date=today,
             vix_level=market_regime.vix_level,
-            market_regime=market_regime.regime.value,
+            market_regime=regime,
             sp500_sma20_deviation_pct=market_regime.sp500_deviation_pct,
             volatility_cluster_flag=market_regime.volatility_cluster,
             notes=market_regime.notes,
@@ -738,7 +932,7 @@ def main():
                 batch_date=today,
                 symbols=[],
                 pick_count=0,
-                market_regime=market_regime.regime.value,
+                market_regime=regime,
                 strategy_mode="conservative",
                 status="published",
             ))
@@ -746,7 +940,7 @@ def main():
                 batch_date=today,
                 symbols=[],
                 pick_count=0,
-                market_regime=market_regime.regime.value,
+                market_regime=regime,
                 strategy_mode="aggressive",
                 status="published",
             ))
@@ -781,99 +975,144 @@ def main():
             )
         except Exception as e:
             logger.warning(f"Symbol loading failed ({e}), falling back to defaults")
-            candidates = SP500_TOP_SYMBOLS.copy()
-
-        # Filter out stocks with upcoming earnings
-        candidates = filter_earnings(finnhub, candidates)
+            candidates = list(SP500_TOP_SYMBOLS)
+
+        # Initialize checkpoint
+        checkpoint: BatchCheckpoint | None = None
+        if args.resume:
+            checkpoint = load_checkpoint(today, now=batch_start_time)
+            if checkpoint:
+                logger.info(
+                    f"Resuming from checkpoint: {len(checkpoint.processed_symbols)} "
+                    f"symbols already processed (last updated: {checkpoint.last_updated})"
+                )
+            else:
+                logger.info("No checkpoint found, starting fresh")
+        else:
+            # A fresh run must not append to (or later resume from) the log
+            # of an earlier crashed run for the same date
+            clear_checkpoint(today)
+
+        # Create new checkpoint if needed
+        if checkpoint is None:
+            checkpoint = BatchCheckpoint(batch_date=today)
+
+        # Filter out stocks with upcoming earnings (calendar reused on resume)
+        if checkpoint.earnings_symbols is None:
+            checkpoint.earnings_symbols = fetch_earnings_symbols(finnhub, now=batch_start_time)
+            if checkpoint.earnings_symbols is not None:
+                save_checkpoint(checkpoint)
+        else:
+            logger.info("Using earnings calendar from checkpoint")
+        candidates = filter_earnings(candidates, checkpoint.earnings_symbols)
         logger.info(f"Candidates after filtering: {len(candidates)}")
 
-        # 3. Fetch stock data (with checkpoint support or async mode)
+        # 3. Fetch stock data (with checkpoint support in both modes)
         logger.info("Step 3: Fetching stock data...")
 
         v1_stocks_data = []
         v2_stocks_data = []
         failed_symbols = []
 
-        # Use async mode if requested (faster, no checkpoint support)
+        restored_count = 0
+
+        # First, restore data from checkpoint for already processed symbols
+        if args.resume and checkpoint.v1_stock_data:
+            checkpoint_failed = set(checkpoint.failed_symbols)
+            for symbol in checkpoint.processed_symbols:
+                if symbol in checkpoint.v1_stock_data and symbol in checkpoint.v2_stock_data:
+                    try:
+                        v1_data = dict_to_stock_data(checkpoint.v1_stock_data[symbol])
+                        v2_data = dict_to_v2_stock_data(
+                            checkpoint.v2_stock_data[symbol], checkpoint.v1_stock_data[symbol]
+                        )
+                        v1_stocks_data.append(v1_data)
+                        v2_stocks_data.append(v2_data)
+                        restored_count += 1
+                    except Exception as e:
+                        logger.warning(f"Failed to restore {symbol} from checkpoint: {e}")
+                elif symbol in checkpoint_failed:
+                    # Symbol was already marked as failed, skip it
+                    failed_symbols.append(symbol)
+
+            if restored_count > 0:
+                logger.info(f"Restored {restored_count} symbols from checkpoint")
+
+        # Skip already processed symbols (in resume mode)
+        pending = [s for s in candidates if not checkpoint.is_processed(s)]
+
+        # Use async mode if requested (faster, checkpoint saved once at the end)
         if args.use_async:
             logger.info(f"Using ASYNC mode with {args.async_concurrency} concurrent connections")
-            if args.resume:
-                logger.warning("--resume is ignored in async mode (checkpoint not supported)")
 
             try:
-                v1_stocks_data, v2_stocks_data, failed_symbols = fetch_stocks_async_mode(
-                    candidates=candidates,
+                async_v1, async_v2, async_failed = fetch_stocks_async_mode(
+                    candidates=pending,
                     vix_level=regime_data["vix"],
                     concurrency=args.async_concurrency,
                 )
             except Exception as e:
                 logger.error(f"Async fetch failed: {e}, falling back to sync mode")
                 args.use_async = False  # Fall through to sync mode
+            else:
+                v1_stocks_data.extend(async_v1)
+                v2_stocks_data.extend(async_v2)
+                failed_symbols.extend(async_failed)
+
+                # Record fetched payloads so a --resume re-run replays them
+                async_fetched = {v1.symbol: (v1, v2) for v1, v2 in zip(async_v1, async_v2)}
+                for symbol in pending:
+                    checkpoint.apply_record(checkpoint_record(symbol, async_fetched.get(symbol)))
+                save_checkpoint(checkpoint)
 
-        # Use sync mode (with checkpoint support)
+        # Use sync mode (checkpoint log appended every CHECKPOINT_EVERY symbols)
         if not args.use_async:
             logger.info("Using SYNC mode with checkpoint support")
 
-            # Initialize checkpoint
-            checkpoint: BatchCheckpoint | None = None
-            if args.resume:
-                checkpoint = load_checkpoint(today)
-                if checkpoint:
-                    logger.info(
-                        f"Resuming from checkpoint: {len(checkpoint.processed_symbols)} "
-                        f"symbols already processed (last updated: {checkpoint.last_updated})"
-                    )
-                else:
-                    logger.info("No checkpoint found, starting fresh")
-
-            # Create new checkpoint if needed
-            if checkpoint is None:
-                checkpoint = BatchCheckpoint(batch_date=today)
+            fetched: dict[str, tuple[StockData, V2StockData] | None] = {}
 
-            restored_count = 0
-
-            # First, restore data from checkpoint for already processed symbols
-            if args.resume and checkpoint.v1_stock_data:
-                for symbol in checkpoint.processed_symbols:
-                    if symbol in checkpoint.v1_stock_data and symbol in checkpoint.v2_stock_data:
+            # The Finnhub and yfinance clients pace requests behind their own
+            # locks, so workers only overlap network latency, not the quota
+            with ThreadPoolExecutor(max_workers=SYNC_FETCH_WORKERS) as executor:
+                futures = {
+                    executor.submit(
+                        fetch_stock_data, finnhub, yf_client, symbol, regime_data["vix"], batch_start_time
+                    ): symbol
+                    for symbol in pending
+                }
+                unlogged: list[dict] = []
+                try:
+                    for future in as_completed(futures):
+                        symbol = futures[future]
                         try:
-                            v1_data = dict_to_stock_data(checkpoint.v1_stock_data[symbol])
-                            v2_data = dict_to_v2_stock_data(checkpoint.v2_stock_data[symbol])
-                            v1_stocks_data.append(v1_data)
-                            v2_stocks_data.append(v2_data)
-                            restored_count += 1
+                            result = future.result()
                         except Exception as e:
-                            logger.warning(f"Failed to restore {symbol} from checkpoint: {e}")
-                    elif symbol in checkpoint.failed_symbols:
-                        # Symbol was already marked as failed, skip it
-                        failed_symbols.append(symbol)
-
-                if restored_count > 0:
-                    logger.info(f"Restored {restored_count} symbols from checkpoint")
-
-            for symbol in candidates:
-                # Skip already processed symbols (in resume mode)
-                if symbol in checkpoint.processed_symbols:
-                    continue
-
-                result = fetch_stock_data(finnhub, yf_client, symbol, regime_data["vix"])
+                            logger.warning(f"{symbol}: fetch failed: {e}")
+                            result = None
+                        fetched[symbol] = result
+
+                        record = checkpoint_record(symbol, result)
+                        checkpoint.apply_record(record)
+                        unlogged.append(record)
+                        if len(unlogged) >= CHECKPOINT_EVERY:
+                            append_checkpoint_records(today, unlogged)
+                            unlogged.clear()
+                finally:
+                    # Flush the tail (or whatever finished before an error)
+                    append_checkpoint_records(today, unlogged)
+
+            # Compact the log into one snapshot for any later --resume
+            save_checkpoint(checkpoint)
+
+            # Keep candidate order so scoring is independent of completion order
+            for symbol in pending:
+                result = fetched.get(symbol)
                 if result:
                     v1_data, v2_data = result
                     v1_stocks_data.append(v1_data)
                     v2_stocks_data.append(v2_data)
-                    # Store in checkpoint
-                    checkpoint.v1_stock_data[symbol] = stock_data_to_dict(v1_data)
-                    checkpoint.v2_stock_data[symbol] = v2_stock_data_to_dict(v2_data)
                 else:
                     failed_symbols.append(symbol)
-                    checkpoint.failed_symbols.append(symbol)
-
-                # Update checkpoint after each symbol
-                checkpoint.processed_symbols.append(symbol)
-                save_checkpoint(checkpoint)
-
-                # Small delay to avoid rate limiting
-                time.sleep(0.5)
 
         logger.info(f"Successfully fetched data for {len(v1_stocks_data)} stocks")
         if failed_symbols:
@@ -927,7 +1166,7 @@ def main():
             v2_stocks_data=v2_stocks_data,
             v1_threshold=v1_threshold,
             v2_threshold=v2_threshold,
-            market_regime_str=market_regime.regime.value,
+            market_regime_str=regime,
             market_config=US_MARKET,
             today=today,
             max_picks=market_regime.max_picks,
@@ -945,7 +1184,7 @@ def main():
         save_errors = save_scoring_results(
             supabase=supabase,
             batch_date=today,
-            market_regime_str=market_regime.regime.value,
+            market_regime_str=regime,
             dual_result=dual_result,
             v1_stocks_data=v1_stocks_data,
             v1_final_picks=v1_final_picks,
@@ -960,20 +1199,12 @@ def main():
         # 7. PAPER TRADING: Open positions and update snapshots
         logger.info("Step 7: Opening positions for paper trading...")
 
-        # Get S&P 500 daily return for benchmark
-        sp500_daily_pct = None
-        try:
-            sp500_candles = finnhub.get_stock_candles(
-                "SPY",
-                resolution="D",
-                from_timestamp=int((datetime.now(timezone.utc) - timedelta(days=2)).timestamp()),
-            )
-            if sp500_candles and len(sp500_candles.get("close", [])) >= 2:
-                closes = sp500_candles["close"]
-                sp500_daily_pct = ((closes[-1] - closes[-2]) / closes[-2]) * 100
-                logger.info(f"S&P 500 daily return: {sp500_daily_pct:.2f}%")
-        except Exception as e:
-            logger.warning(f"Failed to get S&P 500 daily return: {e}")
+        # S&P 500 daily return for benchmark (from the Step 1 SPY candles)
+        sp500_daily_pct = regime_data["sp500_daily_pct"]
+        if sp500_daily_pct is not None:
+            logger.info(f"S&P 500 daily return: {sp500_daily_pct:.2f}%")
+        else:
+            logger.warning("Failed to get S&P 500 daily return: not enough SPY candles")
 
         open_positions_and_snapshot(
             portfolio=portfolio,
@@ -993,7 +1224,7 @@ def main():
         batch_ctx.metadata = {
             "v1_picks": v1_final_picks,
             "v2_picks": v2_final_picks,
-            "market_regime": market_regime.regime.value,
+            "market_regime": regime,
             "llm_judgment_enabled": True,
         }
 
@@ -1038,7 +1269,7 @@ def main():
                 "successful_data_fetches": len(v1_stocks_data),
                 "failed_data_fetches": len(failed_symbols),
                 "llm_judgment_enabled": True,
-                "market_regime": market_regime.regime.value,
+                "market_regime": regime,
             }
         )
 
@@ -1046,6 +1277,8 @@ def main():
         logger.error(f"Batch failed: {e}")
         BatchLogger.finish(batch_ctx, error=str(e))
         raise
+    finally:
+        finnhub.close()
 
 
 if __name__ == "__main__":
@@ -12,11 +12,11 @@ Morning batch job for Japanese stocks:
 Note: Japanese market hours are 9:00-15:00 JST
 This script should run after market close (15:30 JST = 06:30 UTC)
 """
-import logging
-import os
+import gc
 import sys
 import time
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
 
 # Add src to path
@@ -25,25 +25,22 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.config import config
 from src.data.yfinance_client import get_yfinance_client, YFinanceClient
 from src.data.supabase_client import SupabaseClient, MarketRegimeRecord, DailyPick
-from src.scoring.market_regime import decide_market_regime, calculate_sma, calculate_volatility
+from src.scoring.market_regime import decide_market_regime, calculate_regime_features
 from src.scoring.agents import StockData
 from src.scoring.agents_v2 import V2StockData
 from src.scoring.composite_v2 import run_dual_scoring
 from src.portfolio import PortfolioManager
-from src.judgment import (
-    JudgmentService,
-    run_judgment_for_candidates,
-    filter_picks_by_judgment,
-    select_final_picks,
-)
-from src.scoring.composite_v2 import get_threshold_passed_symbols
 from src.batch_logger import BatchLogger, BatchType
-from src.symbols.jp_stocks import JP_STOCK_SYMBOLS, get_jp_stock_name
+from src.symbols.jp_stocks import JP_STOCK_SYMBOLS
 from src.monitoring import BatchMetrics, record_batch_metrics, check_and_alert, send_alert, AlertLevel
 from src.pipeline import JP_MARKET, load_dynamic_thresholds, load_factor_weights, run_llm_judgment_phase, open_positions_and_snapshot
 from src.logging_config import setup_logging, get_logger
 
 
+# Worker threads for stock data fetching
+FETCH_WORKERS = 4
+
+
 class DataFetchError(Exception):
     """Raised when data cannot be fetched."""
     pass
@@ -84,9 +81,12 @@ def fetch_market_regime_data_jp(yf_client: YFinanceClient) -> dict:
     prices = hist["Close"].tolist()
 
     # Calculate metrics (same as US version)
-    nikkei_sma20 = calculate_sma(prices, 20)
-    volatility_5d = calculate_volatility(prices, 5)
-    volatility_30d = calculate_volatility(prices, 30)
+    nikkei_sma20, volatility_5d, volatility_30d = calculate_regime_features(prices)
+
+    # Latest daily return doubles as the paper trading benchmark
+    nikkei_daily_pct = None
+    if prices[-2]:
+        nikkei_daily_pct = ((prices[-1] - prices[-2]) / prices[-2]) * 100
 
     logger.info(f"Market data: VIX={vix:.2f}, Nikkei={nikkei_price:.2f}, SMA20={nikkei_sma20:.2f}")
 
@@ -96,6 +96,7 @@ def fetch_market_regime_data_jp(yf_client: YFinanceClient) -> dict:
         "benchmark_sma20": nikkei_sma20,
         "volatility_5d": volatility_5d,
         "volatility_30d": volatility_30d,
+        "benchmark_daily_pct": nikkei_daily_pct,
     }
 
 
@@ -180,7 +181,7 @@ def fetch_stock_data_jp(
             dividend_yield = full_info.get("dividendYield")
             market_cap = full_info.get("marketCap")
         except Exception as e:
-            logger.debug(f"{symbol}: Failed to get basic info: {e}")
+            logger.debug("%s: Failed to get basic info: %s", symbol, e)
             pe_ratio = None
             pb_ratio = None
             dividend_yield = None
@@ -244,8 +245,12 @@ def fetch_stock_data_jp(
 
 def main():
     """Main entry point for Japan stock scoring."""
+    # Move import-time objects (pandas, yfinance, supabase, LLM SDKs) into the
+    # permanent generation so full collections during the batch skip them
+    gc.freeze()
+
     # Track batch timing for monitoring
-    batch_start_time = datetime.utcnow()
+    batch_start_time = datetime.now(timezone.utc)
     batch_id = f"jp_{batch_start_time.strftime('%Y%m%d_%H%M%S')}"
 
     # Initialize judgment tracking variables
@@ -263,7 +268,7 @@ def main():
     batch_ctx.analysis_model = config.llm.analysis_model
 
     try:
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        today = batch_start_time.strftime("%Y-%m-%d")
 
         # Initialize clients
         yf_client = get_yfinance_client()
@@ -334,22 +339,37 @@ def main():
 
         batch_ctx.total_items = len(JP_STOCK_SYMBOLS)
 
-        for i, symbol in enumerate(JP_STOCK_SYMBOLS):
-            logger.info(f"Fetching {symbol} ({i+1}/{len(JP_STOCK_SYMBOLS)})")
-
-            stock_data, v2_data = fetch_stock_data_jp(yf_client, symbol)
-
+        fetched: dict[str, tuple[StockData | None, V2StockData | None]] = {}
+
+        # fetch_stock_data_jp calls yfinance directly, so submissions are
+        # staggered by rate_limit_sleep to keep the request start rate while
+        # the workers overlap network latency
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            futures = {}
+            for i, symbol in enumerate(JP_STOCK_SYMBOLS):
+                if i:
+                    time.sleep(JP_MARKET.rate_limit_sleep)
+                logger.info(f"Fetching {symbol} ({i+1}/{len(JP_STOCK_SYMBOLS)})")
+                futures[executor.submit(fetch_stock_data_jp, yf_client, symbol)] = symbol
+
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    fetched[symbol] = future.result()
+                except Exception as e:
+                    logger.warning(f"{symbol}: fetch failed: {e}")
+                    fetched[symbol] = (None, None)
+                batch_ctx.processed_items = len(fetched)
+
+        # Keep symbol order so scoring is independent of completion order
+        for symbol in JP_STOCK_SYMBOLS:
+            stock_data, v2_data = fetched[symbol]
             if stock_data is not None and v2_data is not None:
                 v1_stocks_data.append(stock_data)
                 v2_stocks_data.append(v2_data)
             else:
                 failed_symbols.append(symbol)
 
-            batch_ctx.processed_items = i + 1
-
-            # Rate limiting
-            time.sleep(JP_MARKET.rate_limit_sleep)
-
         logger.info(f"Successfully fetched data for {len(v1_stocks_data)} stocks")
         if failed_symbols:
             logger.warning(f"Failed to fetch {len(failed_symbols)} stocks")
@@ -433,18 +453,10 @@ def main():
         # Step 6: Paper Trading - Open positions and update snapshots
         logger.info("Step 6: Opening positions for paper trading...")
 
-        # Get Nikkei 225 daily return for benchmark
-        nikkei_daily_pct = None
-        try:
-            import yfinance as yf
-            nikkei = yf.Ticker("^N225")
-            nikkei_hist = nikkei.history(period="5d")
-            if len(nikkei_hist) >= 2:
-                closes = nikkei_hist["Close"].tolist()
-                nikkei_daily_pct = ((closes[-1] - closes[-2]) / closes[-2]) * 100
-                logger.info(f"Nikkei 225 daily return: {nikkei_daily_pct:.2f}%")
-        except Exception as e:
-            logger.warning(f"Failed to get Nikkei 225 daily return: {e}")
+        # Nikkei 225 daily return for benchmark (from the Step 1 history)
+        nikkei_daily_pct = regime_data["benchmark_daily_pct"]
+        if nikkei_daily_pct is not None:
+            logger.info(f"Nikkei 225 daily return: {nikkei_daily_pct:.2f}%")
 
         open_positions_and_snapshot(
             portfolio=portfolio,
@@ -473,7 +485,7 @@ def main():
         BatchLogger.finish(batch_ctx)
 
         # Record batch metrics for monitoring
-        batch_end_time = datetime.utcnow()
+        batch_end_time = datetime.now(timezone.utc)
         batch_metrics = BatchMetrics(
             batch_id=batch_id,
             start_time=batch_start_time,
@@ -40,7 +40,7 @@ def get_strategy_modes(market: str) -> list[str]:
 
 def count_records(supabase: SupabaseClient, table: str, strategy_modes: list[str]) -> int:
     """Count records in a table for the given strategy modes."""
-    result = supabase._client.table(table).select("id", count="exact").in_(
+    result = supabase._client.table(table).select("id", count="exact", head=True).in_(
         "strategy_mode", strategy_modes
     ).execute()
     return result.count or 0
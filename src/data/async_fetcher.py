@@ -111,7 +111,7 @@ class AsyncDataFetcher:
                 oldest = min(self._request_times)
                 wait_time = 60 - (now - oldest) + 0.1  # Add small buffer
                 if wait_time > 0:
-                    logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
+                    logger.debug("Rate limit reached, waiting %.2fs", wait_time)
                     await asyncio.sleep(wait_time)
 
             self._request_times.append(time.time())
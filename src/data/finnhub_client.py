@@ -8,6 +8,7 @@ Provides access to market data:
 - Earnings calendar
 - Market indices (VIX, S&P 500)
 """
+import logging
 import threading
 import time
 from dataclasses import dataclass
@@ -19,9 +20,47 @@ import finnhub
 
 from src.config import config
 
-# Thread-safe rate limiter state
-_rate_limit_lock = threading.Lock()
-_last_call_time = 0.0
+logger = logging.getLogger(__name__)
+
+# Calls allowed back-to-back before the sustained rate applies. Kept small:
+# Finnhub counts calls per minute, and the 429 backoff covers any overshoot.
+RATE_LIMIT_BURST = 5
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at rate_per_sec up to burst; acquire() takes
+    one token, sleeping only when the bucket is empty.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int):
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, waiting until one is available."""
+        # Holding the lock while sleeping queues waiters in arrival order
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last_refill) * self.rate_per_sec
+            )
+            self._last_refill = now
+
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) / self.rate_per_sec)
+                self._tokens = 1.0
+                self._last_refill = time.monotonic()
+
+            self._tokens -= 1
+
+
+# Shared across all decorated methods (and clients) with the same quota
+_rate_limiters: dict[int, TokenBucket] = {}
 
 
 def rate_limit_aware(calls_per_minute: int = 60, base_sleep: float = 1.0):
@@ -29,20 +68,17 @@ def rate_limit_aware(calls_per_minute: int = 60, base_sleep: float = 1.0):
     Decorator for handling Finnhub API rate limits.
 
     Finnhub free tier: 60 calls/minute.
-    Thread-safe implementation using Lock.
+    Calls draw from a shared token bucket, so parallel workers are paced
+    together and short bursts go through without waiting.
     """
-    min_interval = 60.0 / calls_per_minute
+    bucket = _rate_limiters.setdefault(
+        calls_per_minute, TokenBucket(calls_per_minute / 60.0, RATE_LIMIT_BURST)
+    )
 
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            global _last_call_time
-
-            with _rate_limit_lock:
-                elapsed = time.time() - _last_call_time
-                if elapsed < min_interval:
-                    time.sleep(min_interval - elapsed)
-                _last_call_time = time.time()
+            bucket.acquire()
 
             for attempt in range(3):
                 try:
@@ -151,6 +187,12 @@ class FinnhubClient:
             raise ValueError("FINNHUB_API_KEY is not set in environment variables")
 
         self._client = finnhub.Client(api_key=api_key)
+        # Set once Finnhub denies candle access (premium-only on the free tier)
+        self._candles_forbidden = False
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._client.close()
 
     @rate_limit_aware(calls_per_minute=60)
     def get_quote(self, symbol: str) -> StockQuote:
@@ -311,7 +353,6 @@ class FinnhubClient:
         """
         return self._client.market_status(exchange="US")
 
-    @rate_limit_aware(calls_per_minute=60)
     def get_stock_candles(
         self,
         symbol: str,
@@ -322,6 +363,10 @@ class FinnhubClient:
         """
         Get historical OHLCV data.
 
+        Once Finnhub answers 403 for candles, later calls return empty arrays
+        without a request, so callers go straight to their fallback instead
+        of spending rate-limit budget on a denied endpoint.
+
         Args:
             symbol: Stock ticker symbol
             resolution: Candle resolution (1, 5, 15, 30, 60, D, W, M)
@@ -331,6 +376,26 @@ class FinnhubClient:
         Returns:
             Dict with OHLCV arrays
         """
+        if self._candles_forbidden:
+            return {"open": [], "high": [], "low": [], "close": [], "volume": [], "timestamp": []}
+
+        try:
+            return self._get_stock_candles(symbol, resolution, from_timestamp, to_timestamp)
+        except finnhub.FinnhubAPIException as e:
+            if e.status_code == 403:
+                logger.warning(f"Finnhub candles not available on this plan, skipping further requests: {e}")
+                self._candles_forbidden = True
+            raise
+
+    @rate_limit_aware(calls_per_minute=60)
+    def _get_stock_candles(
+        self,
+        symbol: str,
+        resolution: str,
+        from_timestamp: int | None,
+        to_timestamp: int | None,
+    ) -> dict[str, list]:
+        """Fetch historical OHLCV data from Finnhub."""
         if to_timestamp is None:
             to_timestamp = int(datetime.now().timestamp())
         if from_timestamp is None:
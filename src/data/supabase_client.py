@@ -7,7 +7,9 @@ Handles all database operations:
 - Market regime history
 - Performance tracking
 """
+import copy
 import logging
+import time
 from dataclasses import asdict, dataclass
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
@@ -19,8 +21,37 @@ logger = logging.getLogger(__name__)
 from src.config import config
 from src.scoring.market_regime import MarketRegime
 
+# Scoring config and market regime rows change at most a few times a day,
+# but are read by several pipeline stages in one run.
+CONFIG_CACHE_TTL_SECONDS = 3600
 
-@dataclass
+# PostgREST caps every select at max-rows (1000 on Supabase) and drops the
+# rest silently, so multi-date reads are paged at that size.
+QUERY_PAGE_SIZE = 1000
+
+
+def fetch_all_pages(build_query, page_size: int = QUERY_PAGE_SIZE) -> list[dict[str, Any]]:
+    """Run a select page by page until a short page comes back.
+
+    Args:
+        build_query: Callable returning a fresh, filtered select builder with
+            a stable .order() (e.g. by primary key) so pages do not overlap
+        page_size: Rows per request; must not exceed the server row cap
+
+    Returns:
+        All rows across pages
+    """
+    rows: list[dict[str, Any]] = []
+    start = 0
+    while True:
+        page = build_query().range(start, start + page_size - 1).execute().data or []
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows
+        start += page_size
+
+
+@dataclass(slots=True)
 class DailyPick:
     """Daily stock pick record."""
     batch_date: str
@@ -32,7 +63,7 @@ class DailyPick:
     market_type: str | None = None  # 'us' or 'jp' (None for legacy US records)
 
 
-@dataclass
+@dataclass(slots=True)
 class StockScore:
     """Stock scoring record."""
     batch_date: str
@@ -57,7 +88,7 @@ class StockScore:
     market_type: str | None = None  # 'us' or 'jp' (None for legacy US records)
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketRegimeRecord:
     """Market regime history record."""
     check_date: str
@@ -81,6 +112,10 @@ class SupabaseClient:
 
         self._client: Client = create_client(url, key)
 
+        # strategy_mode / check_date -> (expires_at, row)
+        self._scoring_config_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._market_regime_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
     # ============ Daily Picks ============
 
     def save_daily_picks(self, picks: DailyPick) -> dict[str, Any]:
@@ -93,6 +128,16 @@ class SupabaseClient:
         Returns:
             Inserted record
         """
+        result = self._client.table("daily_picks").upsert(
+            self._daily_pick_record(picks),
+            on_conflict="batch_date,strategy_mode",
+        ).execute()
+
+        return result.data[0] if result.data else {}
+
+    @staticmethod
+    def _daily_pick_record(picks: DailyPick) -> dict[str, Any]:
+        """Build the daily_picks row for a DailyPick."""
         data = {
             "batch_date": picks.batch_date,
             "symbols": picks.symbols,
@@ -103,13 +148,7 @@ class SupabaseClient:
         }
         if picks.market_type:
             data["market_type"] = picks.market_type
-
-        result = self._client.table("daily_picks").upsert(
-            data,
-            on_conflict="batch_date,strategy_mode",
-        ).execute()
-
-        return result.data[0] if result.data else {}
+        return data
 
     def get_daily_picks(self, batch_date: str) -> dict[str, Any] | None:
         """
@@ -179,7 +218,8 @@ class SupabaseClient:
 
         This method provides atomic-like behavior by:
         1. Optionally deleting existing records for the same date/strategy combinations
-        2. Inserting all new picks via upsert
+        2. Inserting all new picks via one upsert, falling back to per-pick
+           saves if it fails so each strategy's error is reported separately
 
         Args:
             picks_list: List of DailyPick records to save
@@ -214,7 +254,16 @@ class SupabaseClient:
                 errors.append(f"Failed to delete existing picks: {str(e)}")
                 # Continue with upsert anyway - it will overwrite
 
-        # Step 2: Save all picks
+        # Step 2: Save all picks in one round trip
+        try:
+            result = self._client.table("daily_picks").upsert(
+                [self._daily_pick_record(pick) for pick in picks_list],
+                on_conflict="batch_date,strategy_mode",
+            ).execute()
+            return result.data or [], errors
+        except Exception as e:
+            logger.warning(f"Bulk daily picks save failed, retrying per pick: {e}")
+
         for pick in picks_list:
             try:
                 result = self.save_daily_picks(pick)
@@ -229,15 +278,20 @@ class SupabaseClient:
 
     # ============ Stock Scores ============
 
-    def save_stock_scores(self, scores: list[StockScore]) -> list[dict[str, Any]]:
+    def save_stock_scores(
+        self,
+        scores: list[StockScore],
+        returning: str = "representation",
+    ) -> list[dict[str, Any]]:
         """
         Save stock scores to database.
 
         Args:
             scores: List of StockScore records
+            returning: "minimal" to skip sending the upserted rows back
 
         Returns:
-            Inserted records
+            Inserted records (empty list with returning="minimal")
         """
         data = []
         for s in scores:
@@ -269,6 +323,7 @@ class SupabaseClient:
         result = self._client.table("stock_scores").upsert(
             data,
             on_conflict="batch_date,symbol,strategy_mode",
+            returning=returning,
         ).execute()
 
         return result.data or []
@@ -323,6 +378,7 @@ class SupabaseClient:
             data,
             on_conflict="check_date",
         ).execute()
+        self._market_regime_cache.pop(record.check_date, None)
 
         return result.data[0] if result.data else {}
 
@@ -336,11 +392,20 @@ class SupabaseClient:
         Returns:
             Market regime record or None
         """
+        cached = self._market_regime_cache.get(check_date)
+        if cached and cached[0] > time.monotonic():
+            return copy.deepcopy(cached[1])
+
         result = self._client.table("market_regime_history").select("*").eq(
             "check_date", check_date
         ).execute()
 
-        return result.data[0] if result.data else None
+        if not result.data:
+            return None
+        self._market_regime_cache[check_date] = (
+            time.monotonic() + CONFIG_CACHE_TTL_SECONDS, copy.deepcopy(result.data[0])
+        )
+        return result.data[0]
 
     # ============ Performance Tracking ============
 
@@ -455,6 +520,7 @@ class SupabaseClient:
         price_1d: float | None = None,
         price_5d: float | None = None,
         was_picked: bool = False,
+        returning: str = "representation",
     ) -> dict[str, Any]:
         """
         Update return data for a scored stock.
@@ -468,27 +534,22 @@ class SupabaseClient:
             price_1d: Price at 1-day review
             price_5d: Price at 5-day review
             was_picked: Whether this was a picked stock
+            returning: "minimal" to skip sending the updated row back
 
         Returns:
-            Updated record
-        """
-        update_data: dict[str, Any] = {
-            "reviewed_at": datetime.now(timezone.utc).isoformat(),
-        }
-
-        if return_1d is not None:
-            update_data["return_1d"] = round(return_1d, 4)
-        if return_5d is not None:
-            update_data["return_5d"] = round(return_5d, 4)
-        if price_1d is not None:
-            update_data["price_1d"] = round(price_1d, 4)
-        if price_5d is not None:
-            update_data["price_5d"] = round(price_5d, 4)
-        if was_picked:
-            update_data["was_picked"] = was_picked
+            Updated record (empty dict with returning="minimal")
+        """
+        update_data = self._stock_return_fields(
+            return_1d=return_1d,
+            return_5d=return_5d,
+            price_1d=price_1d,
+            price_5d=price_5d,
+            was_picked=was_picked,
+        )
 
         result = self._client.table("stock_scores").update(
-            update_data
+            update_data,
+            returning=returning,
         ).eq(
             "batch_date", batch_date
         ).eq(
@@ -499,32 +560,104 @@ class SupabaseClient:
 
         return result.data[0] if result.data else {}
 
+    @staticmethod
+    def _stock_return_fields(
+        return_1d: float | None = None,
+        return_5d: float | None = None,
+        price_1d: float | None = None,
+        price_5d: float | None = None,
+        was_picked: bool = False,
+    ) -> dict[str, Any]:
+        """Build the stock_scores columns written by a return review."""
+        fields: dict[str, Any] = {
+            "reviewed_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+        if return_1d is not None:
+            fields["return_1d"] = round(return_1d, 4)
+        if return_5d is not None:
+            fields["return_5d"] = round(return_5d, 4)
+        if price_1d is not None:
+            fields["price_1d"] = round(price_1d, 4)
+        if price_5d is not None:
+            fields["price_5d"] = round(price_5d, 4)
+        if was_picked:
+            fields["was_picked"] = was_picked
+
+        return fields
+
     def bulk_update_returns(
         self,
         updates: list[dict[str, Any]],
+        chunk_size: int = 500,
     ) -> int:
         """
         Bulk update returns for multiple stocks.
 
+        Rows are upserted on (batch_date, symbol, strategy_mode) in chunked
+        requests. Rows are grouped by the columns they set, because a bulk
+        upsert writes every column in the payload and would null out fields
+        a row leaves unset. A chunk that fails is retried row by row.
+
         Args:
             updates: List of dicts with batch_date, symbol, strategy_mode, and return data
+            chunk_size: Rows per upsert request
 
         Returns:
             Number of records updated
         """
-        updated = 0
+        rows_by_columns: dict[tuple[str, ...], list[dict[str, Any]]] = {}
         for u in updates:
-            self.update_stock_returns(
-                batch_date=u["batch_date"],
-                symbol=u["symbol"],
-                strategy_mode=u["strategy_mode"],
-                return_1d=u.get("return_1d"),
-                return_5d=u.get("return_5d"),
-                price_1d=u.get("price_1d"),
-                price_5d=u.get("price_5d"),
-                was_picked=u.get("was_picked", False),
-            )
-            updated += 1
+            row = {
+                "batch_date": u["batch_date"],
+                "symbol": u["symbol"],
+                "strategy_mode": u["strategy_mode"],
+                **self._stock_return_fields(
+                    return_1d=u.get("return_1d"),
+                    return_5d=u.get("return_5d"),
+                    price_1d=u.get("price_1d"),
+                    price_5d=u.get("price_5d"),
+                    was_picked=u.get("was_picked", False),
+                ),
+            }
+            rows_by_columns.setdefault(tuple(sorted(row)), []).append(row)
+
+        updated = 0
+        for rows in rows_by_columns.values():
+            for i in range(0, len(rows), chunk_size):
+                chunk = rows[i:i + chunk_size]
+                try:
+                    self._client.table("stock_scores").upsert(
+                        chunk,
+                        on_conflict="batch_date,symbol,strategy_mode",
+                        returning="minimal",
+                    ).execute()
+                    updated += len(chunk)
+                except Exception as e:
+                    logger.warning(
+                        f"Bulk return upsert failed ({len(chunk)} rows), "
+                        f"falling back to single rows: {e}"
+                    )
+                    for row in chunk:
+                        fields = {
+                            k: v for k, v in row.items()
+                            if k not in ("batch_date", "symbol", "strategy_mode")
+                        }
+                        try:
+                            self._client.table("stock_scores").update(
+                                fields,
+                                returning="minimal",
+                            ).eq(
+                                "batch_date", row["batch_date"]
+                            ).eq(
+                                "symbol", row["symbol"]
+                            ).eq(
+                                "strategy_mode", row["strategy_mode"]
+                            ).execute()
+                            updated += 1
+                        except Exception as row_error:
+                            logger.warning(f"Failed to update returns for {row['symbol']}: {row_error}")
+
         return updated
 
     def get_missed_opportunities(
@@ -638,15 +771,67 @@ class SupabaseClient:
         Returns:
             Config dict with threshold and limits, or empty dict if not found
         """
+        cached = self._scoring_config_cache.get(strategy_mode)
+        if cached and cached[0] > time.monotonic():
+            # Callers may mutate the row (e.g. factor_weights), so each gets a copy
+            return copy.deepcopy(cached[1])
+
         try:
             result = self._client.table("scoring_config").select("*").eq(
                 "strategy_mode", strategy_mode
             ).single().execute()
+            if result.data:
+                self._cache_scoring_config(strategy_mode, result.data)
             return result.data or {}
         except Exception as e:
             logger.debug(f"No scoring_config for {strategy_mode}: {e}")
             return {}
 
+    def get_scoring_configs_bulk(
+        self,
+        strategies: list[str],
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get scoring configurations for several strategies in one query.
+
+        Args:
+            strategies: Strategy modes to fetch
+
+        Returns:
+            Dict mapping strategy_mode to its config dict. Strategies without
+            a row are absent; empty dict if the query fails.
+        """
+        try:
+            result = self._client.table("scoring_config").select("*").in_(
+                "strategy_mode", strategies
+            ).execute()
+            for row in result.data or []:
+                self._cache_scoring_config(row["strategy_mode"], row)
+            return {row["strategy_mode"]: row for row in result.data or []}
+        except Exception as e:
+            logger.warning(f"Failed to fetch scoring_config for {strategies}: {e}")
+            return {}
+
+    def _cache_scoring_config(self, strategy_mode: str, row: dict[str, Any]) -> None:
+        """Remember a copy of a scoring_config row for CONFIG_CACHE_TTL_SECONDS."""
+        self._scoring_config_cache[strategy_mode] = (
+            time.monotonic() + CONFIG_CACHE_TTL_SECONDS, copy.deepcopy(row)
+        )
+
+    def invalidate_scoring_config(self, strategy_mode: str | None = None) -> None:
+        """
+        Drop cached scoring_config rows.
+
+        Call after writing scoring_config outside update_threshold.
+
+        Args:
+            strategy_mode: Strategy to drop, or None to clear all
+        """
+        if strategy_mode is None:
+            self._scoring_config_cache.clear()
+        else:
+            self._scoring_config_cache.pop(strategy_mode, None)
+
     def get_all_scoring_configs(self) -> list[dict[str, Any]]:
         """
         Get all scoring configurations.
@@ -682,6 +867,7 @@ class SupabaseClient:
         }).eq(
             "strategy_mode", strategy_mode
         ).execute()
+        self.invalidate_scoring_config(strategy_mode)
 
         return result.data[0] if result.data else {}
 
@@ -1049,6 +1235,58 @@ class SupabaseClient:
             if row.get("composite_score") is not None
         } if result.data else {}
 
+    def get_scores_for_dates(
+        self,
+        batch_dates: list[str],
+        strategy_modes: list[str],
+        columns: str = "batch_date, symbol, strategy_mode, composite_score, price_at_time",
+    ) -> list[dict[str, Any]]:
+        """
+        Get stock scores for several dates and strategy modes.
+
+        Rows are read in id order, QUERY_PAGE_SIZE at a time, so a sweep over
+        several dates is not truncated at the PostgREST row cap.
+
+        Args:
+            batch_dates: Date strings in YYYY-MM-DD format
+            strategy_modes: Strategy modes to include
+            columns: Columns to select
+
+        Returns:
+            List of stock score rows
+        """
+        return fetch_all_pages(
+            lambda: self._client.table("stock_scores")
+            .select(columns)
+            .in_("batch_date", batch_dates)
+            .in_("strategy_mode", strategy_modes)
+            .order("id")
+        )
+
+    def get_picks_for_dates(
+        self,
+        batch_dates: list[str],
+        strategy_modes: list[str],
+    ) -> list[dict[str, Any]]:
+        """
+        Get daily picks for several dates and strategy modes in one query.
+
+        Args:
+            batch_dates: Date strings in YYYY-MM-DD format
+            strategy_modes: Strategy modes to include
+
+        Returns:
+            List of rows with batch_date, strategy_mode and symbols
+        """
+        result = (
+            self._client.table("daily_picks")
+            .select("batch_date, strategy_mode, symbols")
+            .in_("batch_date", batch_dates)
+            .in_("strategy_mode", strategy_modes)
+            .execute()
+        )
+        return result.data or []
+
     def get_latest_portfolio_snapshot(
         self,
         strategy_mode: str,
@@ -1234,6 +1472,8 @@ class SupabaseClient:
         min_confidence: float | None = None,
         is_primary: bool | None = None,
         limit: int = 100,
+        batch_dates: list[str] | None = None,
+        columns: str = "*",
     ) -> list[dict[str, Any]]:
         """
         Get judgment records with optional filters.
@@ -1246,14 +1486,18 @@ class SupabaseClient:
             min_confidence: Optional minimum confidence filter
             is_primary: Optional filter for primary (True) or shadow (False) models
             limit: Maximum records to return
+            batch_dates: Optional filter for any of several dates
+            columns: Columns to select (defaults to all)
 
         Returns:
             List of judgment records
         """
-        query = self._client.table("judgment_records").select("*")
+        query = self._client.table("judgment_records").select(columns)
 
         if batch_date:
             query = query.eq("batch_date", batch_date)
+        if batch_dates:
+            query = query.in_("batch_date", batch_dates)
         if symbol:
             query = query.eq("symbol", symbol)
         if strategy_mode:
@@ -1326,6 +1570,88 @@ class SupabaseClient:
         Returns:
             Inserted/updated record
         """
+        record = self._judgment_outcome_record(
+            judgment_id=judgment_id,
+            outcome_date=outcome_date,
+            actual_return_1d=actual_return_1d,
+            actual_return_5d=actual_return_5d,
+            actual_return_10d=actual_return_10d,
+            outcome_aligned=outcome_aligned,
+            key_factors_validated=key_factors_validated,
+            missed_factors=missed_factors,
+        )
+
+        result = self._client.table("judgment_outcomes").upsert(
+            record,
+            on_conflict="judgment_id,outcome_date",
+        ).execute()
+
+        return result.data[0] if result.data else {}
+
+    def save_judgment_outcomes_batch(
+        self,
+        outcomes: list[dict[str, Any]],
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Upsert many judgment outcomes in chunked requests.
+
+        A chunk that fails is retried row by row so one bad record does not
+        drop the rest of the chunk.
+
+        Args:
+            outcomes: Dicts of save_judgment_outcome keyword arguments. All
+                rows should set the same fields (PostgREST bulk upsert).
+            chunk_size: Rows per upsert request
+
+        Returns:
+            Number of outcomes saved
+        """
+        records = [self._judgment_outcome_record(**o) for o in outcomes]
+        saved = 0
+
+        for i in range(0, len(records), chunk_size):
+            chunk = records[i:i + chunk_size]
+            try:
+                self._client.table("judgment_outcomes").upsert(
+                    chunk,
+                    on_conflict="judgment_id,outcome_date",
+                    returning="minimal",
+                ).execute()
+                saved += len(chunk)
+            except Exception as e:
+                logger.warning(
+                    f"Bulk judgment outcome upsert failed ({len(chunk)} rows), "
+                    f"falling back to single rows: {e}"
+                )
+                for record in chunk:
+                    try:
+                        self._client.table("judgment_outcomes").upsert(
+                            record,
+                            on_conflict="judgment_id,outcome_date",
+                            returning="minimal",
+                        ).execute()
+                        saved += 1
+                    except Exception as row_error:
+                        logger.warning(
+                            f"Failed to save judgment outcome for "
+                            f"{record['judgment_id']}: {row_error}"
+                        )
+
+        return saved
+
+    @staticmethod
+    def _judgment_outcome_record(
+        judgment_id: str,
+        outcome_date: str,
+        actual_return_1d: float | None = None,
+        actual_return_5d: float | None = None,
+        actual_return_10d: float | None = None,
+        outcome_aligned: bool | None = None,
+        key_factors_validated: dict[str, Any] | None = None,
+        missed_factors: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Build a judgment_outcomes row, omitting unset fields."""
         import json
 
         record: dict[str, Any] = {
@@ -1346,12 +1672,7 @@ class SupabaseClient:
         if missed_factors is not None:
             record["missed_factors"] = json.dumps(missed_factors)
 
-        result = self._client.table("judgment_outcomes").upsert(
-            record,
-            on_conflict="judgment_id,outcome_date",
-        ).execute()
-
-        return result.data[0] if result.data else {}
+        return record
 
     def get_recent_ai_lessons(
         self,
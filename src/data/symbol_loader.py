@@ -25,18 +25,18 @@ logger = logging.getLogger(__name__)
 
 
 # Default symbols as final fallback (subset of S&P 500 top holdings)
-DEFAULT_US_SYMBOLS = [
+DEFAULT_US_SYMBOLS: tuple[str, ...] = (
     "AAPL", "MSFT", "AMZN", "NVDA", "GOOGL", "META", "TSLA", "BRK.B", "UNH", "JNJ",
     "V", "XOM", "JPM", "PG", "MA", "HD", "CVX", "MRK", "ABBV", "LLY",
     "PEP", "KO", "COST", "AVGO", "MCD", "WMT", "CSCO", "TMO", "ABT", "CRM",
     "DHR", "ACN", "NKE", "LIN", "ADBE", "ORCL", "TXN", "NEE", "PM", "VZ",
     "CMCSA", "RTX", "HON", "INTC", "UPS", "LOW", "MS", "QCOM", "SPGI", "BA",
-]
+)
 
-DEFAULT_JP_SYMBOLS = [
+DEFAULT_JP_SYMBOLS: tuple[str, ...] = (
     "7203.T", "6758.T", "8306.T", "9984.T", "9432.T",
     "8035.T", "6861.T", "7267.T", "6501.T", "8058.T",
-]
+)
 
 
 @dataclass
@@ -213,13 +213,13 @@ class SymbolLoader:
             "us": SymbolConfig(
                 market="us",
                 enabled=True,
-                symbols=DEFAULT_US_SYMBOLS.copy(),
+                symbols=list(DEFAULT_US_SYMBOLS),
                 description="Hardcoded defaults",
             ),
             "jp": SymbolConfig(
                 market="jp",
                 enabled=True,
-                symbols=DEFAULT_JP_SYMBOLS.copy(),
+                symbols=list(DEFAULT_JP_SYMBOLS),
                 description="Hardcoded defaults",
             ),
         }
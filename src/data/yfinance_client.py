@@ -6,6 +6,7 @@ Implements conservative rate limiting to avoid Yahoo blocks.
 """
 import logging
 import random
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -20,23 +21,29 @@ logger = logging.getLogger(__name__)
 MIN_REQUEST_INTERVAL = 1.0  # Minimum 1 second between requests
 MAX_REQUEST_INTERVAL = 2.0  # Add random delay up to 2 seconds
 _last_request_time = 0.0
+_rate_limit_lock = threading.Lock()
 
 
 def _rate_limit():
-    """Apply rate limiting with random jitter to avoid detection."""
+    """Apply rate limiting with random jitter to avoid detection.
+
+    Serialized with a lock so callers on worker threads still respect the
+    minimum interval between requests.
+    """
     global _last_request_time
 
-    elapsed = time.time() - _last_request_time
-    min_wait = MIN_REQUEST_INTERVAL - elapsed
+    with _rate_limit_lock:
+        elapsed = time.time() - _last_request_time
+        min_wait = MIN_REQUEST_INTERVAL - elapsed
 
-    if min_wait > 0:
-        # Add random jitter to avoid predictable patterns
-        jitter = random.uniform(0, MAX_REQUEST_INTERVAL - MIN_REQUEST_INTERVAL)
-        wait_time = min_wait + jitter
-        logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
-        time.sleep(wait_time)
+        if min_wait > 0:
+            # Add random jitter to avoid predictable patterns
+            jitter = random.uniform(0, MAX_REQUEST_INTERVAL - MIN_REQUEST_INTERVAL)
+            wait_time = min_wait + jitter
+            logger.debug("Rate limiting: waiting %.2fs", wait_time)
+            time.sleep(wait_time)
 
-    _last_request_time = time.time()
+        _last_request_time = time.time()
 
 
 def _retry_with_backoff(func, max_retries: int = 3):
@@ -99,6 +106,8 @@ class YFinanceClient:
     def __init__(self):
         """Initialize the yfinance client."""
         logger.info("Initializing yfinance client (fallback data source)")
+        # (ticker, date) -> daily return %, so index benchmarks are fetched once per day
+        self._daily_return_cache: dict[tuple[str, str], float] = {}
 
     def get_quote(self, symbol: str) -> YFinanceQuote | None:
         """
@@ -130,6 +139,60 @@ class YFinanceClient:
             logger.error(f"yfinance failed to get quote for {symbol}: {e}")
             return None
 
+    def get_prices_batch(
+        self,
+        symbols: list[str],
+        chunk_size: int = 200,
+    ) -> dict[str, float]:
+        """
+        Get latest close prices for many symbols with multi-ticker downloads.
+
+        One yf.download request covers up to chunk_size tickers, instead of
+        one request per symbol as with get_quote.
+
+        Args:
+            symbols: Stock ticker symbols
+            chunk_size: Tickers per download request
+
+        Returns:
+            Dict of symbol -> latest close. Symbols without data are absent.
+        """
+        prices: dict[str, float] = {}
+
+        for i in range(0, len(symbols), chunk_size):
+            chunk = symbols[i:i + chunk_size]
+
+            def _fetch():
+                data = yf.download(
+                    chunk,
+                    period="5d",
+                    interval="1d",
+                    group_by="column",
+                    auto_adjust=False,
+                    threads=True,
+                    progress=False,
+                )
+                if data is None or data.empty:
+                    raise ValueError(f"No price data returned for {len(chunk)} symbols")
+                return data["Close"]
+
+            try:
+                closes = _retry_with_backoff(_fetch)
+            except Exception as e:
+                logger.error(f"yfinance batch download failed for {len(chunk)} symbols: {e}")
+                continue
+
+            # Single-ticker downloads may come back as a Series
+            if closes.ndim == 1:
+                closes = closes.to_frame(chunk[0])
+
+            latest = closes.ffill().iloc[-1]
+            for symbol, price in latest.items():
+                if price == price and price > 0:  # skip NaN
+                    prices[str(symbol)] = float(price)
+
+        return prices
+
     def get_candles(
         self,
         symbol: str,
@@ -213,22 +276,7 @@ class YFinanceClient:
         Returns:
             Daily return as percentage (e.g., 1.5 for +1.5%) or None if failed
         """
-        def _fetch():
-            ticker = yf.Ticker("SPY")
-            hist = ticker.history(period="5d")
-            if len(hist) < 2:
-                return None
-            prev_close = float(hist["Close"].iloc[-2])
-            curr_close = float(hist["Close"].iloc[-1])
-            if prev_close <= 0:
-                return None
-            return ((curr_close - prev_close) / prev_close) * 100
-
-        try:
-            return _retry_with_backoff(_fetch)
-        except Exception as e:
-            logger.error(f"yfinance failed to get S&P500 daily return: {e}")
-            return None
+        return self._get_index_daily_return("SPY", "S&P500")
 
     def get_nikkei_daily_return(self) -> float | None:
         """
@@ -237,8 +285,28 @@ class YFinanceClient:
         Returns:
             Daily return as percentage (e.g., 1.5 for +1.5%) or None if failed
         """
+        return self._get_index_daily_return("^N225", "Nikkei")
+
+    def _get_index_daily_return(self, ticker_symbol: str, label: str) -> float | None:
+        """
+        Get an index's daily return percentage, memoized for the current day.
+
+        Only successful lookups are cached, so a failed fetch is retried on
+        the next call.
+
+        Args:
+            ticker_symbol: yfinance ticker of the index or its proxy ETF
+            label: Human-readable index name for log messages
+
+        Returns:
+            Daily return as percentage (e.g., 1.5 for +1.5%) or None if failed
+        """
+        cache_key = (ticker_symbol, datetime.now().date().isoformat())
+        if cache_key in self._daily_return_cache:
+            return self._daily_return_cache[cache_key]
+
         def _fetch():
-            ticker = yf.Ticker("^N225")
+            ticker = yf.Ticker(ticker_symbol)
             hist = ticker.history(period="5d")
             if len(hist) < 2:
                 return None
@@ -249,11 +317,15 @@ class YFinanceClient:
             return ((curr_close - prev_close) / prev_close) * 100
 
         try:
-            return _retry_with_backoff(_fetch)
+            daily_return = _retry_with_backoff(_fetch)
         except Exception as e:
-            logger.error(f"yfinance failed to get Nikkei daily return: {e}")
+            logger.error(f"yfinance failed to get {label} daily return: {e}")
             return None
 
+        if daily_return is not None:
+            self._daily_return_cache[cache_key] = daily_return
+        return daily_return
+
     def get_nikkei_price(self) -> float | None:
         """
         Get current Nikkei 225 price.
@@ -10,6 +10,7 @@ Features:
 - Correlation ID (batch_id) support
 - Symbol tracking per log entry
 - ISO 8601 timestamps
+- Buffered log file writes (flushed on ERROR and at exit)
 
 Usage:
     from src.logging_config import setup_logging, get_logger
@@ -23,6 +24,7 @@ Usage:
 """
 import json
 import logging
+import logging.handlers
 import os
 import sys
 from datetime import datetime, timezone
@@ -34,6 +36,9 @@ import threading
 
 _context = threading.local()
 
+# Records held in memory before they are written to the log file
+FILE_LOG_BUFFER_RECORDS = 1024
+
 
 def set_batch_id(batch_id: str) -> None:
     """Set the current batch_id for correlation."""
@@ -200,12 +205,21 @@ def setup_logging(
     # Remove existing handlers to avoid duplicates
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        if isinstance(handler, logging.handlers.MemoryHandler):
+            handler.close()  # flush buffered records to the old log file
 
-    # File handler
+    # File handler, buffered so per-stock log lines are written in batches.
+    # The buffer flushes when full, on ERROR records, and at interpreter exit.
     file_handler = logging.FileHandler(log_filename, encoding="utf-8")
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=FILE_LOG_BUFFER_RECORDS,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+    )
+    buffered_file_handler.setLevel(log_level)
+    root_logger.addHandler(buffered_file_handler)
 
     # Stream handler (console)
     stream_handler = logging.StreamHandler(sys.stdout)
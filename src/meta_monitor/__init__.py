@@ -4,6 +4,7 @@ Detect → Diagnose → Act → Evaluate cycle that runs as Step 7
 of the daily review pipeline.
 """
 
+from .detector import compute_rolling_metrics_bulk
 from .service import run_meta_monitor
 
-__all__ = ["run_meta_monitor"]
+__all__ = ["compute_rolling_metrics_bulk", "run_meta_monitor"]
@@ -239,6 +239,7 @@ def _apply_weight_adjust(supabase, strategy_mode: str, action: dict) -> dict | N
         supabase._client.table("scoring_config").update(
             {"factor_weights": json.dumps(weights)}
         ).eq("strategy_mode", strategy_mode).execute()
+        supabase.invalidate_scoring_config(strategy_mode)
 
         logger.info(
             f"Weight adjusted for {strategy_mode}/{factor}: {old_weight:.3f} -> {weights[factor]:.3f}"
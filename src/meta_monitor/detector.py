@@ -3,6 +3,8 @@
 import logging
 from datetime import datetime, timedelta, timezone
 
+from src.data.supabase_client import fetch_all_pages
+
 from .models import RollingMetrics, DegradationSignal
 from .parameters import get_parameter
 
@@ -22,170 +24,220 @@ def compute_rolling_metrics(supabase, strategy_mode: str) -> RollingMetrics:
     Queries judgment_outcomes JOIN judgment_records for win rates
     and average returns. Caches result to performance_rolling_metrics.
     """
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
-    metrics_7d = _compute_window_metrics(supabase, strategy_mode, days=7)
-    metrics_30d = _compute_window_metrics(supabase, strategy_mode, days=30)
-    missed_rate_7d = _compute_missed_rate(supabase, strategy_mode, days=7)
-    confidence_7d = _compute_avg_confidence(supabase, strategy_mode, days=7)
-    confidence_30d = _compute_avg_confidence(supabase, strategy_mode, days=30)
-
-    metrics = RollingMetrics(
-        strategy_mode=strategy_mode,
-        metric_date=today,
-        win_rate_7d=metrics_7d["win_rate"],
-        win_rate_30d=metrics_30d["win_rate"],
-        avg_return_7d=metrics_7d["avg_return"],
-        avg_return_30d=metrics_30d["avg_return"],
-        missed_rate_7d=missed_rate_7d,
-        total_judgments_7d=metrics_7d["total"],
-        total_judgments_30d=metrics_30d["total"],
-        avg_confidence_7d=confidence_7d,
-        avg_confidence_30d=confidence_30d,
-    )
+    return compute_rolling_metrics_bulk(supabase, [strategy_mode])[strategy_mode]
 
-    # Cache to DB
-    _save_metrics(supabase, metrics)
 
-    return metrics
+def compute_rolling_metrics_bulk(
+    supabase, strategy_modes: list[str]
+) -> dict[str, RollingMetrics]:
+    """Compute rolling metrics for several strategies in one pass.
 
+    Fetches the 30-day judgment outcomes and confidences once for all
+    strategies and derives every 7d/30d metric from those rows, instead of
+    re-querying each window per strategy. Results are cached to
+    performance_rolling_metrics with a single upsert.
 
-def _compute_window_metrics(supabase, strategy_mode: str, days: int) -> dict:
-    """Compute win rate and avg return for a time window."""
-    cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
+    Returns:
+        Dict mapping strategy mode to its RollingMetrics
+    """
+    now = datetime.now(timezone.utc)
+    today = now.strftime("%Y-%m-%d")
+    cutoff_7d = (now - timedelta(days=7)).strftime("%Y-%m-%d")
 
-    try:
-        rows = (
-            supabase._client.table("judgment_outcomes")
-            .select(
-                "actual_return_5d, outcome_aligned, "
-                "judgment_records!inner(symbol, strategy_mode, decision, batch_date)"
-            )
-            .gte("outcome_date", cutoff)
-            .execute()
-            .data
-            or []
-        )
+    outcome_rows = _fetch_outcome_rows(supabase, strategy_modes, days=30)
+    confidence_rows = _fetch_confidence_rows(supabase, strategy_modes, days=30)
 
-        # Filter by strategy
-        rows = [
+    metrics_by_strategy: dict[str, RollingMetrics] = {}
+    for strategy_mode in strategy_modes:
+        rows_30d = [
             r
-            for r in rows
+            for r in outcome_rows or []
             if r.get("judgment_records", {}).get("strategy_mode") == strategy_mode
         ]
-
-        if not rows:
-            return {"win_rate": None, "avg_return": None, "total": 0}
-
-        # Only count buy decisions for win rate
-        buys = [r for r in rows if r["judgment_records"]["decision"] == "buy"]
-        returns = [
-            r["actual_return_5d"]
-            for r in buys
-            if r.get("actual_return_5d") is not None
+        rows_7d = [r for r in rows_30d if (r.get("outcome_date") or "") >= cutoff_7d]
+        confidences_30d = [
+            r
+            for r in confidence_rows or []
+            if r.get("strategy_mode") == strategy_mode
+        ]
+        confidences_7d = [
+            r for r in confidences_30d if (r.get("batch_date") or "") >= cutoff_7d
         ]
 
-        if not returns:
-            return {"win_rate": None, "avg_return": None, "total": len(rows)}
+        if outcome_rows is None:
+            metrics_7d = metrics_30d = {"win_rate": None, "avg_return": None, "total": 0}
+            missed_rate_7d = None
+        else:
+            metrics_7d = _window_metrics_from_rows(rows_7d)
+            metrics_30d = _window_metrics_from_rows(rows_30d)
+            missed_rate_7d = _missed_rate_from_rows(rows_7d)
+
+        metrics_by_strategy[strategy_mode] = RollingMetrics(
+            strategy_mode=strategy_mode,
+            metric_date=today,
+            win_rate_7d=metrics_7d["win_rate"],
+            win_rate_30d=metrics_30d["win_rate"],
+            avg_return_7d=metrics_7d["avg_return"],
+            avg_return_30d=metrics_30d["avg_return"],
+            missed_rate_7d=missed_rate_7d,
+            total_judgments_7d=metrics_7d["total"],
+            total_judgments_30d=metrics_30d["total"],
+            avg_confidence_7d=_avg_confidence_from_rows(confidences_7d),
+            avg_confidence_30d=_avg_confidence_from_rows(confidences_30d),
+        )
 
-        wins = [r for r in returns if r >= 0]
-        win_rate = len(wins) / len(returns) * 100 if returns else None
-        avg_return = sum(returns) / len(returns) if returns else None
+    # Cache to DB
+    _save_metrics(supabase, list(metrics_by_strategy.values()))
 
-        return {
-            "win_rate": round(win_rate, 1) if win_rate is not None else None,
-            "avg_return": round(avg_return, 2) if avg_return is not None else None,
-            "total": len(rows),
-        }
+    return metrics_by_strategy
 
-    except Exception as e:
-        logger.warning(f"Failed to compute {days}d metrics for {strategy_mode}: {e}")
-        return {"win_rate": None, "avg_return": None, "total": 0}
 
+def _fetch_outcome_rows(
+    supabase, strategy_modes: list[str], days: int
+) -> list[dict] | None:
+    """Fetch judgment outcomes joined with their records for a time window.
 
-def _compute_missed_rate(supabase, strategy_mode: str, days: int) -> float | None:
-    """Compute missed opportunity rate: % of avoid decisions where stock rose >3%."""
+    Paged in id order, since all strategies' rows can exceed the PostgREST
+    row cap.
+
+    Returns:
+        Outcome rows, or None if the query failed
+    """
     cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
 
     try:
-        rows = (
-            supabase._client.table("judgment_outcomes")
+        return fetch_all_pages(
+            lambda: supabase._client.table("judgment_outcomes")
             .select(
-                "actual_return_5d, "
-                "judgment_records!inner(strategy_mode, decision, batch_date)"
+                "actual_return_5d, outcome_aligned, outcome_date, "
+                "judgment_records!inner(symbol, strategy_mode, decision, batch_date)"
             )
+            .in_("judgment_records.strategy_mode", strategy_modes)
             .gte("outcome_date", cutoff)
-            .execute()
-            .data
-            or []
+            .order("id")
+        )
+    except Exception as e:
+        logger.warning(f"Failed to fetch {days}d outcomes for {strategy_modes}: {e}")
+        return None
+
+
+def _fetch_confidence_rows(
+    supabase, strategy_modes: list[str], days: int
+) -> list[dict] | None:
+    """Fetch non-null judgment confidences for a time window.
+
+    Paged in id order, since all strategies' rows can exceed the PostgREST
+    row cap.
+
+    Returns:
+        Confidence rows, or None if the query failed
+    """
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
+
+    try:
+        return fetch_all_pages(
+            lambda: supabase._client.table("judgment_records")
+            .select("strategy_mode, batch_date, confidence")
+            .in_("strategy_mode", strategy_modes)
+            .gte("batch_date", cutoff)
+            .not_.is_("confidence", "null")
+            .order("id")
         )
+    except Exception as e:
+        logger.warning(f"Failed to fetch {days}d confidences for {strategy_modes}: {e}")
+        return None
+
 
-        avoids = [
+def _compute_window_metrics(supabase, strategy_mode: str, days: int) -> dict:
+    """Compute win rate and avg return for a time window."""
+    rows = _fetch_outcome_rows(supabase, [strategy_mode], days)
+    if rows is None:
+        return {"win_rate": None, "avg_return": None, "total": 0}
+
+    return _window_metrics_from_rows(
+        [
             r
             for r in rows
             if r.get("judgment_records", {}).get("strategy_mode") == strategy_mode
-            and r["judgment_records"]["decision"] == "avoid"
-            and r.get("actual_return_5d") is not None
         ]
+    )
 
-        if not avoids:
-            return None
 
-        missed = [r for r in avoids if r["actual_return_5d"] > 3.0]
-        return round(len(missed) / len(avoids) * 100, 1)
+def _window_metrics_from_rows(rows: list[dict]) -> dict:
+    """Compute win rate and avg return from one strategy's outcome rows."""
+    if not rows:
+        return {"win_rate": None, "avg_return": None, "total": 0}
 
-    except Exception as e:
-        logger.warning(f"Failed to compute missed rate for {strategy_mode}: {e}")
-        return None
+    # Only count buy decisions for win rate
+    buys = [r for r in rows if r["judgment_records"].get("decision") == "buy"]
+    returns = [
+        r["actual_return_5d"]
+        for r in buys
+        if r.get("actual_return_5d") is not None
+    ]
 
+    if not returns:
+        return {"win_rate": None, "avg_return": None, "total": len(rows)}
 
-def _compute_avg_confidence(supabase, strategy_mode: str, days: int) -> float | None:
-    """Compute average AI confidence score for a time window."""
-    cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
+    wins = [r for r in returns if r >= 0]
+    win_rate = len(wins) / len(returns) * 100 if returns else None
+    avg_return = sum(returns) / len(returns) if returns else None
 
-    try:
-        rows = (
-            supabase._client.table("judgment_records")
-            .select("confidence")
-            .eq("strategy_mode", strategy_mode)
-            .gte("batch_date", cutoff)
-            .not_.is_("confidence", "null")
-            .execute()
-            .data
-            or []
-        )
+    return {
+        "win_rate": round(win_rate, 1) if win_rate is not None else None,
+        "avg_return": round(avg_return, 2) if avg_return is not None else None,
+        "total": len(rows),
+    }
 
-        if not rows:
-            return None
 
-        values = [float(r["confidence"]) for r in rows if r.get("confidence") is not None]
-        if not values:
-            return None
+def _missed_rate_from_rows(rows: list[dict]) -> float | None:
+    """Compute missed opportunity rate: % of avoid decisions where stock rose >3%."""
+    avoids = [
+        r
+        for r in rows
+        if r["judgment_records"].get("decision") == "avoid"
+        and r.get("actual_return_5d") is not None
+    ]
+
+    if not avoids:
+        return None
 
-        return round(sum(values) / len(values), 3)
+    missed = [r for r in avoids if r["actual_return_5d"] > 3.0]
+    return round(len(missed) / len(avoids) * 100, 1)
 
-    except Exception as e:
-        logger.warning(f"Failed to compute avg confidence for {strategy_mode}: {e}")
+
+def _avg_confidence_from_rows(rows: list[dict]) -> float | None:
+    """Compute average AI confidence score from judgment record rows."""
+    values = [float(r["confidence"]) for r in rows if r.get("confidence") is not None]
+    if not values:
         return None
 
+    return round(sum(values) / len(values), 3)
+
+
+def _save_metrics(supabase, metrics: list[RollingMetrics]) -> None:
+    """Cache rolling metrics to DB with one upsert."""
+    if not metrics:
+        return
 
-def _save_metrics(supabase, metrics: RollingMetrics) -> None:
-    """Cache rolling metrics to DB with upsert."""
     try:
         supabase._client.table("performance_rolling_metrics").upsert(
-            {
-                "strategy_mode": metrics.strategy_mode,
-                "metric_date": metrics.metric_date,
-                "win_rate_7d": metrics.win_rate_7d,
-                "win_rate_30d": metrics.win_rate_30d,
-                "avg_return_7d": metrics.avg_return_7d,
-                "avg_return_30d": metrics.avg_return_30d,
-                "missed_rate_7d": metrics.missed_rate_7d,
-                "total_judgments_7d": metrics.total_judgments_7d,
-                "total_judgments_30d": metrics.total_judgments_30d,
-                "avg_confidence_7d": metrics.avg_confidence_7d,
-                "avg_confidence_30d": metrics.avg_confidence_30d,
-            },
+            [
+                {
+                    "strategy_mode": m.strategy_mode,
+                    "metric_date": m.metric_date,
+                    "win_rate_7d": m.win_rate_7d,
+                    "win_rate_30d": m.win_rate_30d,
+                    "avg_return_7d": m.avg_return_7d,
+                    "avg_return_30d": m.avg_return_30d,
+                    "missed_rate_7d": m.missed_rate_7d,
+                    "total_judgments_7d": m.total_judgments_7d,
+                    "total_judgments_30d": m.total_judgments_30d,
+                    "avg_confidence_7d": m.avg_confidence_7d,
+                    "avg_confidence_30d": m.avg_confidence_30d,
+                }
+                for m in metrics
+            ],
             on_conflict="strategy_mode,metric_date",
         ).execute()
     except Exception as e:
@@ -331,7 +383,7 @@ def count_monthly_interventions(supabase, strategy_mode: str) -> int:
         month_start = datetime.now(timezone.utc).replace(day=1).strftime("%Y-%m-%d")
         rows = (
             supabase._client.table("meta_interventions")
-            .select("id", count="exact")
+            .select("id", count="exact", head=True)
             .eq("strategy_mode", strategy_mode)
             .gte("intervention_date", month_start)
             .execute()
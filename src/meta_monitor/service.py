@@ -14,6 +14,7 @@ from .detector import (
     count_monthly_interventions,
 )
 from .diagnostician import diagnose
+from .models import RollingMetrics
 from .actuator import execute_actions, evaluate_past_interventions
 
 logger = logging.getLogger(__name__)
@@ -21,12 +22,17 @@ logger = logging.getLogger(__name__)
 MAX_MONTHLY_INTERVENTIONS = 6
 
 
-def run_meta_monitor(supabase, strategy_mode: str) -> None:
+def run_meta_monitor(
+    supabase, strategy_mode: str, metrics: RollingMetrics | None = None
+) -> None:
     """Run the full meta-monitor cycle for a strategy.
 
     Called as Step 7 of daily_review after existing feedback loops.
     Flow: Evaluate past → Compute metrics → Detect → Cooldown check →
           Monthly limit → Diagnose → Act
+
+    Pass metrics precomputed by compute_rolling_metrics_bulk to skip the
+    per-strategy metrics queries.
     """
     logger.info(f"Meta-monitor starting for {strategy_mode}")
 
@@ -37,11 +43,12 @@ def run_meta_monitor(supabase, strategy_mode: str) -> None:
         logger.error(f"Past intervention evaluation failed: {e}")
 
     # 2. Compute rolling metrics
-    try:
-        metrics = compute_rolling_metrics(supabase, strategy_mode)
-    except Exception as e:
-        logger.error(f"Rolling metrics computation failed: {e}")
-        return
+    if metrics is None:
+        try:
+            metrics = compute_rolling_metrics(supabase, strategy_mode)
+        except Exception as e:
+            logger.error(f"Rolling metrics computation failed: {e}")
+            return
 
     logger.info(
         f"Metrics for {strategy_mode}: "
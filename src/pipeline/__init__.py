@@ -10,9 +10,14 @@ from src.pipeline.scoring import (
 from src.pipeline.review import (
     adjust_thresholds_for_strategies,
     populate_judgment_outcomes,
+    populate_judgment_outcomes_for_passes,
     get_current_price,
     calculate_all_returns,
+    calculate_returns_for_passes,
     log_return_summary,
+    run_for_strategies,
+    strategies_with_returns,
+    PriceCache,
 )
 
 __all__ = [
@@ -26,7 +31,12 @@ __all__ = [
     "save_scoring_results",
     "adjust_thresholds_for_strategies",
     "populate_judgment_outcomes",
+    "populate_judgment_outcomes_for_passes",
     "get_current_price",
     "calculate_all_returns",
+    "calculate_returns_for_passes",
     "log_return_summary",
+    "run_for_strategies",
+    "strategies_with_returns",
+    "PriceCache",
 ]
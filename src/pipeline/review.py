@@ -6,9 +6,13 @@ Extracts duplicated logic from daily_review.py and daily_review_jp.py:
 - Threshold/weight adjustment (feedback loops)
 """
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Callable
+from typing import Any, Callable
+
+import numpy as np
 
 from src.pipeline.market_config import MarketConfig
 from src.scoring.threshold_optimizer import (
@@ -22,6 +26,94 @@ logger = logging.getLogger(__name__)
 
 # Type alias for price fetching functions
 PriceFetcher = Callable[[str], float | None]
+BatchPriceFetcher = Callable[[list[str]], dict[str, float]]
+
+# Concurrent per-symbol quote lookups (the data clients pace requests globally)
+PRICE_FETCH_WORKERS = 8
+
+
+class PriceCache:
+    """Memoizing wrapper around a PriceFetcher.
+
+    Every review pass prices against the current quote, so the 5d, 1d and
+    backfill passes (and both strategies within a pass) can share one lookup
+    per symbol. Failed lookups are not cached and will be retried. Fetches
+    are serialized so passes running on separate threads never quote the
+    same symbol twice.
+
+    With a batch_fetcher, prefetch() quotes many symbols in a few requests;
+    anything it misses falls back to the per-symbol price_fetcher, which
+    fetch_many() runs on a thread pool.
+    """
+
+    def __init__(
+        self,
+        price_fetcher: PriceFetcher,
+        batch_fetcher: BatchPriceFetcher | None = None,
+    ):
+        self._price_fetcher = price_fetcher
+        self._batch_fetcher = batch_fetcher
+        self._prices: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, symbols: list[str]) -> None:
+        """Quote symbols not yet cached via the batch fetcher, if any."""
+        if not self._batch_fetcher:
+            return
+        with self._lock:
+            missing = sorted({s for s in symbols if s not in self._prices})
+            if not missing:
+                return
+            try:
+                fetched = self._batch_fetcher(missing)
+            except Exception as e:
+                logger.warning(f"Batch price fetch failed for {len(missing)} symbols: {e}")
+                return
+            self._prices.update({s: p for s, p in fetched.items() if p})
+            logger.info(f"Batch-fetched prices for {len(fetched)}/{len(missing)} symbols")
+
+    def fetch_many(
+        self,
+        symbols: list[str],
+        delay: float = 0.0,
+        max_workers: int = PRICE_FETCH_WORKERS,
+    ) -> None:
+        """Quote symbols not yet cached concurrently via the per-symbol fetcher.
+
+        Each worker sleeps for delay after a lookup, so the throttle applies
+        per worker rather than across the whole pass.
+        """
+        def _fetch(symbol: str) -> float | None:
+            try:
+                return self._price_fetcher(symbol)
+            except Exception as e:
+                logger.warning(f"{symbol}: Price fetch failed: {e}")
+                return None
+            finally:
+                if delay:
+                    time.sleep(delay)
+
+        with self._lock:
+            missing = sorted({s for s in symbols if s not in self._prices})
+            if not missing:
+                return
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                for symbol, price in zip(missing, executor.map(_fetch, missing)):
+                    if price:
+                        self._prices[symbol] = price
+
+    def get(self, symbol: str) -> float | None:
+        """Return the cached price for symbol without fetching."""
+        return self._prices.get(symbol)
+
+    def __call__(self, symbol: str) -> float | None:
+        with self._lock:
+            if symbol in self._prices:
+                return self._prices[symbol]
+            price = self._price_fetcher(symbol)
+            if price:
+                self._prices[symbol] = price
+            return price
 
 
 def get_current_price(
@@ -69,6 +161,7 @@ def calculate_all_returns(
     market_config: MarketConfig,
     days_ago: int = 5,
     return_field: str = "5d",
+    now: datetime | None = None,
 ) -> dict:
     """Calculate returns for ALL scored stocks from N days ago.
 
@@ -81,24 +174,100 @@ def calculate_all_returns(
         market_config: Market configuration (provides strategies and rate_limit)
         days_ago: Number of days to look back
         return_field: Which return field to update ("1d" or "5d")
+        now: Reference time for the batch (defaults to current UTC time)
 
     Returns:
         Dict with results summary
     """
+    return calculate_returns_for_passes(
+        price_fetcher, supabase, market_config, [(days_ago, return_field)], now=now,
+    )[0]
+
+
+def calculate_returns_for_passes(
+    price_fetcher: PriceFetcher,
+    supabase,
+    market_config: MarketConfig,
+    passes: list[tuple[int, str]],
+    now: datetime | None = None,
+) -> list[dict]:
+    """Calculate returns for several review passes in one sweep.
+
+    Every pass prices against the current quote, so the 5d, 1d and backfill
+    passes share one scores query, one picks query, one round of price
+    fetches over the union of their symbols, and one bulk write.
+
+    Args:
+        price_fetcher: Callable that takes a symbol and returns price or None
+        supabase: Supabase client
+        market_config: Market configuration (provides strategies and rate_limit)
+        passes: (days_ago, return_field) pairs, e.g. [(5, "5d"), (1, "1d")]
+        now: Reference time for the batch (defaults to current UTC time)
+
+    Returns:
+        One results summary per pass, in the order given
+    """
     strategies = market_config.strategies
-    check_date = (datetime.now(timezone.utc) - timedelta(days=days_ago)).strftime("%Y-%m-%d")
-    logger.info(f"Calculating {return_field} returns for {market_config.market_type.upper()} stocks from {check_date}")
+    now = now or datetime.now(timezone.utc)
+    check_dates = [(now - timedelta(days=days_ago)).strftime("%Y-%m-%d") for days_ago, _ in passes]
+    for check_date, (_, return_field) in zip(check_dates, passes):
+        logger.info(f"Calculating {return_field} returns for {market_config.market_type.upper()} stocks from {check_date}")
+
+    unique_dates = sorted(set(check_dates))
+    scores_by_date = _get_scores_for_dates(supabase, unique_dates, strategies)
+    picks_by_date = _get_picks_for_dates(supabase, unique_dates, strategies) if scores_by_date else {}
+
+    # Share prices between strategies and passes scoring the same symbol
+    if not isinstance(price_fetcher, PriceCache):
+        price_fetcher = PriceCache(price_fetcher)
+    # Rows without an original price (zero or NULL) are dropped before any quote is fetched
+    symbols = sorted({
+        score["symbol"]
+        for check_date in check_dates
+        for score in scores_by_date.get(check_date, [])
+        if (score.get("price_at_time") or 0) > 0
+    })
+    price_fetcher.prefetch(symbols)
+    price_fetcher.fetch_many(symbols, delay=market_config.rate_limit_sleep)
+
+    all_results = []
+    updates_by_row: dict[tuple[str, str, str], dict] = {}
+    for check_date, (days_ago, return_field) in zip(check_dates, passes):
+        results, updates = _returns_for_date(
+            price_fetcher,
+            scores_by_date.get(check_date, []),
+            picks_by_date.get(check_date, {}),
+            check_date,
+            days_ago,
+            return_field,
+        )
+        all_results.append(results)
+        # A row reviewed by both a 1d and a 5d pass gets one combined update
+        for entry in updates:
+            key = (entry["batch_date"], entry["symbol"], entry["strategy_mode"])
+            updates_by_row.setdefault(key, {}).update(entry)
+
+    if updates_by_row:
+        updated = supabase.bulk_update_returns(list(updates_by_row.values()))
+        logger.info(f"Updated {updated} stock scores with return data")
 
-    # Get ALL scores from that date
-    all_scores = _get_scores_for_date(supabase, check_date, strategies)
+    return all_results
+
+
+def _returns_for_date(
+    price_fetcher: PriceCache,
+    all_scores: list[dict],
+    picks_data: dict[str, set],
+    check_date: str,
+    days_ago: int,
+    return_field: str,
+) -> tuple[dict, list[dict]]:
+    """Build the results summary and return updates for one review pass."""
     if not all_scores:
         logger.info(f"No scores found for {check_date}")
-        return {"error": "No scores found", "date": check_date}
-
-    logger.info(f"Found {len(all_scores)} stock scores to review")
+        return {"error": "No scores found", "date": check_date}, []
 
-    # Get the picks for that date to mark was_picked
-    picks_data = _get_picks_for_date(supabase, check_date, strategies)
+    logger.info(f"Found {len(all_scores)} stock scores to review for {check_date}")
     logger.info(f"Picks by strategy: {', '.join(f'{k}: {v}' for k, v in picks_data.items())}")
 
     # Calculate returns for each stock
@@ -114,25 +283,53 @@ def calculate_all_returns(
         "missed_opportunities": [],
     }
 
-    for score in all_scores:
-        symbol = score["symbol"]
-        strategy = score["strategy_mode"]
-        original_price = score.get("price_at_time", 0)
-        composite_score = score.get("composite_score", 0)
+    valid_scores = [score for score in all_scores if (score.get("price_at_time") or 0) > 0]
+    if len(valid_scores) < len(all_scores):
+        skipped = len(all_scores) - len(valid_scores)
+        logger.warning(f"{skipped} stocks have no original price, skipping")
+        results["failed"] += skipped
 
-        if original_price <= 0:
-            logger.warning(f"{symbol}: No original price, skipping")
-            results["failed"] += 1
-            continue
-
-        current_price = price_fetcher(symbol)
+    priced: list[tuple[dict, float]] = []
+    for score in valid_scores:
+        symbol = score["symbol"]
+        current_price = price_fetcher.get(symbol)
         if not current_price:
             logger.warning(f"{symbol}: Could not get current price")
             results["failed"] += 1
             continue
 
-        return_pct = ((current_price - original_price) / original_price) * 100
-        was_picked = symbol in picks_data.get(strategy, set())
+        priced.append((score, current_price))
+
+    if not priced:
+        return results, updates
+
+    # Compute all returns in one vectorized pass
+    original_prices = np.fromiter(
+        (s["price_at_time"] for s, _ in priced), dtype=np.float64, count=len(priced)
+    )
+    current_prices = np.fromiter(
+        (p for _, p in priced), dtype=np.float64, count=len(priced)
+    )
+    return_arr = (current_prices - original_prices) / original_prices * 100
+    results["avg_return_pct"] = round(float(return_arr.mean()), 2)
+    results["positive_rate"] = round(float((return_arr > 0).mean()), 3)
+    picked_pairs = frozenset(
+        (strategy, symbol) for strategy, symbols in picks_data.items() for symbol in symbols
+    )
+    picked_mask = np.fromiter(
+        ((s["strategy_mode"], s["symbol"]) in picked_pairs for s, _ in priced),
+        dtype=bool, count=len(priced),
+    )
+    missed_mask = ~picked_mask & (return_arr >= 3.0)
+    log_not_picked = logger.isEnabledFor(logging.DEBUG)
+
+    for (score, current_price), return_pct, was_picked, missed in zip(
+        priced, return_arr.tolist(), picked_mask.tolist(), missed_mask.tolist()
+    ):
+        symbol = score["symbol"]
+        strategy = score["strategy_mode"]
+        original_price = score["price_at_time"]
+        composite_score = score.get("composite_score", 0)
 
         update_entry = {
             "batch_date": check_date,
@@ -162,53 +359,43 @@ def calculate_all_returns(
             logger.info(f"[PICKED] {symbol} ({strategy}): {original_price} -> {current_price} ({return_pct:+.1f}%)")
         else:
             results["not_picked_returns"].append(result_entry)
-            if return_pct >= 3.0:
+            if missed:
                 results["missed_opportunities"].append(result_entry)
                 logger.warning(f"[MISSED] {symbol} ({strategy}): Score={composite_score}, Return={return_pct:+.1f}%")
-            else:
+            elif log_not_picked:
                 logger.debug(f"[NOT PICKED] {symbol} ({strategy}): {return_pct:+.1f}%")
 
-        results["successful"] += 1
-        time.sleep(market_config.rate_limit_sleep)
+    results["successful"] += len(priced)
 
-    if updates:
-        updated = supabase.bulk_update_returns(updates)
-        logger.info(f"Updated {updated} stock scores with return data")
+    return results, updates
 
-    return results
 
+def _get_scores_for_dates(
+    supabase, check_dates: list[str], strategies: list[str]
+) -> dict[str, list[dict]]:
+    """Get all scores for the given dates and strategy modes (single query), by date."""
+    scores_by_date: dict[str, list[dict]] = {}
+    try:
+        rows = supabase.get_scores_for_dates(check_dates, strategies)
+    except Exception as e:
+        logger.error(f"Failed to fetch scores for {strategies}: {e}")
+        return scores_by_date
 
-def _get_scores_for_date(supabase, check_date: str, strategies: list[str]) -> list[dict]:
-    """Get all scores for a date across the given strategy modes."""
-    all_scores = []
-    for strategy in strategies:
-        try:
-            result = supabase._client.table("stock_scores").select("*").eq(
-                "batch_date", check_date
-            ).eq(
-                "strategy_mode", strategy
-            ).execute()
-            if result.data:
-                all_scores.extend(result.data)
-        except Exception as e:
-            logger.error(f"Failed to fetch scores for {strategy}: {e}")
-    return all_scores
+    for row in rows:
+        scores_by_date.setdefault(row["batch_date"], []).append(row)
+    return scores_by_date
 
 
-def _get_picks_for_date(supabase, check_date: str, strategies: list[str]) -> dict[str, set]:
-    """Get picked symbols for each strategy on a date."""
-    picks_data: dict[str, set] = {}
-    for strategy in strategies:
-        picks_result = supabase._client.table("daily_picks").select("symbols").eq(
-            "batch_date", check_date
-        ).eq(
-            "strategy_mode", strategy
-        ).execute()
-        if picks_result.data:
-            picks_data[strategy] = set(picks_result.data[0].get("symbols", []))
-        else:
-            picks_data[strategy] = set()
-    return picks_data
+def _get_picks_for_dates(
+    supabase, check_dates: list[str], strategies: list[str]
+) -> dict[str, dict[str, set]]:
+    """Get picked symbols per strategy for the given dates (single query), by date."""
+    picks_by_date: dict[str, dict[str, set]] = {
+        check_date: {strategy: set() for strategy in strategies} for check_date in check_dates
+    }
+    for row in supabase.get_picks_for_dates(check_dates, strategies):
+        picks_by_date[row["batch_date"]][row["strategy_mode"]] = set(row.get("symbols") or [])
+    return picks_by_date
 
 
 def log_return_summary(results: dict, label: str = "5-day") -> None:
@@ -226,6 +413,11 @@ def log_return_summary(results: dict, label: str = "5-day") -> None:
     logger.info(f"  - Picked stocks: {len(picked)}")
     logger.info(f"  - Not picked: {len(not_picked)}")
     logger.info(f"  - MISSED OPPORTUNITIES: {len(missed)}")
+    if "avg_return_pct" in results:
+        logger.info(
+            f"  - Avg return: {results['avg_return_pct']:+.2f}%, "
+            f"positive: {results['positive_rate']:.0%}"
+        )
 
     if missed:
         logger.warning("=" * 40)
@@ -235,10 +427,28 @@ def log_return_summary(results: dict, label: str = "5-day") -> None:
         logger.warning("=" * 40)
 
 
+def strategies_with_returns(*results: dict) -> set[str]:
+    """Strategies that received at least one new return in the given passes.
+
+    Args:
+        *results: Return calculation results from calculate_all_returns
+
+    Returns:
+        Set of strategy modes with fresh return data
+    """
+    return {
+        entry["strategy"]
+        for r in results
+        if not r.get("error")
+        for entry in r.get("picked_returns", []) + r.get("not_picked_returns", [])
+    }
+
+
 def populate_judgment_outcomes(
     supabase,
     results: dict,
     return_field: str = "5d",
+    now: datetime | None = None,
 ) -> int:
     """Record outcomes for judgment_records based on calculated returns.
 
@@ -250,69 +460,99 @@ def populate_judgment_outcomes(
         supabase: Supabase client
         results: Return calculation results from calculate_all_returns
         return_field: "1d" or "5d"
+        now: Reference time for the batch (defaults to current UTC time)
 
     Returns:
         Number of judgment outcomes saved
     """
-    if results.get("error"):
-        return 0
+    return populate_judgment_outcomes_for_passes(supabase, [(results, return_field)], now=now)
 
-    check_date = results.get("date")
-    if not check_date:
-        return 0
 
-    # Build lookup: (symbol, strategy) -> return_pct
-    return_lookup: dict[tuple[str, str], float] = {}
-    for r in results.get("picked_returns", []) + results.get("not_picked_returns", []):
-        return_lookup[(r["symbol"], r["strategy"])] = r["return_pct"]
+def populate_judgment_outcomes_for_passes(
+    supabase,
+    passes: list[tuple[dict, str]],
+    now: datetime | None = None,
+) -> int:
+    """Record judgment outcomes for several return passes at once.
+
+    Judgment records for every check date are read in one query, and the
+    outcomes are saved with one batch upsert per return field.
+
+    Args:
+        supabase: Supabase client
+        passes: (results, return_field) pairs from calculate_returns_for_passes
+        now: Reference time for the batch (defaults to current UTC time)
+
+    Returns:
+        Number of judgment outcomes saved
+    """
+    # Build lookup: (check_date, symbol, strategy) -> (return_field, return_pct)
+    return_lookup: dict[tuple[str, str, str], list[tuple[str, float]]] = {}
+    for results, return_field in passes:
+        check_date = results.get("date")
+        if results.get("error") or not check_date:
+            continue
+        for r in results.get("picked_returns", []) + results.get("not_picked_returns", []):
+            return_lookup.setdefault((check_date, r["symbol"], r["strategy"]), []).append(
+                (return_field, r["return_pct"])
+            )
 
     if not return_lookup:
         return 0
 
-    # Get judgment records for check_date
+    check_dates = sorted({key[0] for key in return_lookup})
     try:
-        judgments = supabase.get_judgment_records(batch_date=check_date)
+        judgments = supabase.get_judgment_records(
+            batch_dates=check_dates,
+            columns="id, batch_date, symbol, strategy_mode, decision",
+            limit=100 * len(check_dates),
+        )
     except Exception as e:
-        logger.warning(f"Failed to fetch judgment records for {check_date}: {e}")
+        logger.warning(f"Failed to fetch judgment records for {', '.join(check_dates)}: {e}")
         return 0
 
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    saved = 0
+    today = (now or datetime.now(timezone.utc)).strftime("%Y-%m-%d")
+    outcomes_by_field: dict[str, list[dict]] = {}
 
     for j in judgments:
-        symbol = j.get("symbol")
-        strategy = j.get("strategy_mode")
         judgment_id = j.get("id")
         decision = j.get("decision", "hold")
+        key = (j.get("batch_date"), j.get("symbol"), j.get("strategy_mode"))
 
-        return_pct = return_lookup.get((symbol, strategy))
-        if return_pct is None or not judgment_id:
+        if not judgment_id:
             continue
 
-        # Determine outcome alignment
-        if decision == "buy":
-            outcome_aligned = return_pct >= 0
-        else:  # "skip", legacy "avoid", legacy "hold"
-            outcome_aligned = return_pct < 0
+        for return_field, return_pct in return_lookup.get(key, []):
+            # Determine outcome alignment
+            if decision == "buy":
+                outcome_aligned = return_pct >= 0
+            else:  # "skip", legacy "avoid", legacy "hold"
+                outcome_aligned = return_pct < 0
+
+            kwargs: dict = {
+                "judgment_id": judgment_id,
+                "outcome_date": today,
+                "outcome_aligned": outcome_aligned,
+            }
+            if return_field == "1d":
+                kwargs["actual_return_1d"] = return_pct
+            else:
+                kwargs["actual_return_5d"] = return_pct
 
-        kwargs: dict = {
-            "judgment_id": judgment_id,
-            "outcome_date": today,
-            "outcome_aligned": outcome_aligned,
-        }
-        if return_field == "1d":
-            kwargs["actual_return_1d"] = return_pct
-        else:
-            kwargs["actual_return_5d"] = return_pct
+            outcomes_by_field.setdefault(return_field, []).append(kwargs)
 
+    total_saved = 0
+    for return_field, outcomes in outcomes_by_field.items():
         try:
-            supabase.save_judgment_outcome(**kwargs)
-            saved += 1
+            saved = supabase.save_judgment_outcomes_batch(outcomes)
         except Exception as e:
-            logger.warning(f"Failed to save judgment outcome for {symbol}: {e}")
+            logger.warning(f"Failed to save {return_field} judgment outcomes for {', '.join(check_dates)}: {e}")
+            continue
 
-    logger.info(f"Saved {saved} judgment outcomes ({return_field}) for {check_date}")
-    return saved
+        logger.info(f"Saved {saved} judgment outcomes ({return_field}) for {', '.join(check_dates)}")
+        total_saved += saved
+
+    return total_saved
 
 
 def get_unprocessed_outcome_dates(
@@ -321,6 +561,7 @@ def get_unprocessed_outcome_dates(
     lookback_days: int = 14,
     min_age_days: int = 5,
     strategy_modes: list[str] | None = None,
+    now: datetime | None = None,
 ) -> list[str]:
     """Find batch_dates that have judgment_records but missing outcomes.
 
@@ -334,13 +575,52 @@ def get_unprocessed_outcome_dates(
         lookback_days: How far back to search
         min_age_days: Minimum age before expecting outcomes
         strategy_modes: Filter by these strategy modes (e.g. ["conservative", "aggressive"])
+        now: Reference time for the batch (defaults to current UTC time)
 
     Returns:
         Sorted list of batch_date strings needing outcome processing
     """
+    return get_unprocessed_outcome_dates_multi(
+        supabase,
+        min_age_days_by_field={return_field: min_age_days},
+        lookback_days=lookback_days,
+        strategy_modes=strategy_modes,
+        now=now,
+    )[return_field]
+
+
+def get_unprocessed_outcome_dates_multi(
+    supabase,
+    min_age_days_by_field: dict[str, int],
+    lookback_days: int = 14,
+    strategy_modes: list[str] | None = None,
+    now: datetime | None = None,
+) -> dict[str, list[str]]:
+    """Find unprocessed outcome dates for several return fields in one query.
+
+    The judgment_records/judgment_outcomes join is fetched once over the
+    widest date window, then partitioned per return field in Python.
+
+    Args:
+        supabase: Supabase client
+        min_age_days_by_field: Return field ("1d"/"5d") -> minimum age before expecting outcomes
+        lookback_days: How far back to search
+        strategy_modes: Filter by these strategy modes (e.g. ["conservative", "aggressive"])
+        now: Reference time for the batch (defaults to current UTC time)
+
+    Returns:
+        Dict of return field -> sorted list of batch_date strings needing outcome processing
+    """
+    if not min_age_days_by_field:
+        return {}
+    missing_dates: dict[str, set[str]] = {field: set() for field in min_age_days_by_field}
+
     try:
-        today = datetime.now(timezone.utc).date()
-        cutoff_recent = (today - timedelta(days=min_age_days)).isoformat()
+        today = (now or datetime.now(timezone.utc)).date()
+        cutoffs = {
+            field: (today - timedelta(days=min_age)).isoformat()
+            for field, min_age in min_age_days_by_field.items()
+        }
         cutoff_old = (today - timedelta(days=lookback_days)).isoformat()
 
         query = supabase._client.table("judgment_records").select(
@@ -348,42 +628,48 @@ def get_unprocessed_outcome_dates(
         ).gte(
             "batch_date", cutoff_old
         ).lte(
-            "batch_date", cutoff_recent
+            "batch_date", max(cutoffs.values())
         )
         if strategy_modes:
             query = query.in_("strategy_mode", strategy_modes)
         result = query.execute()
 
-        rows = result.data or []
-        return_col = f"actual_return_{return_field}"
-
-        missing_dates = set()
-        for row in rows:
+        for row in result.data or []:
             outcomes = row.get("judgment_outcomes", [])
-            if not outcomes or not any(
-                o.get(return_col) is not None for o in outcomes
-            ):
-                missing_dates.add(row["batch_date"])
-
-        result_dates = sorted(missing_dates)
-        if result_dates:
-            logger.info(
-                f"Found {len(result_dates)} unprocessed outcome dates "
-                f"({return_field}): {result_dates}"
-            )
-        return result_dates
+            for field, cutoff_recent in cutoffs.items():
+                if row["batch_date"] > cutoff_recent:
+                    continue
+                return_col = f"actual_return_{field}"
+                if not outcomes or not any(
+                    o.get(return_col) is not None for o in outcomes
+                ):
+                    missing_dates[field].add(row["batch_date"])
 
     except Exception as e:
         logger.warning(f"Failed to query unprocessed outcome dates: {e}")
-        return []
+        return {field: [] for field in min_age_days_by_field}
 
+    result_dates = {field: sorted(dates) for field, dates in missing_dates.items()}
+    for field, dates in result_dates.items():
+        if dates:
+            logger.info(
+                f"Found {len(dates)} unprocessed outcome dates "
+                f"({field}): {dates}"
+            )
+    return result_dates
 
-def check_batch_gap(supabase, market_type: str = "us") -> int | None:
+
+def check_batch_gap(
+    supabase,
+    market_type: str = "us",
+    now: datetime | None = None,
+) -> int | None:
     """Check for gaps in batch execution and log warnings.
 
     Args:
         supabase: Supabase client
         market_type: "us" or "jp" — filters by metadata->>market
+        now: Reference time for the batch (defaults to current UTC time)
 
     Returns:
         Number of days since last successful batch, or None if no history
@@ -408,7 +694,7 @@ def check_batch_gap(supabase, market_type: str = "us") -> int | None:
         last_run = datetime.fromisoformat(
             result.data[0]["started_at"].replace("Z", "+00:00")
         ).date()
-        today = datetime.now(timezone.utc).date()
+        today = (now or datetime.now(timezone.utc)).date()
         gap_days = (today - last_run).days
 
         if gap_days > 1:
@@ -424,6 +710,40 @@ def check_batch_gap(supabase, market_type: str = "us") -> int | None:
         return None
 
 
+def run_for_strategies(
+    func: Callable[[str], Any],
+    strategies: list[str],
+    label: str,
+) -> dict[str, Any]:
+    """Run a per-strategy step concurrently.
+
+    Strategies are independent (separate scoring_config rows, snapshots and
+    weights), so their network-bound steps can overlap. A failure in one
+    strategy is logged and recorded as None without affecting the others.
+
+    Args:
+        func: Callable taking a strategy mode
+        strategies: Strategy modes to process
+        label: Step name used in error logs
+
+    Returns:
+        Dict mapping strategy mode to func's return value (None on failure)
+    """
+    if not strategies:
+        return {}
+
+    results: dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+        futures = {strategy: executor.submit(func, strategy) for strategy in strategies}
+        for strategy, future in futures.items():
+            try:
+                results[strategy] = future.result()
+            except Exception as e:
+                logger.error(f"{label} failed for {strategy}: {e}")
+                results[strategy] = None
+    return results
+
+
 def adjust_thresholds_for_strategies(
     supabase,
     results: dict,
@@ -449,13 +769,11 @@ def adjust_thresholds_for_strategies(
         logger.info("No data for threshold adjustment")
         return
 
-    picked = results.get("picked_returns", [])
-    not_picked = results.get("not_picked_returns", [])
-    missed = results.get("missed_opportunities", [])
-
     # Get threshold history for overfitting check
     try:
-        threshold_history = supabase._client.table("threshold_history").select("*").order(
+        threshold_history = supabase._client.table("threshold_history").select(
+            "strategy_mode, adjustment_date"
+        ).order(
             "adjustment_date", desc=True
         ).limit(30).execute().data or []
     except Exception as e:
@@ -465,110 +783,143 @@ def adjust_thresholds_for_strategies(
     # Get trade count for overfitting check
     try:
         trade_count_result = supabase._client.table("trade_history").select(
-            "id", count="exact"
+            "id", count="exact", head=True
         ).execute()
         total_trades = trade_count_result.count or 0
     except Exception as e:
         logger.warning(f"Failed to fetch trade count: {e}")
         total_trades = 0
 
-    for strategy in strategies:
-        try:
-            config = supabase.get_scoring_config(strategy)
-            if not config:
-                if create_default_config:
-                    logger.info(f"Creating default scoring_config for {strategy}")
-                    default_threshold = 60 if "conservative" in strategy else 75
-                    supabase._client.table("scoring_config").insert({
-                        "strategy_mode": strategy,
-                        "threshold": default_threshold,
-                        "min_threshold": 40,
-                        "max_threshold": 90,
-                        "adjustment_step": 2.0,
-                    }).execute()
-                    config = {
-                        "threshold": default_threshold,
-                        "min_threshold": 40,
-                        "max_threshold": 90,
-                    }
-                else:
-                    logger.warning(f"No scoring_config found for {strategy}, skipping")
-                    continue
+    configs_by_strategy = supabase.get_scoring_configs_bulk(strategies)
+
+    # Each strategy reads the shared context above and writes only its own rows
+    run_for_strategies(
+        lambda strategy: _adjust_threshold_for_strategy(
+            supabase,
+            strategy,
+            configs_by_strategy.get(strategy),
+            results,
+            total_trades,
+            threshold_history,
+            create_default_config,
+        ),
+        strategies,
+        label="Threshold adjustment",
+    )
+
+
+def _adjust_threshold_for_strategy(
+    supabase,
+    strategy: str,
+    config: dict | None,
+    results: dict,
+    total_trades: int,
+    threshold_history: list[dict],
+    create_default_config: bool,
+) -> None:
+    """Run the threshold feedback loop for a single strategy."""
+    try:
+        if not config:
+            if create_default_config:
+                logger.info(f"Creating default scoring_config for {strategy}")
+                default_threshold = 60 if "conservative" in strategy else 75
+                supabase._client.table("scoring_config").insert({
+                    "strategy_mode": strategy,
+                    "threshold": default_threshold,
+                    "min_threshold": 40,
+                    "max_threshold": 90,
+                    "adjustment_step": 2.0,
+                }, returning="minimal").execute()
+                supabase.invalidate_scoring_config(strategy)
+                config = {
+                    "threshold": default_threshold,
+                    "min_threshold": 40,
+                    "max_threshold": 90,
+                }
+            else:
+                logger.warning(f"No scoring_config found for {strategy}, skipping")
+                return
+
+        current_threshold = float(config.get("threshold", 60 if "conservative" in strategy else 75))
+        min_threshold = float(config.get("min_threshold", 40))
+        max_threshold = float(config.get("max_threshold", 90))
+        last_adjustment_date = config.get("last_adjustment_date")
+
+        # Filter by strategy
+        strategy_picked = [
+            p for p in results.get("picked_returns", []) if p.get("strategy") == strategy
+        ]
+        strategy_not_picked = [
+            p for p in results.get("not_picked_returns", []) if p.get("strategy") == strategy
+        ]
+        strategy_missed = [
+            m for m in results.get("missed_opportunities", []) if m.get("strategy") == strategy
+        ]
 
-            current_threshold = float(config.get("threshold", 60 if "conservative" in strategy else 75))
-            min_threshold = float(config.get("min_threshold", 40))
-            max_threshold = float(config.get("max_threshold", 90))
-            last_adjustment_date = config.get("last_adjustment_date")
+        data_points = len(strategy_picked) + len(strategy_not_picked)
 
-            # Filter by strategy
-            strategy_picked = [p for p in picked if p.get("strategy") == strategy]
-            strategy_not_picked = [p for p in not_picked if p.get("strategy") == strategy]
-            strategy_missed = [m for m in missed if m.get("strategy") == strategy]
+        # Overfitting protection check
+        overfitting_check = check_overfitting_protection(
+            strategy_mode=strategy,
+            total_trades=total_trades,
+            data_points=data_points,
+            last_adjustment_date=last_adjustment_date,
+            threshold_history=threshold_history,
+        )
 
-            data_points = len(strategy_picked) + len(strategy_not_picked)
+        # Calculate optimal threshold
+        analysis = calculate_optimal_threshold(
+            current_threshold=current_threshold,
+            missed_opportunities=strategy_missed,
+            picked_performance=strategy_picked,
+            not_picked_performance=strategy_not_picked,
+            strategy_mode=strategy,
+            min_threshold=min_threshold,
+            max_threshold=max_threshold,
+        )
 
-            # Overfitting protection check
-            overfitting_check = check_overfitting_protection(
-                strategy_mode=strategy,
-                total_trades=total_trades,
-                data_points=data_points,
-                last_adjustment_date=last_adjustment_date,
-                threshold_history=threshold_history,
+        analysis.overfitting_check = overfitting_check
+        logger.info(format_adjustment_log(analysis))
+
+        if not overfitting_check.can_adjust:
+            logger.info(
+                f"THRESHOLD ADJUSTMENT BLOCKED ({strategy}): {overfitting_check.reason}"
             )
+            return
 
-            # Calculate optimal threshold
-            analysis = calculate_optimal_threshold(
-                current_threshold=current_threshold,
-                missed_opportunities=strategy_missed,
-                picked_performance=strategy_picked,
-                not_picked_performance=strategy_not_picked,
-                strategy_mode=strategy,
-                min_threshold=min_threshold,
-                max_threshold=max_threshold,
+        if should_apply_adjustment(analysis):
+            logger.info(
+                f"APPLYING THRESHOLD CHANGE: {strategy} "
+                f"{current_threshold} -> {analysis.recommended_threshold}"
             )
 
-            analysis.overfitting_check = overfitting_check
-            logger.info(format_adjustment_log(analysis))
+            supabase.update_threshold(
+                strategy_mode=strategy,
+                new_threshold=analysis.recommended_threshold,
+                reason=analysis.reason,
+            )
 
-            if not overfitting_check.can_adjust:
-                logger.info(
-                    f"THRESHOLD ADJUSTMENT BLOCKED ({strategy}): {overfitting_check.reason}"
-                )
-                continue
+            supabase.save_threshold_history(
+                strategy_mode=strategy,
+                old_threshold=current_threshold,
+                new_threshold=analysis.recommended_threshold,
+                reason=analysis.reason,
+                missed_opportunities_count=analysis.missed_count,
+                missed_avg_return=analysis.missed_avg_return,
+                missed_avg_score=analysis.missed_avg_score,
+                picked_count=analysis.picked_count,
+                picked_avg_return=analysis.picked_avg_return,
+                not_picked_count=analysis.not_picked_count,
+                not_picked_avg_return=analysis.not_picked_avg_return,
+                wfe_score=analysis.wfe_score,
+            )
 
-            if should_apply_adjustment(analysis):
-                logger.info(
-                    f"APPLYING THRESHOLD CHANGE: {strategy} "
-                    f"{current_threshold} -> {analysis.recommended_threshold}"
-                )
-
-                supabase.update_threshold(
-                    strategy_mode=strategy,
-                    new_threshold=analysis.recommended_threshold,
-                    reason=analysis.reason,
-                )
-
-                supabase.save_threshold_history(
-                    strategy_mode=strategy,
-                    old_threshold=current_threshold,
-                    new_threshold=analysis.recommended_threshold,
-                    reason=analysis.reason,
-                    missed_opportunities_count=analysis.missed_count,
-                    missed_avg_return=analysis.missed_avg_return,
-                    missed_avg_score=analysis.missed_avg_score,
-                    picked_count=analysis.picked_count,
-                    picked_avg_return=analysis.picked_avg_return,
-                    not_picked_count=analysis.not_picked_count,
-                    not_picked_avg_return=analysis.not_picked_avg_return,
-                    wfe_score=analysis.wfe_score,
-                )
-
-                logger.info(f"Threshold change recorded for {strategy}")
-            else:
-                logger.info(f"No threshold change needed for {strategy}")
+            logger.info(f"Threshold change recorded for {strategy}")
+        else:
+            logger.info(f"No threshold change needed for {strategy}")
 
-        except Exception as e:
-            logger.error(f"Failed to adjust threshold for {strategy}: {e}")
+    except Exception as e:
+        logger.error(f"Failed to adjust threshold for {strategy}: {e}")
 
 
 def build_performance_stats(supabase, strategy_mode: str, days: int = 30) -> dict:
@@ -701,7 +1052,7 @@ def adjust_factor_weights(
     try:
         # Get trade count for overfitting check
         trade_count_result = supabase._client.table("trade_history").select(
-            "id", count="exact"
+            "id", count="exact", head=True
         ).execute()
         total_trades = trade_count_result.count or 0
 
@@ -711,10 +1062,10 @@ def adjust_factor_weights(
 
         # Get stock_scores with returns for the last N days
         cutoff = (datetime.now(timezone.utc) - __import__("datetime").timedelta(days=days)).strftime("%Y-%m-%d")
+        # Only this strategy's factor columns are needed (V1 and V2 use disjoint sets)
+        score_columns = ", ".join(f"{key}_score" for key in factor_keys)
         scores_data = supabase._client.table("stock_scores").select(
-            "symbol, strategy_mode, composite_score, trend_score, momentum_score, "
-            "value_score, sentiment_score, momentum_12_1_score, breakout_score, "
-            "catalyst_score, risk_adjusted_score, return_5d"
+            f"{score_columns}, return_5d"
         ).eq("strategy_mode", strategy_mode
         ).gte("batch_date", cutoff
         ).not_.is_("return_5d", "null"
@@ -789,9 +1140,11 @@ def adjust_factor_weights(
             return
 
         # Save to DB
-        supabase._client.table("scoring_config").update({
-            "factor_weights": new_weights,
-        }).eq("strategy_mode", strategy_mode).execute()
+        supabase._client.table("scoring_config").update(
+            {"factor_weights": new_weights},
+            returning="minimal",
+        ).eq("strategy_mode", strategy_mode).execute()
+        supabase.invalidate_scoring_config(strategy_mode)
 
         logger.info(
             f"FACTOR WEIGHTS UPDATED ({strategy_mode}): "
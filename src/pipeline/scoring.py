@@ -4,6 +4,7 @@ Extracts duplicated logic from daily_scoring.py and daily_scoring_jp.py
 into reusable functions parameterized by MarketConfig.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from src.config import config
@@ -23,6 +24,9 @@ from src.pipeline.review import build_performance_stats, build_recent_mistakes
 
 logger = logging.getLogger(__name__)
 
+# Shadow models assessed at once (each is one OpenRouter request)
+SHADOW_MAX_WORKERS = 4
+
 
 @dataclass
 class JudgmentStats:
@@ -42,8 +46,9 @@ def load_dynamic_thresholds(
         (v1_threshold, v2_threshold) - None values mean use defaults
     """
     try:
-        v1_config = supabase.get_scoring_config(market_config.v1_strategy_mode)
-        v2_config = supabase.get_scoring_config(market_config.v2_strategy_mode)
+        configs = supabase.get_scoring_configs_bulk(market_config.strategies)
+        v1_config = configs.get(market_config.v1_strategy_mode)
+        v2_config = configs.get(market_config.v2_strategy_mode)
         v1_threshold = int(float(v1_config.get("threshold", config.strategy.v1_min_score))) if v1_config else None
         v2_threshold = int(float(v2_config.get("threshold", config.strategy.v2_min_score))) if v2_config else None
         logger.info(f"Dynamic thresholds: V1={v1_threshold}, V2={v2_threshold}")
@@ -63,8 +68,9 @@ def load_factor_weights(
         (v1_weights, v2_weights) - None values mean use defaults
     """
     try:
-        v1_config = supabase.get_scoring_config(market_config.v1_strategy_mode)
-        v2_config = supabase.get_scoring_config(market_config.v2_strategy_mode)
+        configs = supabase.get_scoring_configs_bulk(market_config.strategies)
+        v1_config = configs.get(market_config.v1_strategy_mode)
+        v2_config = configs.get(market_config.v2_strategy_mode)
         v1_weights = v1_config.get("factor_weights") if v1_config else None
         v2_weights = v2_config.get("factor_weights") if v2_config else None
         if v1_weights:
@@ -178,52 +184,60 @@ def run_llm_judgment_phase(
         )
         regime_max_picks = regime_params["max_picks"]
 
-        # Run V1 risk assessment + ensemble
-        v1_final_picks = []
-        if v1_candidates:
-            v1_final_picks = _run_strategy_ensemble(
-                judgment_service=judgment_service,
-                supabase=supabase,
-                candidates=v1_candidates,
-                positions=v1_positions,
-                strategy_mode=market_config.v1_strategy_mode,
-                market_regime_str=market_regime_str,
-                regime_params=regime_params,
-                today=today,
-                max_picks=min(max_picks, regime_max_picks),
-                finnhub=finnhub,
-                yfinance=yfinance,
-                perf_stats=v1_perf_stats,
-                weekly_research=weekly_research_text,
-                recent_mistakes=v1_recent_mistakes,
-                market_config=market_config,
-            )
-        else:
-            logger.info(f"V1 skipped: no candidates passed threshold")
-
-        # Run V2 risk assessment + ensemble
-        v2_final_picks = []
+        # V1 and V2 ensembles are independent LLM batches, so run them side by
+        # side. Each strategy gets its own JudgmentService (and LLM client).
         v2_max_picks = config.strategy.v2_max_picks if max_picks > 0 else 0
-        if v2_candidates:
-            v2_final_picks = _run_strategy_ensemble(
-                judgment_service=judgment_service,
-                supabase=supabase,
-                candidates=v2_candidates,
-                positions=v2_positions,
-                strategy_mode=market_config.v2_strategy_mode,
-                market_regime_str=market_regime_str,
-                regime_params=regime_params,
-                today=today,
-                max_picks=min(v2_max_picks, regime_max_picks),
-                finnhub=finnhub,
-                yfinance=yfinance,
-                perf_stats=v2_perf_stats,
-                weekly_research=weekly_research_text,
-                recent_mistakes=v2_recent_mistakes,
-                market_config=market_config,
-            )
-        else:
-            logger.info(f"V2 skipped: no candidates passed threshold")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Run V1 risk assessment + ensemble
+            v1_future = None
+            if v1_candidates:
+                v1_future = executor.submit(
+                    _run_strategy_ensemble,
+                    judgment_service=judgment_service,
+                    supabase=supabase,
+                    candidates=v1_candidates,
+                    positions=v1_positions,
+                    strategy_mode=market_config.v1_strategy_mode,
+                    market_regime_str=market_regime_str,
+                    regime_params=regime_params,
+                    today=today,
+                    max_picks=min(max_picks, regime_max_picks),
+                    finnhub=finnhub,
+                    yfinance=yfinance,
+                    perf_stats=v1_perf_stats,
+                    weekly_research=weekly_research_text,
+                    recent_mistakes=v1_recent_mistakes,
+                    market_config=market_config,
+                )
+            else:
+                logger.info(f"V1 skipped: no candidates passed threshold")
+
+            # Run V2 risk assessment + ensemble
+            v2_future = None
+            if v2_candidates:
+                v2_future = executor.submit(
+                    _run_strategy_ensemble,
+                    judgment_service=JudgmentService(),
+                    supabase=supabase,
+                    candidates=v2_candidates,
+                    positions=v2_positions,
+                    strategy_mode=market_config.v2_strategy_mode,
+                    market_regime_str=market_regime_str,
+                    regime_params=regime_params,
+                    today=today,
+                    max_picks=min(v2_max_picks, regime_max_picks),
+                    finnhub=finnhub,
+                    yfinance=yfinance,
+                    perf_stats=v2_perf_stats,
+                    weekly_research=weekly_research_text,
+                    recent_mistakes=v2_recent_mistakes,
+                    market_config=market_config,
+                )
+            else:
+                logger.info(f"V2 skipped: no candidates passed threshold")
+
+            v1_final_picks = v1_future.result() if v1_future else []
+            v2_final_picks = v2_future.result() if v2_future else []
 
         logger.info(f"V1 picks after ensemble: {v1_final_picks}")
         logger.info(f"V2 picks after ensemble: {v2_final_picks}")
@@ -409,28 +423,16 @@ def open_positions_and_snapshot(
     v1_score_dict = {s.symbol: s.composite_score for s in dual_result.v1_scores}
     v2_score_dict = {s.symbol: s.composite_score for s in dual_result.v2_scores}
 
-    # Open V1 positions
-    if v1_final_picks:
-        v1_opened = portfolio.open_positions_for_picks(
-            picks=v1_final_picks,
-            strategy_mode=market_config.v1_strategy_mode,
-            scores=v1_score_dict,
-            prices=prices,
-        )
-        logger.info(f"V1 opened {len(v1_opened)} positions")
-
-    # Open V2 positions
-    if v2_final_picks:
-        v2_opened = portfolio.open_positions_for_picks(
-            picks=v2_final_picks,
-            strategy_mode=market_config.v2_strategy_mode,
-            scores=v2_score_dict,
-            prices=prices,
-        )
-        logger.info(f"V2 opened {len(v2_opened)} positions")
+    def _open_and_snapshot(label: str, strategy: str, picks: list[str], scores: dict) -> None:
+        if picks:
+            opened = portfolio.open_positions_for_picks(
+                picks=picks,
+                strategy_mode=strategy,
+                scores=scores,
+                prices=prices,
+            )
+            logger.info(f"{label} opened {len(opened)} positions")
 
-    # Update portfolio snapshots
-    for strategy in [market_config.v1_strategy_mode, market_config.v2_strategy_mode]:
         try:
             portfolio.update_portfolio_snapshot(
                 strategy_mode=strategy,
@@ -439,6 +441,22 @@ def open_positions_and_snapshot(
         except Exception as e:
             logger.error(f"Failed to update snapshot for {strategy}: {e}")
 
+    # Each strategy only touches its own positions and snapshot, so the V1
+    # and V2 chains run side by side. Opening errors still propagate.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(
+                _open_and_snapshot, "V1", market_config.v1_strategy_mode,
+                v1_final_picks, v1_score_dict,
+            ),
+            executor.submit(
+                _open_and_snapshot, "V2", market_config.v2_strategy_mode,
+                v2_final_picks, v2_score_dict,
+            ),
+        ]
+    for future in futures:
+        future.result()
+
 
 def _format_weekly_research(supabase) -> str | None:
     """Fetch and format latest weekly research for judgment context."""
@@ -604,51 +622,95 @@ def _run_shadow_risk_assessments(
 
     logger.info(f"Starting shadow risk assessments with {len(shadow_models)} models")
 
-    results: dict[str, PortfolioRiskOutput] = {}
-
-    for model_id in shadow_models:
-        try:
-            logger.info(f"Shadow risk assessment: {model_id}")
+    def _assess(model_id: str) -> PortfolioRiskOutput:
+        logger.info(f"Shadow risk assessment: {model_id}")
 
-            shadow_client = OpenAIClient(
-                base_url=config.llm.openrouter_base_url,
-                api_key=config.llm.openrouter_api_key,
-                default_model=model_id,
-            )
-            shadow_service = JudgmentService(
-                llm_client=shadow_client,
-                model_name=model_id,
-            )
+        shadow_client = OpenAIClient(
+            base_url=config.llm.openrouter_base_url,
+            api_key=config.llm.openrouter_api_key,
+            default_model=model_id,
+        )
+        shadow_service = JudgmentService(
+            llm_client=shadow_client,
+            model_name=model_id,
+        )
 
-            risk_output, _, _ = run_risk_assessment(
-                judgment_service=shadow_service,
-                supabase=supabase,
-                candidates=candidates,
-                strategy_mode=strategy_mode,
-                market_regime=market_regime_str,
-                batch_date=today,
-                current_positions=positions,
-                finnhub=finnhub,
-                yfinance=yfinance,
-                recent_mistakes=recent_mistakes,
-                weekly_research=weekly_research,
-                performance_stats=perf_stats,
-            )
+        risk_output, _, _ = run_risk_assessment(
+            judgment_service=shadow_service,
+            supabase=supabase,
+            candidates=candidates,
+            strategy_mode=strategy_mode,
+            market_regime=market_regime_str,
+            batch_date=today,
+            current_positions=positions,
+            finnhub=finnhub,
+            yfinance=yfinance,
+            recent_mistakes=recent_mistakes,
+            weekly_research=weekly_research,
+            performance_stats=perf_stats,
+        )
+        return risk_output
 
-            results[model_id] = risk_output
-            logger.info(
-                f"Shadow {model_id}: "
-                + ", ".join(f"{a.symbol}=R{a.risk_score}" for a in risk_output.assessments)
-            )
+    # Each shadow model is an independent OpenRouter call with its own client
+    with ThreadPoolExecutor(
+        max_workers=min(SHADOW_MAX_WORKERS, len(shadow_models))
+    ) as executor:
+        futures = {model_id: executor.submit(_assess, model_id) for model_id in shadow_models}
 
+    # Collect in configured model order
+    results: dict[str, PortfolioRiskOutput] = {}
+    for model_id, future in futures.items():
+        try:
+            risk_output = future.result()
         except Exception as e:
             logger.warning(f"Shadow {model_id} failed: {e}")
             continue
 
+        results[model_id] = risk_output
+        logger.info(
+            f"Shadow {model_id}: "
+            + ", ".join(f"{a.symbol}=R{a.risk_score}" for a in risk_output.assessments)
+        )
+
     logger.info(f"Shadow risk assessments complete: {len(results)}/{len(shadow_models)} succeeded")
     return results
 
 
+def _build_stock_scores(
+    scores: list,
+    strategy_mode: str,
+    batch_date: str,
+    market_regime_str: str,
+    cutoff_iso: str,
+    price_by_symbol: dict[str, float],
+    market_type: str | None,
+) -> list[StockScore]:
+    """Convert scorer output into StockScore rows for one strategy."""
+    return [
+        StockScore(
+            batch_date=batch_date,
+            symbol=s.symbol,
+            strategy_mode=strategy_mode,
+            trend_score=s.trend_score,
+            momentum_score=s.momentum_score,
+            value_score=s.value_score,
+            sentiment_score=s.sentiment_score,
+            composite_score=s.composite_score,
+            percentile_rank=s.percentile_rank,
+            reasoning=s.reasoning,
+            price_at_time=price_by_symbol.get(s.symbol, 0.0),
+            market_regime_at_time=market_regime_str,
+            momentum_12_1_score=s.momentum_12_1_score,
+            breakout_score=s.breakout_score,
+            catalyst_score=s.catalyst_score,
+            risk_adjusted_score=s.risk_adjusted_score,
+            cutoff_timestamp=cutoff_iso,
+            market_type=market_type,
+        )
+        for s in scores
+    ]
+
+
 def save_scoring_results(
     supabase,
     batch_date: str,
@@ -680,113 +742,96 @@ def save_scoring_results(
     save_errors: list[str] = []
     market_type = market_config.market_type if market_config.market_type != "us" else None
 
-    def get_price(symbol: str) -> float:
-        return next(
-            (d.open_price for d in v1_stocks_data if d.symbol == symbol),
-            0.0,
-        )
+    price_by_symbol = {d.symbol: d.open_price for d in v1_stocks_data}
+    cutoff_iso = dual_result.cutoff_timestamp.isoformat()
 
-    # Save V1 stock scores
+    # Build V1 stock scores
     try:
-        v1_stock_scores = [
-            StockScore(
-                batch_date=batch_date,
-                symbol=s.symbol,
-                strategy_mode=market_config.v1_strategy_mode,
-                trend_score=s.trend_score,
-                momentum_score=s.momentum_score,
-                value_score=s.value_score,
-                sentiment_score=s.sentiment_score,
-                composite_score=s.composite_score,
-                percentile_rank=s.percentile_rank,
-                reasoning=s.reasoning,
-                price_at_time=get_price(s.symbol),
-                market_regime_at_time=market_regime_str,
-                momentum_12_1_score=s.momentum_12_1_score,
-                breakout_score=s.breakout_score,
-                catalyst_score=s.catalyst_score,
-                risk_adjusted_score=s.risk_adjusted_score,
-                cutoff_timestamp=dual_result.cutoff_timestamp.isoformat(),
-                market_type=market_type,
-            )
-            for s in dual_result.v1_scores
-        ]
-        supabase.save_stock_scores(v1_stock_scores)
-        logger.info(f"Saved {len(v1_stock_scores)} V1 ({market_config.v1_strategy_mode}) stock scores")
+        v1_stock_scores = _build_stock_scores(
+            dual_result.v1_scores, market_config.v1_strategy_mode, batch_date,
+            market_regime_str, cutoff_iso, price_by_symbol, market_type,
+        )
     except Exception as e:
-        error_msg = f"Failed to save V1 stock scores: {e}"
+        error_msg = f"Failed to build V1 stock scores: {e}"
         logger.error(error_msg)
         save_errors.append(error_msg)
+        v1_stock_scores = []
 
-    # Save V2 stock scores
+    # Build V2 stock scores
     try:
-        v2_stock_scores = [
-            StockScore(
-                batch_date=batch_date,
-                symbol=s.symbol,
-                strategy_mode=market_config.v2_strategy_mode,
-                trend_score=s.trend_score,
-                momentum_score=s.momentum_score,
-                value_score=s.value_score,
-                sentiment_score=s.sentiment_score,
-                composite_score=s.composite_score,
-                percentile_rank=s.percentile_rank,
-                reasoning=s.reasoning,
-                price_at_time=get_price(s.symbol),
-                market_regime_at_time=market_regime_str,
-                momentum_12_1_score=s.momentum_12_1_score,
-                breakout_score=s.breakout_score,
-                catalyst_score=s.catalyst_score,
-                risk_adjusted_score=s.risk_adjusted_score,
-                cutoff_timestamp=dual_result.cutoff_timestamp.isoformat(),
-                market_type=market_type,
-            )
-            for s in dual_result.v2_scores
-        ]
-        supabase.save_stock_scores(v2_stock_scores)
-        logger.info(f"Saved {len(v2_stock_scores)} V2 ({market_config.v2_strategy_mode}) stock scores")
+        v2_stock_scores = _build_stock_scores(
+            dual_result.v2_scores, market_config.v2_strategy_mode, batch_date,
+            market_regime_str, cutoff_iso, price_by_symbol, market_type,
+        )
     except Exception as e:
-        error_msg = f"Failed to save V2 stock scores: {e}"
+        error_msg = f"Failed to build V2 stock scores: {e}"
         logger.error(error_msg)
         save_errors.append(error_msg)
+        v2_stock_scores = []
 
-    # Save daily picks
-    try:
-        v1_pick = DailyPick(
-            batch_date=batch_date,
-            symbols=v1_final_picks,
-            pick_count=len(v1_final_picks),
-            market_regime=market_regime_str,
-            strategy_mode=market_config.v1_strategy_mode,
-            status="published",
-            market_type=market_type,
-        )
-        v2_pick = DailyPick(
-            batch_date=batch_date,
-            symbols=v2_final_picks,
-            pick_count=len(v2_final_picks),
-            market_regime=market_regime_str,
-            strategy_mode=market_config.v2_strategy_mode,
-            status="published",
-            market_type=market_type,
-        )
+    def _save_scores() -> list[str]:
+        if not (v1_stock_scores or v2_stock_scores):
+            return []
+        try:
+            supabase.save_stock_scores(
+                v1_stock_scores + v2_stock_scores,
+                returning="minimal",
+            )
+            logger.info(
+                f"Saved {len(v1_stock_scores)} V1 ({market_config.v1_strategy_mode}) and "
+                f"{len(v2_stock_scores)} V2 ({market_config.v2_strategy_mode}) stock scores"
+            )
+            return []
+        except Exception as e:
+            error_msg = f"Failed to save stock scores: {e}"
+            logger.error(error_msg)
+            return [error_msg]
 
-        saved_picks, pick_errors = supabase.save_daily_picks_batch(
-            [v1_pick, v2_pick],
-            delete_existing=True,
-        )
+    def _save_picks() -> list[str]:
+        try:
+            v1_pick = DailyPick(
+                batch_date=batch_date,
+                symbols=v1_final_picks,
+                pick_count=len(v1_final_picks),
+                market_regime=market_regime_str,
+                strategy_mode=market_config.v1_strategy_mode,
+                status="published",
+                market_type=market_type,
+            )
+            v2_pick = DailyPick(
+                batch_date=batch_date,
+                symbols=v2_final_picks,
+                pick_count=len(v2_final_picks),
+                market_regime=market_regime_str,
+                strategy_mode=market_config.v2_strategy_mode,
+                status="published",
+                market_type=market_type,
+            )
 
-        if pick_errors:
-            for err in pick_errors:
-                logger.error(err)
-                save_errors.append(err)
-        else:
+            saved_picks, pick_errors = supabase.save_daily_picks_batch(
+                [v1_pick, v2_pick],
+                delete_existing=True,
+            )
+
+            if pick_errors:
+                for err in pick_errors:
+                    logger.error(err)
+                return list(pick_errors)
             logger.info(f"Saved daily picks: V1={len(v1_final_picks)}, V2={len(v2_final_picks)}")
+            return []
 
-    except Exception as e:
-        error_msg = f"Failed to save daily picks: {e}"
-        logger.error(error_msg)
-        save_errors.append(error_msg)
+        except Exception as e:
+            error_msg = f"Failed to save daily picks: {e}"
+            logger.error(error_msg)
+            return [error_msg]
+
+    # Scores and picks go to different tables, so both writes run at once.
+    # Errors are collected in the same order as the former sequential saves.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        scores_future = executor.submit(_save_scores)
+        picks_future = executor.submit(_save_picks)
+    save_errors.extend(scores_future.result())
+    save_errors.extend(picks_future.result())
 
     if save_errors:
         logger.error(f"Save operation completed with {len(save_errors)} error(s)")
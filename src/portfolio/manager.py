@@ -115,6 +115,7 @@ class PortfolioManager:
         self.market_config = market_config
         self._txn_costs = market_config.transaction_costs if market_config else None
         self._params_cache: dict[str, dict[str, float]] = {}
+        self._price_cache: dict[str, float] = {}
 
     def _get_params(self, strategy_mode: str) -> dict[str, float]:
         """Load strategy parameters from DB with caching and fallback."""
@@ -607,13 +608,37 @@ class PortfolioManager:
 
         return opened
 
+    def prefetch_prices(self, symbols: list[str]) -> None:
+        """Quote many symbols with batched yfinance downloads.
+
+        Only used when yfinance is the primary source (no Finnhub client);
+        symbols it misses fall back to per-symbol quotes in get_current_price.
+        """
+        if self.finnhub or not self.yfinance:
+            return
+        missing = sorted({s for s in symbols if s not in self._price_cache})
+        if not missing:
+            return
+        try:
+            self._price_cache.update(self.yfinance.get_prices_batch(missing))
+        except Exception as e:
+            logger.warning(f"Batch price fetch failed for {len(missing)} symbols: {e}")
+
     def get_current_price(self, symbol: str) -> float | None:
-        """Get current price for a symbol with fallback."""
+        """Get current price for a symbol with fallback.
+
+        Successful lookups are cached, so exit checks and snapshots in one
+        run quote each position once.
+        """
+        if symbol in self._price_cache:
+            return self._price_cache[symbol]
+
         # Try Finnhub first
         if self.finnhub:
             try:
                 quote = self.finnhub.get_quote(symbol)
                 if quote.current_price and quote.current_price > 0:
+                    self._price_cache[symbol] = quote.current_price
                     return quote.current_price
             except Exception as e:
                 logger.debug(f"{symbol}: Finnhub quote failed: {e}")
@@ -623,6 +648,7 @@ class PortfolioManager:
             try:
                 yf_quote = self.yfinance.get_quote(symbol)
                 if yf_quote and yf_quote.current_price > 0:
+                    self._price_cache[symbol] = yf_quote.current_price
                     return yf_quote.current_price
             except Exception as e:
                 logger.debug(f"{symbol}: yfinance quote failed: {e}")
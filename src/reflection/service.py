@@ -7,9 +7,11 @@ Based on Reflexion framework:
 3. Generate improvement suggestions
 4. Store for future reference
 """
+import hashlib
 import json
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any
 
 from src.llm import get_llm_client_for_model, LLMClient
@@ -27,6 +29,72 @@ from .prompts import REFLECTION_SYSTEM_PROMPT, build_reflection_prompt, PROMPT_V
 
 logger = logging.getLogger(__name__)
 
+# LLM responses keyed by prompt hash, so same-day reruns skip the LLM call
+LLM_CACHE_DIR = Path("/tmp/ai_pick_daily_llm_cache")
+# Entries older than this are expired and deleted (reruns happen same day)
+LLM_CACHE_MAX_AGE = timedelta(hours=24)
+
+
+def _llm_cache_key(model_name: str, prompt: str) -> str:
+    """Build a cache key from the model and the full prompt text."""
+    return hashlib.sha256(f"{model_name}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+def _cache_entry_age(path: Path, now: datetime) -> timedelta:
+    """Time since a cache entry was written."""
+    return now - datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+
+
+def _load_cached_response(key: str, now: datetime | None = None) -> str | None:
+    """Return a cached LLM response, or None on miss, expiry or unreadable entry.
+
+    Entries older than LLM_CACHE_MAX_AGE before now (defaults to current UTC
+    time) are deleted and treated as a miss.
+    """
+    cache_path = LLM_CACHE_DIR / f"{key}.json"
+    if not cache_path.exists():
+        return None
+    now = now or datetime.now(timezone.utc)
+    try:
+        if _cache_entry_age(cache_path, now) > LLM_CACHE_MAX_AGE:
+            cache_path.unlink(missing_ok=True)
+            return None
+        with open(cache_path, "r") as f:
+            return json.load(f)["content"]
+    except (OSError, json.JSONDecodeError, KeyError) as e:
+        logger.warning(f"Ignoring unreadable LLM cache entry {cache_path}: {e}")
+        return None
+
+
+def _prune_llm_cache(now: datetime | None = None) -> None:
+    """Delete cache entries older than LLM_CACHE_MAX_AGE."""
+    if not LLM_CACHE_DIR.exists():
+        return
+    now = now or datetime.now(timezone.utc)
+    for path in LLM_CACHE_DIR.glob("*.json"):
+        try:
+            if _cache_entry_age(path, now) > LLM_CACHE_MAX_AGE:
+                path.unlink()
+        except OSError as e:
+            logger.debug(f"Failed to prune LLM cache entry {path}: {e}")
+
+
+def _save_cached_response(key: str, content: str) -> None:
+    """Persist an LLM response atomically (write to temp file, then rename).
+
+    Expired entries are pruned first so the cache directory stays bounded.
+    """
+    try:
+        _prune_llm_cache()
+        LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = LLM_CACHE_DIR / f"{key}.json"
+        temp_path = cache_path.with_suffix(".tmp")
+        with open(temp_path, "w") as f:
+            json.dump({"content": content}, f)
+        temp_path.rename(cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to write LLM cache entry: {e}")
+
 
 class ReflectionService:
     """
@@ -190,16 +258,23 @@ class ReflectionService:
 
         full_prompt = f"{REFLECTION_SYSTEM_PROMPT}\n\n{prompt}"
 
-        # Generate reflection using LLM
+        # Generate reflection using LLM (reuse a cached response on reruns)
+        cache_key = _llm_cache_key(self.model_name, full_prompt)
         try:
-            response = self.llm_client.generate(
-                prompt=full_prompt,
-                model=self.model_name,
-            )
+            content = _load_cached_response(cache_key)
+            cache_hit = content is not None
+            if cache_hit:
+                logger.info("Using cached reflection response (prompt unchanged)")
+            else:
+                response = self.llm_client.generate(
+                    prompt=full_prompt,
+                    model=self.model_name,
+                )
+                content = response.content
 
             # Parse response
             result = self._parse_reflection_response(
-                response=response.content,
+                response=content,
                 strategy_mode=strategy_mode,
                 reflection_type=reflection_type,
                 start_date=start_date,
@@ -207,8 +282,10 @@ class ReflectionService:
                 summary=summary,
             )
 
-            # Store raw response
-            result.raw_llm_response = response.content
+            # Store raw response; cache fresh responses that parsed cleanly
+            result.raw_llm_response = content
+            if not cache_hit:
+                _save_cached_response(cache_key, content)
 
             # Save to database
             self._save_reflection(result)
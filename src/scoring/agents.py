@@ -60,6 +60,17 @@ def calculate_ema(prices: list[float], period: int) -> float:
     return ema
 
 
+def _ema_series(prices: list[float], period: int) -> list[float]:
+    """Calculate the running EMA; element i is the EMA of prices[:i + 1]."""
+    multiplier = 2 / (period + 1)
+    ema = prices[0]
+    series = [ema]
+    for price in prices[1:]:
+        ema = (price * multiplier) + (ema * (1 - multiplier))
+        series.append(ema)
+    return series
+
+
 def calculate_macd(prices: list[float]) -> tuple[float, float, float]:
     """
     Calculate MACD indicator.
@@ -70,12 +81,11 @@ def calculate_macd(prices: list[float]) -> tuple[float, float, float]:
     if len(prices) < 26:
         return 0.0, 0.0, 0.0
 
-    # Calculate MACD line history for signal line EMA
-    macd_history = []
-    for i in range(26, len(prices) + 1):
-        ema12 = calculate_ema(prices[:i], 12)
-        ema26 = calculate_ema(prices[:i], 26)
-        macd_history.append(ema12 - ema26)
+    # Calculate MACD line history for signal line EMA. The EMA of each
+    # prefix is the running EMA at its last index, so one pass suffices.
+    ema12 = _ema_series(prices, 12)
+    ema26 = _ema_series(prices, 26)
+    macd_history = [ema12[i] - ema26[i] for i in range(25, len(prices))]
 
     macd_line = macd_history[-1]
 
@@ -147,6 +147,32 @@ def calculate_volatility(prices: list[float], period: int = 5) -> float:
     return float(np.std(returns)) * np.sqrt(252)  # Annualized
 
 
+def calculate_regime_features(prices: list[float]) -> tuple[float, float, float]:
+    """
+    Calculate the SMA and volatility inputs for regime detection in one pass.
+
+    Daily returns are computed once and shared by both volatility windows.
+    Results match calculate_sma(prices, 20) and calculate_volatility(prices, 5/30).
+
+    Args:
+        prices: List of closing prices (newest last)
+
+    Returns:
+        (sma20, volatility_5d, volatility_30d)
+    """
+    sma20 = calculate_sma(prices, 20)
+
+    # Newest-first daily returns, in the order calculate_volatility builds them
+    returns = [
+        (prices[-i] - prices[-i - 1]) / prices[-i - 1]
+        for i in range(1, min(30, len(prices) - 1) + 1)
+    ]
+    volatility_5d = float(np.std(returns[:5])) * np.sqrt(252) if len(prices) >= 6 else 0.0
+    volatility_30d = float(np.std(returns)) * np.sqrt(252) if len(prices) >= 31 else 0.0
+
+    return sma20, volatility_5d, volatility_30d
+
+
 def detect_volatility_cluster(
     volatility_5d: float,
     volatility_30d: float,
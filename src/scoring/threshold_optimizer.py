@@ -20,8 +20,10 @@ Reference: "The Probability of Backtest Overfitting" (Bailey et al., 2014)
 """
 import logging
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,13 @@ MAX_ADJUSTMENTS_PER_MONTH = 4
 MIN_DATA_POINTS = 20
 
 
+def _mean(values: Iterable[float], count: int) -> float:
+    """Mean of ``count`` values, collected into a float64 buffer in one pass."""
+    if count == 0:
+        return 0.0
+    return float(np.fromiter(values, dtype=np.float64, count=count).mean())
+
+
 @dataclass
 class OverfittingCheck:
     """Result of backtest overfitting protection checks."""
@@ -105,16 +114,14 @@ def calculate_optimal_threshold(
     not_picked_count = len(not_picked_performance)
 
     def avg(lst: list, key: str) -> float:
-        vals = [item.get(key, 0) or 0 for item in lst]
-        return sum(vals) / len(vals) if vals else 0.0
+        return _mean((item.get(key, 0) or 0 for item in lst), len(lst))
 
     def avg_score(lst: list) -> float:
         # Handle different key names
-        scores = []
-        for item in lst:
-            score = item.get("score") or item.get("composite_score") or 0
-            scores.append(score)
-        return sum(scores) / len(scores) if scores else 0.0
+        return _mean(
+            (item.get("score") or item.get("composite_score") or 0 for item in lst),
+            len(lst),
+        )
 
     missed_avg_return = avg(missed_opportunities, "return_pct")
     missed_avg_score = avg_score(missed_opportunities)
@@ -332,7 +339,7 @@ def check_overfitting_protection(
     days_since_last = None
     if last_adjustment_date:
         try:
-            last_date = datetime.strptime(last_adjustment_date, "%Y-%m-%d").date()
+            last_date = date.fromisoformat(last_adjustment_date)
             days_since_last = (today - last_date).days
         except (ValueError, TypeError):
             pass
@@ -343,7 +350,7 @@ def check_overfitting_protection(
         1 for h in threshold_history
         if h.get("strategy_mode") == strategy_mode
         and h.get("adjustment_date")
-        and datetime.strptime(h["adjustment_date"], "%Y-%m-%d").date() >= month_start
+        and date.fromisoformat(h["adjustment_date"]) >= month_start
     )
 
     # Check rules in order of priority
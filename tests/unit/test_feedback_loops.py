@@ -191,6 +191,19 @@ class TestAdjustFactorWeights:
         # Should not try to update weights
         supabase._client.table.return_value.update.assert_not_called()
 
+    def test_fetches_only_strategy_factor_columns(self):
+        """V2 strategies pull only V2 factor columns plus return_5d."""
+        supabase = MagicMock()
+        self._mock_trade_count(supabase, 20)
+        self._mock_scores_data(supabase, [])
+
+        adjust_factor_weights(supabase, "aggressive")
+
+        select_args = [c.args for c in supabase._client.table.return_value.select.call_args_list]
+        assert (
+            "momentum_12_1_score, breakout_score, catalyst_score, risk_adjusted_score, return_5d",
+        ) in select_args
+
     def test_weight_bounds_respected(self):
         """Verify WEIGHT_MIN and WEIGHT_MAX constants."""
         assert WEIGHT_MIN == 0.05
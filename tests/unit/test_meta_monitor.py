@@ -11,7 +11,9 @@ from src.meta_monitor.models import (
     Diagnosis,
     InterventionResult,
 )
+from src.data.supabase_client import QUERY_PAGE_SIZE
 from src.meta_monitor.detector import (
+    compute_rolling_metrics_bulk,
     detect_degradation,
     MIN_JUDGMENTS_FOR_DETECTION,
 )
@@ -163,6 +165,110 @@ class TestDetectDegradation:
         assert "win_rate_drop" not in types
 
 
+class TestComputeRollingMetricsBulk:
+    @staticmethod
+    def _make_supabase(outcomes, confidences):
+        today = datetime.now(timezone.utc)
+        recent = today.strftime("%Y-%m-%d")
+        old = (today - timedelta(days=20)).strftime("%Y-%m-%d")
+        for row in outcomes + confidences:
+            date_key = "outcome_date" if "outcome_date" in row else "batch_date"
+            row[date_key] = recent if row[date_key] == "recent" else old
+
+        tables = {
+            "judgment_outcomes": MagicMock(),
+            "judgment_records": MagicMock(),
+            "performance_rolling_metrics": MagicMock(),
+        }
+        outcome_chain = tables["judgment_outcomes"].select.return_value.in_.return_value
+        outcome_page = outcome_chain.gte.return_value.order.return_value.range.return_value
+        outcome_page.execute.return_value.data = outcomes
+        confidence_chain = tables["judgment_records"].select.return_value.in_.return_value
+        confidence_page = (
+            confidence_chain.gte.return_value.not_.is_.return_value.order.return_value.range.return_value
+        )
+        confidence_page.execute.return_value.data = confidences
+
+        mock = MagicMock()
+        mock._client.table.side_effect = tables.__getitem__
+        return mock, tables
+
+    @staticmethod
+    def _outcome(strategy, decision, ret, when):
+        return {
+            "actual_return_5d": ret,
+            "outcome_date": when,
+            "judgment_records": {"strategy_mode": strategy, "decision": decision},
+        }
+
+    def test_windows_split_per_strategy_from_one_query(self):
+        outcomes = [
+            self._outcome("conservative", "buy", 2.0, "recent"),
+            self._outcome("conservative", "buy", -1.0, "old"),
+            self._outcome("conservative", "avoid", 5.0, "recent"),
+            self._outcome("aggressive", "buy", -3.0, "recent"),
+        ]
+        confidences = [
+            {"strategy_mode": "conservative", "confidence": 0.8, "batch_date": "recent"},
+            {"strategy_mode": "conservative", "confidence": 0.6, "batch_date": "old"},
+        ]
+        supabase, tables = self._make_supabase(outcomes, confidences)
+
+        result = compute_rolling_metrics_bulk(supabase, ["conservative", "aggressive"])
+
+        conservative = result["conservative"]
+        assert conservative.win_rate_7d == 100.0
+        assert conservative.win_rate_30d == 50.0
+        assert conservative.avg_return_30d == 0.5
+        assert conservative.missed_rate_7d == 100.0
+        assert conservative.total_judgments_7d == 2
+        assert conservative.total_judgments_30d == 3
+        assert conservative.avg_confidence_7d == 0.8
+        assert conservative.avg_confidence_30d == 0.7
+
+        aggressive = result["aggressive"]
+        assert aggressive.win_rate_7d == 0.0
+        assert aggressive.avg_confidence_30d is None
+
+        tables["judgment_outcomes"].select.assert_called_once()
+        tables["judgment_records"].select.assert_called_once()
+        upserted = tables["performance_rolling_metrics"].upsert.call_args[0][0]
+        assert [row["strategy_mode"] for row in upserted] == ["conservative", "aggressive"]
+
+    def test_confidences_paged_past_row_cap(self):
+        supabase, tables = self._make_supabase([], [])
+        old = (datetime.now(timezone.utc) - timedelta(days=20)).strftime("%Y-%m-%d")
+        full_page = [
+            {"strategy_mode": "conservative", "confidence": 0.5, "batch_date": old}
+            for _ in range(QUERY_PAGE_SIZE)
+        ]
+        last_page = [{"strategy_mode": "conservative", "confidence": 1.5, "batch_date": old}]
+        confidence_range = (
+            tables["judgment_records"].select.return_value.in_.return_value
+            .gte.return_value.not_.is_.return_value.order.return_value.range
+        )
+        confidence_range.return_value.execute.side_effect = [
+            MagicMock(data=full_page),
+            MagicMock(data=last_page),
+        ]
+
+        metrics = compute_rolling_metrics_bulk(supabase, ["conservative"])["conservative"]
+
+        assert confidence_range.call_count == 2
+        # The row on the second page moves the mean above 0.5
+        assert metrics.avg_confidence_30d > 0.5
+
+    def test_failed_outcome_query_yields_empty_metrics(self):
+        supabase, tables = self._make_supabase([], [])
+        tables["judgment_outcomes"].select.side_effect = Exception("db down")
+
+        metrics = compute_rolling_metrics_bulk(supabase, ["conservative"])["conservative"]
+
+        assert metrics.win_rate_7d is None
+        assert metrics.missed_rate_7d is None
+        assert metrics.total_judgments_30d == 0
+
+
 # ─── Actuator Tests ──────────────────────────────────────
 
 
@@ -7,6 +7,8 @@ Covers:
 - adjust_thresholds_for_strategies logic
 - _format_past_lessons helper
 - load_dynamic_thresholds
+- run_llm_judgment_phase and shadow risk assessments
+- save_scoring_results
 """
 import pytest
 from unittest.mock import MagicMock, patch
@@ -66,22 +68,35 @@ class TestPopulateJudgmentOutcomes:
             r["error"] = error
         return r
 
+    def _make_supabase(self):
+        supabase = MagicMock()
+        supabase.save_judgment_outcomes_batch.side_effect = lambda outcomes: len(outcomes)
+        # Judgment fixtures omit batch_date; stamp the (single) requested date
+        supabase.get_judgment_records.side_effect = lambda **kwargs: [
+            {"batch_date": kwargs["batch_dates"][0], **j}
+            for j in supabase.get_judgment_records.return_value
+        ]
+        return supabase
+
+    def _saved_outcomes(self, supabase):
+        return supabase.save_judgment_outcomes_batch.call_args[0][0]
+
     def test_skips_on_error(self):
         from src.pipeline.review import populate_judgment_outcomes
-        supabase = MagicMock()
+        supabase = self._make_supabase()
         result = populate_judgment_outcomes(supabase, {"error": "No data"})
         assert result == 0
         supabase.get_judgment_records.assert_not_called()
 
     def test_skips_on_no_date(self):
         from src.pipeline.review import populate_judgment_outcomes
-        supabase = MagicMock()
+        supabase = self._make_supabase()
         result = populate_judgment_outcomes(supabase, {"picked_returns": []})
         assert result == 0
 
     def test_skips_on_empty_returns(self):
         from src.pipeline.review import populate_judgment_outcomes
-        supabase = MagicMock()
+        supabase = self._make_supabase()
         result = populate_judgment_outcomes(
             supabase, self._make_results(picked=[], not_picked=[])
         )
@@ -89,7 +104,7 @@ class TestPopulateJudgmentOutcomes:
 
     def test_saves_outcome_for_buy_positive_return(self):
         from src.pipeline.review import populate_judgment_outcomes
-        supabase = MagicMock()
+        supabase = self._make_supabase()
         supabase.get_judgment_records.return_value = [
             {"id": "j1", "symbol": "AAPL", "strategy_mode": "conservative", "decision": "buy"}
         ]
@@ -98,15 +113,32 @@ class TestPopulateJudgmentOutcomes:
         )
         count = populate_judgment_outcomes(supabase, results, return_field="5d")
         assert count == 1
-        supabase.save_judgment_outcome.assert_called_once()
-        call_kwargs = supabase.save_judgment_outcome.call_args[1]
+        supabase.save_judgment_outcomes_batch.assert_called_once()
+        (call_kwargs,) = self._saved_outcomes(supabase)
         assert call_kwargs["judgment_id"] == "j1"
         assert call_kwargs["actual_return_5d"] == 5.0
         assert call_kwargs["outcome_aligned"] is True
 
+    def test_outcome_date_uses_batch_clock(self):
+        from datetime import datetime, timezone
+
+        from src.pipeline.review import populate_judgment_outcomes
+
+        supabase = self._make_supabase()
+        supabase.get_judgment_records.return_value = [
+            {"id": "j1", "symbol": "AAPL", "strategy_mode": "conservative", "decision": "buy"}
+        ]
+        results = self._make_results(
+            picked=[{"symbol": "AAPL", "strategy": "conservative", "return_pct": 5.0}]
+        )
+        now = datetime(2025, 1, 6, 23, 59, 59, tzinfo=timezone.utc)
+        populate_judgment_outcomes(supabase, results, return_field="5d", now=now)
+        (call_kwargs,) = self._saved_outcomes(supabase)
+        assert call_kwargs["outcome_date"] == "2025-01-06"
+
     def test_buy_negative_return_not_aligned(self):
         from src.pipeline.review import populate_judgment_outcomes
-        supabase = MagicMock()
+        supabase = self._make_supabase()
         supabase.get_judgment_records.return_value = [
             {"id": "j1", "symbol": "TSLA", "strategy_mode": "aggressive", "decision": "buy"}
         ]
@@ -115,12 +147,12 @@ class TestPopulateJudgmentOutcomes:
         )
         count = populate_judgment_outcomes(supabase, results, return_field="5d")
         assert count == 1
-        call_kwargs = supabase.save_judgment_outcome.call_args[1]
+        (call_kwargs,) = self._saved_outcomes(supabase)
         assert call_kwargs["outcome_aligned"] is False
 
     def test_avoid_negative_return_aligned(self):
         from src.pipeline.review import populate_judgment_outcomes
-        supabase = MagicMock()
+        supabase = self._make_supabase()
         supabase.get_judgment_records.return_value = [
             {"id": "j2", "symbol": "XYZ", "strategy_mode": "conservative", "decision": "avoid"}
         ]
@@ -128,14 +160,14 @@ class TestPopulateJudgmentOutcomes:
             not_picked=[{"symbol": "XYZ", "strategy": "conservative", "return_pct": -5.0}]
         )
         count = populate_judgment_outcomes(supabase, results, return_field="1d")
-        call_kwargs = supabase.save_judgment_outcome.call_args[1]
+        (call_kwargs,) = self._saved_outcomes(supabase)
         assert call_kwargs["outcome_aligned"] is True
         assert call_kwargs["actual_return_1d"] == -5.0
 
     def test_skip_positive_return_not_aligned(self):
         """Skip/hold with positive return = we missed a winner → not aligned."""
         from src.pipeline.review import populate_judgment_outcomes
-        supabase = MagicMock()
+        supabase = self._make_supabase()
         supabase.get_judgment_records.return_value = [
             {"id": "j3", "symbol": "IBM", "strategy_mode": "conservative", "decision": "skip"}
         ]
@@ -143,13 +175,13 @@ class TestPopulateJudgmentOutcomes:
             not_picked=[{"symbol": "IBM", "strategy": "conservative", "return_pct": 1.5}]
         )
         populate_judgment_outcomes(supabase, results)
-        call_kwargs = supabase.save_judgment_outcome.call_args[1]
+        (call_kwargs,) = self._saved_outcomes(supabase)
         assert call_kwargs["outcome_aligned"] is False  # return > 0 → missed winner
 
     def test_skip_negative_return_aligned(self):
         """Skip/hold with negative return = correctly avoided loser → aligned."""
         from src.pipeline.review import populate_judgment_outcomes
-        supabase = MagicMock()
+        supabase = self._make_supabase()
         supabase.get_judgment_records.return_value = [
             {"id": "j4", "symbol": "GME", "strategy_mode": "aggressive", "decision": "skip"}
         ]
@@ -157,12 +189,12 @@ class TestPopulateJudgmentOutcomes:
             not_picked=[{"symbol": "GME", "strategy": "aggressive", "return_pct": -5.0}]
         )
         populate_judgment_outcomes(supabase, results)
-        call_kwargs = supabase.save_judgment_outcome.call_args[1]
+        (call_kwargs,) = self._saved_outcomes(supabase)
         assert call_kwargs["outcome_aligned"] is True  # return < 0 → correct skip
 
     def test_no_matching_judgment_skipped(self):
         from src.pipeline.review import populate_judgment_outcomes
-        supabase = MagicMock()
+        supabase = self._make_supabase()
         supabase.get_judgment_records.return_value = [
             {"id": "j1", "symbol": "MSFT", "strategy_mode": "conservative", "decision": "buy"}
         ]
@@ -171,16 +203,15 @@ class TestPopulateJudgmentOutcomes:
         )
         count = populate_judgment_outcomes(supabase, results)
         assert count == 0
-        supabase.save_judgment_outcome.assert_not_called()
+        supabase.save_judgment_outcomes_batch.assert_not_called()
 
-    def test_save_failure_continues(self):
+    def test_saves_all_outcomes_in_one_batch(self):
         from src.pipeline.review import populate_judgment_outcomes
-        supabase = MagicMock()
+        supabase = self._make_supabase()
         supabase.get_judgment_records.return_value = [
             {"id": "j1", "symbol": "AAPL", "strategy_mode": "conservative", "decision": "buy"},
             {"id": "j2", "symbol": "MSFT", "strategy_mode": "conservative", "decision": "buy"},
         ]
-        supabase.save_judgment_outcome.side_effect = [Exception("DB error"), MagicMock()]
         results = self._make_results(
             picked=[
                 {"symbol": "AAPL", "strategy": "conservative", "return_pct": 2.0},
@@ -188,7 +219,51 @@ class TestPopulateJudgmentOutcomes:
             ]
         )
         count = populate_judgment_outcomes(supabase, results)
-        assert count == 1  # Second one succeeded
+        assert count == 2
+        supabase.save_judgment_outcomes_batch.assert_called_once()
+        assert [o["judgment_id"] for o in self._saved_outcomes(supabase)] == ["j1", "j2"]
+        supabase.save_judgment_outcome.assert_not_called()
+
+    def test_batch_failure_returns_zero(self):
+        from src.pipeline.review import populate_judgment_outcomes
+        supabase = self._make_supabase()
+        supabase.get_judgment_records.return_value = [
+            {"id": "j1", "symbol": "AAPL", "strategy_mode": "conservative", "decision": "buy"},
+        ]
+        supabase.save_judgment_outcomes_batch.side_effect = Exception("DB error")
+        results = self._make_results(
+            picked=[{"symbol": "AAPL", "strategy": "conservative", "return_pct": 2.0}]
+        )
+        assert populate_judgment_outcomes(supabase, results) == 0
+
+    def test_passes_share_one_records_query(self):
+        from src.pipeline.review import populate_judgment_outcomes_for_passes
+        supabase = MagicMock()
+        supabase.save_judgment_outcomes_batch.side_effect = lambda outcomes: len(outcomes)
+        supabase.get_judgment_records.return_value = [
+            {"id": "j1", "batch_date": "2025-01-01", "symbol": "AAPL", "strategy_mode": "conservative", "decision": "buy"},
+            {"id": "j2", "batch_date": "2025-01-05", "symbol": "AAPL", "strategy_mode": "conservative", "decision": "buy"},
+        ]
+        results_5d = self._make_results(
+            picked=[{"symbol": "AAPL", "strategy": "conservative", "return_pct": 4.0}], date="2025-01-01"
+        )
+        results_1d = self._make_results(
+            picked=[{"symbol": "AAPL", "strategy": "conservative", "return_pct": -1.0}], date="2025-01-05"
+        )
+        count = populate_judgment_outcomes_for_passes(
+            supabase, [(results_5d, "5d"), (results_1d, "1d"), ({"error": "No scores found"}, "1d")]
+        )
+        assert count == 2
+        supabase.get_judgment_records.assert_called_once()
+        assert supabase.get_judgment_records.call_args.kwargs["batch_dates"] == ["2025-01-01", "2025-01-05"]
+        saved = {
+            o["judgment_id"]: o
+            for c in supabase.save_judgment_outcomes_batch.call_args_list
+            for o in c.args[0]
+        }
+        assert saved["j1"]["actual_return_5d"] == 4.0
+        assert saved["j2"]["actual_return_1d"] == -1.0
+        assert supabase.save_judgment_outcomes_batch.call_count == 2
 
 
 # ============================================================
@@ -202,10 +277,10 @@ class TestLoadDynamicThresholds:
     def test_returns_thresholds_from_config(self):
         from src.pipeline.scoring import load_dynamic_thresholds
         supabase = MagicMock()
-        supabase.get_scoring_config.side_effect = [
-            {"threshold": "65"},  # v1
-            {"threshold": "80"},  # v2
-        ]
+        supabase.get_scoring_configs_bulk.return_value = {
+            US_MARKET.v1_strategy_mode: {"threshold": "65"},
+            US_MARKET.v2_strategy_mode: {"threshold": "80"},
+        }
         v1, v2 = load_dynamic_thresholds(supabase, US_MARKET)
         assert v1 == 65
         assert v2 == 80
@@ -213,7 +288,7 @@ class TestLoadDynamicThresholds:
     def test_returns_none_on_missing_config(self):
         from src.pipeline.scoring import load_dynamic_thresholds
         supabase = MagicMock()
-        supabase.get_scoring_config.side_effect = [None, None]
+        supabase.get_scoring_configs_bulk.return_value = {}
         v1, v2 = load_dynamic_thresholds(supabase, JP_MARKET)
         assert v1 is None
         assert v2 is None
@@ -221,7 +296,7 @@ class TestLoadDynamicThresholds:
     def test_returns_none_on_exception(self):
         from src.pipeline.scoring import load_dynamic_thresholds
         supabase = MagicMock()
-        supabase.get_scoring_config.side_effect = Exception("DB down")
+        supabase.get_scoring_configs_bulk.side_effect = Exception("DB down")
         v1, v2 = load_dynamic_thresholds(supabase, US_MARKET)
         assert v1 is None
         assert v2 is None
@@ -229,14 +304,22 @@ class TestLoadDynamicThresholds:
     def test_handles_float_threshold(self):
         from src.pipeline.scoring import load_dynamic_thresholds
         supabase = MagicMock()
-        supabase.get_scoring_config.side_effect = [
-            {"threshold": 62.5},
-            {"threshold": 77.8},
-        ]
+        supabase.get_scoring_configs_bulk.return_value = {
+            US_MARKET.v1_strategy_mode: {"threshold": 62.5},
+            US_MARKET.v2_strategy_mode: {"threshold": 77.8},
+        }
         v1, v2 = load_dynamic_thresholds(supabase, US_MARKET)
         assert v1 == 62
         assert v2 == 77
 
+    def test_fetches_both_strategies_in_one_query(self):
+        from src.pipeline.scoring import load_dynamic_thresholds
+        supabase = MagicMock()
+        supabase.get_scoring_configs_bulk.return_value = {}
+        load_dynamic_thresholds(supabase, JP_MARKET)
+        supabase.get_scoring_configs_bulk.assert_called_once_with(JP_MARKET.strategies)
+        supabase.get_scoring_config.assert_not_called()
+
 
 # ============================================================
 # load_factor_weights Tests
@@ -249,10 +332,10 @@ class TestLoadFactorWeights:
     def test_returns_weights_from_config(self):
         from src.pipeline.scoring import load_factor_weights
         supabase = MagicMock()
-        supabase.get_scoring_config.side_effect = [
-            {"factor_weights": {"trend": 0.30, "momentum": 0.40, "value": 0.20, "sentiment": 0.10}},
-            {"factor_weights": {"momentum_12_1": 0.35, "breakout": 0.30, "catalyst": 0.20, "risk_adjusted": 0.15}},
-        ]
+        supabase.get_scoring_configs_bulk.return_value = {
+            US_MARKET.v1_strategy_mode: {"factor_weights": {"trend": 0.30, "momentum": 0.40, "value": 0.20, "sentiment": 0.10}},
+            US_MARKET.v2_strategy_mode: {"factor_weights": {"momentum_12_1": 0.35, "breakout": 0.30, "catalyst": 0.20, "risk_adjusted": 0.15}},
+        }
         v1, v2 = load_factor_weights(supabase, US_MARKET)
         assert v1["trend"] == 0.30
         assert v2["momentum_12_1"] == 0.35
@@ -260,10 +343,9 @@ class TestLoadFactorWeights:
     def test_returns_none_when_no_weights(self):
         from src.pipeline.scoring import load_factor_weights
         supabase = MagicMock()
-        supabase.get_scoring_config.side_effect = [
-            {"threshold": 60},  # No factor_weights key
-            None,
-        ]
+        supabase.get_scoring_configs_bulk.return_value = {
+            JP_MARKET.v1_strategy_mode: {"threshold": 60},  # No factor_weights key
+        }
         v1, v2 = load_factor_weights(supabase, JP_MARKET)
         assert v1 is None
         assert v2 is None
@@ -271,12 +353,121 @@ class TestLoadFactorWeights:
     def test_returns_none_on_exception(self):
         from src.pipeline.scoring import load_factor_weights
         supabase = MagicMock()
-        supabase.get_scoring_config.side_effect = Exception("DB down")
+        supabase.get_scoring_configs_bulk.side_effect = Exception("DB down")
         v1, v2 = load_factor_weights(supabase, US_MARKET)
         assert v1 is None
         assert v2 is None
 
 
+# ============================================================
+# run_llm_judgment_phase Tests
+# ============================================================
+
+
+class TestRunLlmJudgmentPhase:
+    """Tests for run_llm_judgment_phase."""
+
+    def _run(self, ensemble):
+        from src.pipeline.scoring import run_llm_judgment_phase
+        dual_result = MagicMock()
+        dual_result.v1_scores = [MagicMock(symbol="AAPL")]
+        dual_result.v2_scores = [MagicMock(symbol="NVDA")]
+        v1_data = [MagicMock(symbol="AAPL")]
+        v2_data = [MagicMock(symbol="NVDA")]
+
+        with patch("src.pipeline.scoring.config") as mock_config, \
+             patch("src.pipeline.scoring.BatchLogger"), \
+             patch("src.pipeline.scoring.JudgmentService") as mock_service, \
+             patch("src.pipeline.scoring.get_threshold_passed_symbols") as mock_passed, \
+             patch("src.pipeline.scoring._run_strategy_ensemble", side_effect=ensemble):
+            mock_config.llm.enable_judgment = True
+            mock_config.strategy.v2_max_picks = 3
+            mock_service.side_effect = lambda: MagicMock()
+            mock_passed.side_effect = lambda scores, _: {s.symbol for s in scores}
+            v1, v2, _ = run_llm_judgment_phase(
+                dual_result, v1_data, v2_data, 60, 50, "normal",
+                US_MARKET, "2026-01-01", max_picks=5,
+            )
+        return v1, v2, mock_service
+
+    def test_runs_each_strategy_with_its_own_service(self):
+        services = {}
+
+        def ensemble(judgment_service, strategy_mode, candidates, **kwargs):
+            services[strategy_mode] = judgment_service
+            return [sd.symbol for sd, _ in candidates]
+
+        v1, v2, mock_service = self._run(ensemble)
+
+        assert v1 == ["AAPL"]
+        assert v2 == ["NVDA"]
+        assert mock_service.call_count == 2
+        assert services["conservative"] is not services["aggressive"]
+
+    def test_strategy_failure_propagates(self):
+        def ensemble(strategy_mode, **kwargs):
+            if strategy_mode == "aggressive":
+                raise RuntimeError("LLM down")
+            return []
+
+        with pytest.raises(RuntimeError, match="LLM down"):
+            self._run(ensemble)
+
+
+class TestRunShadowRiskAssessments:
+    """Tests for _run_shadow_risk_assessments."""
+
+    def test_keeps_model_order_and_skips_failures(self):
+        from src.pipeline.scoring import _run_shadow_risk_assessments
+
+        def assess(judgment_service, **kwargs):
+            if judgment_service.model_name == "b/broken":
+                raise RuntimeError("timeout")
+            return MagicMock(assessments=[]), [], {}
+
+        with patch("src.pipeline.scoring.config") as mock_config, \
+             patch("src.llm.openai_client.OpenAIClient"), \
+             patch("src.pipeline.scoring.JudgmentService") as mock_service, \
+             patch("src.pipeline.scoring.run_risk_assessment", side_effect=assess):
+            mock_config.llm.enable_shadow_judgment = True
+            mock_config.llm.shadow_models = ["c/third", "b/broken", "a/first"]
+            mock_config.llm.openrouter_api_key = "key"
+            mock_service.side_effect = lambda llm_client, model_name: MagicMock(model_name=model_name)
+
+            results = _run_shadow_risk_assessments(
+                candidates=[], positions=[], strategy_mode="conservative",
+                market_regime_str="normal", today="2026-01-01",
+            )
+
+        assert list(results) == ["c/third", "a/first"]
+
+
+class TestSaveScoringResults:
+    """Tests for save_scoring_results."""
+
+    def test_collects_errors_in_save_order(self):
+        from datetime import datetime, timezone
+
+        from src.pipeline.scoring import save_scoring_results
+
+        supabase = MagicMock()
+        supabase.save_stock_scores.side_effect = RuntimeError("db down")
+        supabase.save_daily_picks_batch.return_value = ([], ["picks failed"])
+        dual_result = MagicMock(
+            v1_scores=[MagicMock(symbol="AAPL")], v2_scores=[],
+            cutoff_timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+
+        errors = save_scoring_results(
+            supabase, "2026-01-01", "normal", dual_result,
+            v1_stocks_data=[], v1_final_picks=["AAPL"], v2_final_picks=[],
+            market_config=US_MARKET,
+        )
+
+        assert errors == ["Failed to save stock scores: db down", "picks failed"]
+        supabase.save_daily_picks_batch.assert_called_once()
+
+
 # ============================================================
 # adjust_thresholds_for_strategies Tests
 # ============================================================
@@ -296,12 +487,12 @@ class TestAdjustThresholdsForStrategies:
         from src.pipeline.review import adjust_thresholds_for_strategies
         supabase = MagicMock()
         adjust_thresholds_for_strategies(supabase, {"error": "No data"}, ["conservative"])
-        supabase.get_scoring_config.assert_not_called()
+        supabase.get_scoring_configs_bulk.assert_not_called()
 
     def test_skips_when_no_config_and_no_create(self):
         from src.pipeline.review import adjust_thresholds_for_strategies
         supabase = MagicMock()
-        supabase.get_scoring_config.return_value = None
+        supabase.get_scoring_configs_bulk.return_value = {}
         # Mock threshold_history and trade_history
         mock_result = MagicMock()
         mock_result.data = []
@@ -318,7 +509,7 @@ class TestAdjustThresholdsForStrategies:
     def test_creates_default_config_when_flagged(self):
         from src.pipeline.review import adjust_thresholds_for_strategies
         supabase = MagicMock()
-        supabase.get_scoring_config.return_value = None
+        supabase.get_scoring_configs_bulk.return_value = {}
 
         # Mock DB queries for threshold_history and trade count
         mock_empty = MagicMock()
@@ -344,3 +535,19 @@ class TestAdjustThresholdsForStrategies:
             )
             # Should insert default config
             supabase._client.table.return_value.insert.assert_called()
+
+    def test_fetches_configs_once_for_all_strategies(self):
+        from src.pipeline.review import adjust_thresholds_for_strategies
+        supabase = MagicMock()
+        supabase.get_scoring_configs_bulk.return_value = {}
+        mock_empty = MagicMock()
+        mock_empty.data = []
+        mock_empty.count = 0
+        supabase._client.table.return_value.select.return_value.order.return_value.limit.return_value.execute.return_value = mock_empty
+        supabase._client.table.return_value.select.return_value.execute.return_value = mock_empty
+
+        adjust_thresholds_for_strategies(
+            supabase, self._make_results(), ["conservative", "aggressive"]
+        )
+        supabase.get_scoring_configs_bulk.assert_called_once_with(["conservative", "aggressive"])
+        supabase.get_scoring_config.assert_not_called()
@@ -4,13 +4,26 @@ Tests for shared pipeline review functions (src/pipeline/review.py).
 Covers:
 - get_current_price: market-aware price fetching (Finnhub + yfinance for US, yfinance-only for JP)
 - calculate_all_returns: return calculation with mock price_fetcher, was_picked logic, rate_limit_sleep
+- calculate_returns_for_passes: several review passes in one sweep
 - log_return_summary: logging for error results, valid results, missed opportunities
+- run_for_strategies: per-strategy fan-out with isolated failures
+- PriceCache: one quote per symbol within and across passes, including concurrent ones
+- strategies_with_returns: strategies touched by return passes
 """
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch, call
 
 from src.pipeline.market_config import MarketConfig, US_MARKET, JP_MARKET
-from src.pipeline.review import get_current_price, calculate_all_returns, log_return_summary
+from src.pipeline.review import (
+    get_current_price,
+    calculate_all_returns,
+    calculate_returns_for_passes,
+    log_return_summary,
+    run_for_strategies,
+    strategies_with_returns,
+    PriceCache,
+)
 
 
 # ============================================================
@@ -168,85 +181,33 @@ class TestCalculateAllReturns:
         Args:
             scores_by_strategy: dict mapping strategy_mode -> list of score dicts
         """
-        def table_side_effect(table_name):
-            mock_table = MagicMock()
-            if table_name == "stock_scores":
-                def select_side_effect(*args):
-                    mock_select = MagicMock()
-                    def eq_batch_date(field, value):
-                        mock_eq1 = MagicMock()
-                        def eq_strategy(field2, value2):
-                            mock_eq2 = MagicMock()
-                            mock_result = MagicMock()
-                            mock_result.data = scores_by_strategy.get(value2, [])
-                            mock_eq2.execute.return_value = mock_result
-                            return mock_eq2
-                        mock_eq1.eq = eq_strategy
-                        return mock_eq1
-                    mock_select.eq = eq_batch_date
-                    return mock_select
-                mock_table.select = select_side_effect
-            elif table_name == "daily_picks":
-                def select_side_effect(*args):
-                    mock_select = MagicMock()
-                    def eq_batch_date(field, value):
-                        mock_eq1 = MagicMock()
-                        def eq_strategy(field2, value2):
-                            mock_eq2 = MagicMock()
-                            mock_result = MagicMock()
-                            mock_result.data = []
-                            mock_eq2.execute.return_value = mock_result
-                            return mock_eq2
-                        mock_eq1.eq = eq_strategy
-                        return mock_eq1
-                    mock_select.eq = eq_batch_date
-                    return mock_select
-                mock_table.select = select_side_effect
-            return mock_table
-        supabase._client.table = table_side_effect
+        self._mock_supabase_with_picks(supabase, scores_by_strategy, {})
 
     def _mock_supabase_with_picks(self, supabase, scores_by_strategy, picks_by_strategy):
-        """Set up mock supabase with both scores and picks data."""
-        def table_side_effect(table_name):
-            mock_table = MagicMock()
-            if table_name == "stock_scores":
-                def select_side_effect(*args):
-                    mock_select = MagicMock()
-                    def eq_batch_date(field, value):
-                        mock_eq1 = MagicMock()
-                        def eq_strategy(field2, value2):
-                            mock_eq2 = MagicMock()
-                            mock_result = MagicMock()
-                            mock_result.data = scores_by_strategy.get(value2, [])
-                            mock_eq2.execute.return_value = mock_result
-                            return mock_eq2
-                        mock_eq1.eq = eq_strategy
-                        return mock_eq1
-                    mock_select.eq = eq_batch_date
-                    return mock_select
-                mock_table.select = select_side_effect
-            elif table_name == "daily_picks":
-                def select_side_effect(*args):
-                    mock_select = MagicMock()
-                    def eq_batch_date(field, value):
-                        mock_eq1 = MagicMock()
-                        def eq_strategy(field2, value2):
-                            mock_eq2 = MagicMock()
-                            mock_result = MagicMock()
-                            symbols = picks_by_strategy.get(value2)
-                            if symbols is not None:
-                                mock_result.data = [{"symbols": symbols}]
-                            else:
-                                mock_result.data = []
-                            mock_eq2.execute.return_value = mock_result
-                            return mock_eq2
-                        mock_eq1.eq = eq_strategy
-                        return mock_eq1
-                    mock_select.eq = eq_batch_date
-                    return mock_select
-                mock_table.select = select_side_effect
-            return mock_table
-        supabase._client.table = table_side_effect
+        """Set up mock supabase with both scores and picks data.
+
+        Mocks get_scores_for_dates / get_picks_for_dates. Score rows without
+        a batch_date are returned for every requested date.
+        """
+        def scores_for(batch_dates, strategy_modes, **kwargs):
+            return [
+                {"batch_date": d, **row}
+                for s in strategy_modes
+                for row in scores_by_strategy.get(s, [])
+                for d in batch_dates
+                if row.get("batch_date", d) == d
+            ]
+
+        def picks_for(batch_dates, strategy_modes):
+            return [
+                {"batch_date": d, "strategy_mode": s, "symbols": picks_by_strategy[s]}
+                for d in batch_dates
+                for s in strategy_modes
+                if picks_by_strategy.get(s) is not None
+            ]
+
+        supabase.get_scores_for_dates.side_effect = scores_for
+        supabase.get_picks_for_dates.side_effect = picks_for
 
     def test_returns_error_when_no_scores_found(self):
         """Returns error dict when no scores exist for the check date."""
@@ -406,6 +367,114 @@ class TestCalculateAllReturns:
         assert mock_sleep.call_count == 2
         mock_sleep.assert_called_with(0.5)
 
+    @patch("src.pipeline.review.time.sleep")
+    def test_symbol_shared_across_strategies_fetched_once(self, mock_sleep):
+        """A symbol scored by both strategies is priced (and throttled) once."""
+        supabase = MagicMock()
+        config = self._make_market_config(rate_limit_sleep=0.5)
+        scores = {
+            "conservative": [
+                {"symbol": "AAPL", "strategy_mode": "conservative", "price_at_time": 100.0, "composite_score": 80},
+            ],
+            "aggressive": [
+                {"symbol": "AAPL", "strategy_mode": "aggressive", "price_at_time": 100.0, "composite_score": 80},
+            ],
+        }
+        self._mock_supabase_scores(supabase, scores)
+        supabase.bulk_update_returns = MagicMock(return_value=2)
+
+        price_fetcher = MagicMock(return_value=110.0)
+        result = calculate_all_returns(price_fetcher, supabase, config, days_ago=5)
+
+        assert result["successful"] == 2
+        price_fetcher.assert_called_once_with("AAPL")
+        assert mock_sleep.call_count == 1
+
+    def test_failed_fetch_is_not_retried_within_pass(self):
+        """A symbol whose lookup fails is counted as failed without a second fetch."""
+        supabase = MagicMock()
+        config = self._make_market_config()
+        scores = {
+            "conservative": [
+                {"symbol": "AAPL", "strategy_mode": "conservative", "price_at_time": 100.0, "composite_score": 80},
+                {"symbol": "MSFT", "strategy_mode": "conservative", "price_at_time": 200.0, "composite_score": 70},
+            ],
+        }
+        self._mock_supabase_scores(supabase, scores)
+        supabase.bulk_update_returns = MagicMock(return_value=1)
+
+        def fetch(symbol):
+            if symbol == "MSFT":
+                raise RuntimeError("quote unavailable")
+            return 110.0
+
+        price_fetcher = MagicMock(side_effect=fetch)
+        result = calculate_all_returns(price_fetcher, supabase, config, days_ago=5)
+
+        assert result["successful"] == 1
+        assert result["failed"] == 1
+        assert price_fetcher.call_count == 2
+
+    def test_price_cache_shared_between_passes(self):
+        """Passing a PriceCache reuses quotes from an earlier pass."""
+        supabase = MagicMock()
+        config = self._make_market_config()
+        scores = {
+            "conservative": [
+                {"symbol": "AAPL", "strategy_mode": "conservative", "price_at_time": 100.0, "composite_score": 80},
+            ],
+        }
+        self._mock_supabase_scores(supabase, scores)
+        supabase.bulk_update_returns = MagicMock(return_value=1)
+
+        fetch = MagicMock(return_value=110.0)
+        price_fetcher = PriceCache(fetch)
+        calculate_all_returns(price_fetcher, supabase, config, days_ago=5, return_field="5d")
+        calculate_all_returns(price_fetcher, supabase, config, days_ago=1, return_field="1d")
+
+        fetch.assert_called_once_with("AAPL")
+
+    def test_batch_fetcher_prefetches_pass(self):
+        """With a batch fetcher, the pass is priced in one call; misses fall back per symbol."""
+        supabase = MagicMock()
+        config = self._make_market_config()
+        scores = {
+            "conservative": [
+                {"symbol": "7203.T", "strategy_mode": "conservative", "price_at_time": 100.0, "composite_score": 80},
+                {"symbol": "6758.T", "strategy_mode": "conservative", "price_at_time": 100.0, "composite_score": 70},
+            ],
+        }
+        self._mock_supabase_scores(supabase, scores)
+        supabase.bulk_update_returns = MagicMock(return_value=2)
+
+        fetch = MagicMock(return_value=95.0)
+        batch = MagicMock(return_value={"7203.T": 110.0})
+        result = calculate_all_returns(PriceCache(fetch, batch_fetcher=batch), supabase, config, days_ago=5)
+
+        batch.assert_called_once_with(["6758.T", "7203.T"])
+        fetch.assert_called_once_with("6758.T")
+        returns = {r["symbol"]: r["return_pct"] for r in result["not_picked_returns"]}
+        assert returns == {"7203.T": 10.0, "6758.T": -5.0}
+
+    def test_aggregate_return_stats(self):
+        """Average return and positive share are computed from the same pass."""
+        supabase = MagicMock()
+        config = self._make_market_config()
+        scores = {
+            "conservative": [
+                {"symbol": "AAPL", "strategy_mode": "conservative", "price_at_time": 100.0, "composite_score": 80},
+                {"symbol": "MSFT", "strategy_mode": "conservative", "price_at_time": 200.0, "composite_score": 70},
+            ],
+        }
+        self._mock_supabase_scores(supabase, scores)
+        supabase.bulk_update_returns = MagicMock(return_value=2)
+
+        prices = {"AAPL": 110.0, "MSFT": 190.0}
+        result = calculate_all_returns(prices.get, supabase, config, days_ago=5)
+
+        assert result["avg_return_pct"] == 2.5
+        assert result["positive_rate"] == 0.5
+
     def test_skips_stock_with_zero_original_price(self):
         """Stocks with price_at_time <= 0 are skipped and counted as failed."""
         supabase = MagicMock()
@@ -430,6 +499,26 @@ class TestCalculateAllReturns:
         assert result["successful"] == 0
         price_fetcher.assert_not_called()
 
+    def test_skips_stock_with_null_original_price(self):
+        """A NULL price_at_time is skipped like a zero price instead of raising."""
+        supabase = MagicMock()
+        config = self._make_market_config()
+        scores = {
+            "conservative": [
+                {"symbol": "BAD", "strategy_mode": "conservative", "price_at_time": None, "composite_score": 50},
+                {"symbol": "AAPL", "strategy_mode": "conservative", "price_at_time": 100.0, "composite_score": 80},
+            ],
+        }
+        self._mock_supabase_scores(supabase, scores)
+        supabase.bulk_update_returns = MagicMock(return_value=1)
+
+        price_fetcher = MagicMock(return_value=110.0)
+        result = calculate_all_returns(price_fetcher, supabase, config, days_ago=5)
+
+        assert result["failed"] == 1
+        assert result["successful"] == 1
+        price_fetcher.assert_called_once_with("AAPL")
+
     def test_skips_stock_when_price_fetcher_returns_none(self):
         """Stocks for which price_fetcher returns None are counted as failed."""
         supabase = MagicMock()
@@ -613,6 +702,115 @@ class TestCalculateAllReturns:
 
         assert result["not_picked_returns"][0]["return_pct"] == -10.0
 
+    def test_check_date_derived_from_now(self):
+        """An explicit `now` pins the check date regardless of the wall clock."""
+        supabase = MagicMock()
+        config = self._make_market_config()
+        self._mock_supabase_scores(supabase, {})
+
+        now = datetime(2025, 3, 10, 23, 59, tzinfo=timezone.utc)
+        result = calculate_all_returns(MagicMock(), supabase, config, days_ago=5, now=now)
+
+        assert result["date"] == "2025-03-05"
+
+
+class TestCalculateReturnsForPasses:
+    """Tests for calculate_returns_for_passes."""
+
+    NOW = datetime(2025, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+    _make_market_config = TestCalculateAllReturns._make_market_config
+    _mock_supabase_scores = TestCalculateAllReturns._mock_supabase_scores
+    _mock_supabase_with_picks = TestCalculateAllReturns._mock_supabase_with_picks
+
+    def test_one_result_per_pass_in_order(self):
+        """Each pass reports its own check date and return field."""
+        supabase = MagicMock()
+        config = self._make_market_config()
+        scores = {
+            "conservative": [
+                {"batch_date": "2025-03-05", "symbol": "AAPL", "strategy_mode": "conservative", "price_at_time": 100.0, "composite_score": 80},
+                {"batch_date": "2025-03-09", "symbol": "MSFT", "strategy_mode": "conservative", "price_at_time": 200.0, "composite_score": 70},
+            ],
+        }
+        self._mock_supabase_scores(supabase, scores)
+        supabase.bulk_update_returns = MagicMock(return_value=2)
+
+        prices = {"AAPL": 110.0, "MSFT": 210.0}
+        results_5d, results_1d = calculate_returns_for_passes(
+            prices.get, supabase, config, [(5, "5d"), (1, "1d")], now=self.NOW,
+        )
+
+        assert results_5d["date"] == "2025-03-05"
+        assert [r["symbol"] for r in results_5d["not_picked_returns"]] == ["AAPL"]
+        assert results_1d["date"] == "2025-03-09"
+        assert [r["symbol"] for r in results_1d["not_picked_returns"]] == ["MSFT"]
+
+        supabase.bulk_update_returns.assert_called_once()
+        updates = supabase.bulk_update_returns.call_args[0][0]
+        assert {(u["symbol"], "return_5d" in u, "return_1d" in u) for u in updates} == {
+            ("AAPL", True, False),
+            ("MSFT", False, True),
+        }
+
+    def test_shared_symbol_fetched_once_across_passes(self):
+        """A symbol scored on both check dates is quoted once."""
+        supabase = MagicMock()
+        config = self._make_market_config()
+        scores = {
+            "conservative": [
+                {"symbol": "AAPL", "strategy_mode": "conservative", "price_at_time": 100.0, "composite_score": 80},
+            ],
+        }
+        self._mock_supabase_scores(supabase, scores)
+        supabase.bulk_update_returns = MagicMock(return_value=2)
+
+        price_fetcher = MagicMock(return_value=105.0)
+        results = calculate_returns_for_passes(
+            price_fetcher, supabase, config, [(5, "5d"), (1, "1d")], now=self.NOW,
+        )
+
+        price_fetcher.assert_called_once_with("AAPL")
+        assert [r["successful"] for r in results] == [1, 1]
+
+    def test_same_row_in_two_passes_gets_one_update(self):
+        """A 1d backfill and the regular 5d pass on the same date merge into one row update."""
+        supabase = MagicMock()
+        config = self._make_market_config()
+        scores = {
+            "conservative": [
+                {"symbol": "AAPL", "strategy_mode": "conservative", "price_at_time": 100.0, "composite_score": 80},
+            ],
+        }
+        self._mock_supabase_scores(supabase, scores)
+        supabase.bulk_update_returns = MagicMock(return_value=1)
+
+        calculate_returns_for_passes(
+            MagicMock(return_value=102.0), supabase, config, [(5, "5d"), (5, "1d")], now=self.NOW,
+        )
+
+        (update,) = supabase.bulk_update_returns.call_args[0][0]
+        assert update["return_5d"] == update["return_1d"] == pytest.approx(2.0)
+
+    def test_missing_date_reports_error_without_blocking_others(self):
+        """A pass with no scores gets an error result; other passes still run."""
+        supabase = MagicMock()
+        config = self._make_market_config()
+        scores = {
+            "conservative": [
+                {"batch_date": "2025-03-05", "symbol": "AAPL", "strategy_mode": "conservative", "price_at_time": 100.0, "composite_score": 80},
+            ],
+        }
+        self._mock_supabase_scores(supabase, scores)
+        supabase.bulk_update_returns = MagicMock(return_value=1)
+
+        results_5d, results_1d = calculate_returns_for_passes(
+            MagicMock(return_value=110.0), supabase, config, [(5, "5d"), (1, "1d")], now=self.NOW,
+        )
+
+        assert results_5d["successful"] == 1
+        assert results_1d == {"error": "No scores found", "date": "2025-03-09"}
+
 
 # ============================================================
 # log_return_summary Tests
@@ -655,6 +853,23 @@ class TestLogReturnSummary:
         assert any("Not picked: 1" in m for m in messages)
         assert any("MISSED OPPORTUNITIES: 0" in m for m in messages)
 
+    def test_logs_aggregate_stats_when_present(self, caplog):
+        """Average return and positive share are logged when calculate_all_returns provides them."""
+        import logging
+        results = {
+            "successful": 2,
+            "picked_returns": [],
+            "not_picked_returns": [],
+            "missed_opportunities": [],
+            "avg_return_pct": 2.5,
+            "positive_rate": 0.5,
+        }
+
+        with caplog.at_level(logging.INFO, logger="src.pipeline.review"):
+            log_return_summary(results)
+
+        assert any("Avg return: +2.50%, positive: 50%" in r.message for r in caplog.records)
+
     def test_logs_missed_opportunities_warning(self, caplog):
         """When missed opportunities exist, logs them as warnings with details."""
         import logging
@@ -734,3 +949,96 @@ class TestLogReturnSummary:
 
         messages = [r.message for r in caplog.records]
         assert any("Total reviewed: 0" in m for m in messages)
+
+
+# ============================================================
+# run_for_strategies
+# ============================================================
+
+
+class TestRunForStrategies:
+    """Tests for run_for_strategies."""
+
+    def test_returns_result_per_strategy(self):
+        """Each strategy maps to its callable's return value."""
+        results = run_for_strategies(lambda s: s.upper(), ["jp_v1", "jp_v2"], label="test")
+
+        assert results == {"jp_v1": "JP_V1", "jp_v2": "JP_V2"}
+
+    def test_failure_is_isolated(self, caplog):
+        """A failing strategy is logged and recorded as None; others still complete."""
+        import logging
+
+        def func(strategy):
+            if strategy == "bad":
+                raise RuntimeError("boom")
+            return 1
+
+        with caplog.at_level(logging.ERROR, logger="src.pipeline.review"):
+            results = run_for_strategies(func, ["good", "bad"], label="Snapshot update")
+
+        assert results == {"good": 1, "bad": None}
+        assert any("Snapshot update failed for bad: boom" in r.message for r in caplog.records)
+
+    def test_empty_strategies(self):
+        """No strategies returns an empty dict without spawning workers."""
+        assert run_for_strategies(lambda s: s, [], label="test") == {}
+
+
+# ============================================================
+# PriceCache
+# ============================================================
+
+
+class TestPriceCache:
+    """Tests for PriceCache concurrency."""
+
+    def test_concurrent_passes_fetch_each_symbol_once(self):
+        """Passes on separate threads share lookups instead of racing for them."""
+        import threading
+        import time
+
+        calls = []
+
+        def fetch(symbol):
+            calls.append(symbol)
+            time.sleep(0.01)
+            return 100.0
+
+        cache = PriceCache(fetch)
+        symbols = ["AAPL", "MSFT", "NVDA"]
+        threads = [threading.Thread(target=cache.fetch_many, args=(symbols,)) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(calls) == symbols
+        assert cache.get("NVDA") == 100.0
+
+
+# ============================================================
+# strategies_with_returns
+# ============================================================
+
+
+class TestStrategiesWithReturns:
+    """Tests for strategies_with_returns."""
+
+    def test_collects_strategies_across_passes(self):
+        """Picked and not-picked entries from every pass count; error results are ignored."""
+        results_5d = {
+            "picked_returns": [{"symbol": "AAPL", "strategy": "conservative"}],
+            "not_picked_returns": [],
+        }
+        backfill = {
+            "picked_returns": [],
+            "not_picked_returns": [{"symbol": "TSLA", "strategy": "aggressive"}],
+        }
+        missing = {"error": "No scores found", "date": "2025-01-04"}
+
+        assert strategies_with_returns(results_5d, backfill, missing) == {"conservative", "aggressive"}
+
+    def test_no_data_is_empty(self):
+        """A pass with no scores leaves every strategy untouched."""
+        assert strategies_with_returns({"error": "No scores found"}) == set()
@@ -9,6 +9,7 @@ Covers:
 - Portfolio snapshot calculation (daily PnL, cumulative PnL, S&P 500 alpha)
 - Drawdown status thresholds
 - Position size calculation
+- Current price caching and batched prefetch
 """
 from __future__ import annotations
 
@@ -737,3 +738,44 @@ class TestTransactionCostIntegration:
         supabase = MagicMock()
         manager = PortfolioManager(supabase=supabase)
         assert manager._txn_costs is None
+
+
+# ===========================================================================
+# Current Price Lookup
+# ===========================================================================
+
+
+class TestCurrentPrice:
+    """Tests for get_current_price caching and prefetch_prices."""
+
+    def test_price_cached_after_first_lookup(self):
+        """A second lookup for the same symbol reuses the first quote."""
+        manager = _make_manager()
+        manager.finnhub.get_quote.return_value = MagicMock(current_price=150.0)
+
+        assert manager.get_current_price("AAPL") == 150.0
+        assert manager.get_current_price("AAPL") == 150.0
+        manager.finnhub.get_quote.assert_called_once_with("AAPL")
+
+    def test_prefetch_uses_batch_download_without_finnhub(self):
+        """JP managers quote positions in one batch; misses fall back per symbol."""
+        supabase = MagicMock()
+        yfinance = MagicMock()
+        yfinance.get_prices_batch.return_value = {"7203.T": 2500.0}
+        yfinance.get_quote.return_value = MagicMock(current_price=1200.0)
+        manager = PortfolioManager(supabase=supabase, yfinance=yfinance, market_config=JP_MARKET)
+
+        manager.prefetch_prices(["7203.T", "6758.T", "7203.T"])
+
+        yfinance.get_prices_batch.assert_called_once_with(["6758.T", "7203.T"])
+        assert manager.get_current_price("7203.T") == 2500.0
+        assert manager.get_current_price("6758.T") == 1200.0
+        yfinance.get_quote.assert_called_once_with("6758.T")
+
+    def test_prefetch_skipped_when_finnhub_is_primary(self):
+        """US managers keep Finnhub as the primary quote source."""
+        manager = _make_manager()
+
+        manager.prefetch_prices(["AAPL"])
+
+        manager.yfinance.get_prices_batch.assert_not_called()
@@ -0,0 +1,118 @@
+"""Tests for the reflection LLM response cache (src/reflection/service.py).
+
+Covers:
+- Cache hit, miss and unreadable entries
+- Expiry of old entries on load and pruning on save
+- ReflectionService only writing the cache on a miss
+"""
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import src.reflection.service as service
+from src.reflection.service import (
+    LLM_CACHE_MAX_AGE,
+    ReflectionService,
+    _llm_cache_key,
+    _load_cached_response,
+    _save_cached_response,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(service, "LLM_CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def _age_entry(path, age: timedelta) -> None:
+    """Backdate a cache entry's mtime by age."""
+    mtime = (datetime.now(timezone.utc) - age).timestamp()
+    os.utime(path, (mtime, mtime))
+
+
+class TestCacheEntries:
+    """Tests for the load/save helpers."""
+
+    def test_miss_returns_none(self):
+        assert _load_cached_response("missing") is None
+
+    def test_saved_response_is_hit(self, cache_dir):
+        _save_cached_response("k1", "reflection text")
+
+        assert _load_cached_response("k1") == "reflection text"
+        assert not list(cache_dir.glob("*.tmp"))
+
+    def test_unreadable_entry_is_miss(self, cache_dir):
+        (cache_dir / "bad.json").write_text("{not json")
+        (cache_dir / "nokey.json").write_text(json.dumps({"other": 1}))
+
+        assert _load_cached_response("bad") is None
+        assert _load_cached_response("nokey") is None
+
+    def test_expired_entry_is_deleted_on_load(self, cache_dir):
+        _save_cached_response("old", "stale")
+        _age_entry(cache_dir / "old.json", LLM_CACHE_MAX_AGE + timedelta(minutes=1))
+
+        assert _load_cached_response("old") is None
+        assert not (cache_dir / "old.json").exists()
+
+    def test_save_prunes_expired_entries(self, cache_dir):
+        _save_cached_response("old", "stale")
+        _save_cached_response("recent", "fresh")
+        _age_entry(cache_dir / "old.json", LLM_CACHE_MAX_AGE + timedelta(minutes=1))
+
+        _save_cached_response("new", "latest")
+
+        assert sorted(p.stem for p in cache_dir.glob("*.json")) == ["new", "recent"]
+
+    def test_key_depends_on_model_and_prompt(self):
+        assert _llm_cache_key("m1", "p") != _llm_cache_key("m2", "p")
+        assert _llm_cache_key("m1", "p") != _llm_cache_key("m1", "q")
+
+
+class TestReflectionServiceCache:
+    """Tests for cache use in ReflectionService._run_reflection."""
+
+    def _make_service(self):
+        svc = ReflectionService.__new__(ReflectionService)
+        svc.model_name = "test-model"
+        svc.llm_client = MagicMock()
+        svc.llm_client.generate.return_value = MagicMock(content="llm output")
+        svc.supabase = MagicMock()
+        svc._collect_judgments_with_outcomes = MagicMock(return_value=[MagicMock()])
+        svc._calculate_performance_summary = MagicMock(return_value={})
+        svc._judgment_to_dict = MagicMock(return_value={})
+        svc._parse_reflection_response = MagicMock(
+            return_value=MagicMock(accuracy_rate=0.5, suggestions=[])
+        )
+        svc._save_reflection = MagicMock()
+        return svc
+
+    def _run(self, svc):
+        end = datetime(2026, 1, 10)
+        with patch("src.reflection.service.build_reflection_prompt", return_value="prompt"):
+            return svc._run_reflection("conservative", "weekly", end - timedelta(days=7), end)
+
+    def test_miss_calls_llm_and_writes_cache(self, cache_dir):
+        svc = self._make_service()
+
+        self._run(svc)
+
+        svc.llm_client.generate.assert_called_once()
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_hit_skips_llm_and_does_not_rewrite(self):
+        svc = self._make_service()
+        self._run(svc)
+        svc.llm_client.generate.reset_mock()
+
+        with patch("src.reflection.service._save_cached_response") as mock_save:
+            result = self._run(svc)
+
+        svc.llm_client.generate.assert_not_called()
+        mock_save.assert_not_called()
+        assert result.raw_llm_response == "llm output"
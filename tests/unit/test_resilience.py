@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, patch, PropertyMock
 
 from src.pipeline.review import (
     get_unprocessed_outcome_dates,
+    get_unprocessed_outcome_dates_multi,
     check_batch_gap,
 )
 
@@ -224,6 +225,41 @@ class TestGetUnprocessedOutcomeDates:
         assert result == ["2026-02-01", "2026-02-02", "2026-02-03"]
 
 
+class TestGetUnprocessedOutcomeDatesMulti:
+    """Test the single-query variant covering several return fields."""
+
+    def test_partitions_one_query_by_field_and_age(self):
+        """One join query serves both fields; rows newer than a field's min age are ignored."""
+        today = datetime.now(timezone.utc).date()
+        recent = (today - timedelta(days=2)).isoformat()
+        older = (today - timedelta(days=7)).isoformat()
+
+        supabase = MagicMock()
+        supabase._client.table.return_value.select.return_value.gte.return_value.lte.return_value.execute.return_value.data = [
+            {"id": "j1", "batch_date": older, "judgment_outcomes": [{"actual_return_1d": 1.0, "actual_return_5d": None}]},
+            {"id": "j2", "batch_date": recent, "judgment_outcomes": []},
+        ]
+
+        result = get_unprocessed_outcome_dates_multi(
+            supabase, min_age_days_by_field={"5d": 5, "1d": 1}
+        )
+
+        assert result == {"5d": [older], "1d": [recent]}
+        supabase._client.table.assert_called_once_with("judgment_records")
+        lte = supabase._client.table.return_value.select.return_value.gte.return_value.lte
+        lte.assert_called_once_with("batch_date", (today - timedelta(days=1)).isoformat())
+
+    def test_handles_exception_gracefully(self):
+        """Every requested field maps to an empty list on DB error."""
+        supabase = MagicMock()
+        supabase._client.table.side_effect = Exception("DB error")
+
+        result = get_unprocessed_outcome_dates_multi(
+            supabase, min_age_days_by_field={"5d": 5, "1d": 1}
+        )
+        assert result == {"5d": [], "1d": []}
+
+
 # ─── Batch gap detection tests ──────────────────
 
 
@@ -0,0 +1,146 @@
+"""Tests for the daily scoring checkpoint (scripts/daily_scoring.py).
+
+Covers:
+- Snapshot + NDJSON log replay on load
+- Torn last line and corruption ratio handling
+- Staleness check and clearing of both files
+"""
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import scripts.daily_scoring as daily_scoring
+from scripts.daily_scoring import (
+    BatchCheckpoint,
+    append_checkpoint_records,
+    clear_checkpoint,
+    get_checkpoint_log_path,
+    get_checkpoint_path,
+    load_checkpoint,
+    save_checkpoint,
+)
+
+BATCH_DATE = "2026-01-05"
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(daily_scoring, "CHECKPOINT_DIR", tmp_path)
+    return tmp_path
+
+
+def _ok(symbol):
+    return {"symbol": symbol, "status": "ok", "v1": {"symbol": symbol}, "v2": {"symbol": symbol}}
+
+
+def _fail(symbol):
+    return {"symbol": symbol, "status": "fail"}
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+class TestLoadCheckpoint:
+    """Tests for load_checkpoint with the snapshot and log."""
+
+    def test_no_files_returns_none(self):
+        assert load_checkpoint(BATCH_DATE) is None
+
+    def test_log_only_is_replayed(self):
+        append_checkpoint_records(BATCH_DATE, [_ok("AAPL"), _fail("MSFT")])
+
+        checkpoint = load_checkpoint(BATCH_DATE, now=_now())
+
+        assert checkpoint.processed_symbols == ["AAPL", "MSFT"]
+        assert checkpoint.failed_symbols == ["MSFT"]
+        assert checkpoint.v1_stock_data == {"AAPL": {"symbol": "AAPL"}}
+        assert checkpoint.is_processed("MSFT")
+
+    def test_log_replayed_on_top_of_snapshot(self):
+        checkpoint = BatchCheckpoint(batch_date=BATCH_DATE, earnings_symbols=["NVDA"])
+        checkpoint.apply_record(_ok("AAPL"))
+        save_checkpoint(checkpoint)
+        # A record already in the snapshot is ignored on replay
+        append_checkpoint_records(BATCH_DATE, [_fail("AAPL"), _ok("GOOG")])
+
+        loaded = load_checkpoint(BATCH_DATE, now=_now())
+
+        assert loaded.processed_symbols == ["AAPL", "GOOG"]
+        assert loaded.failed_symbols == []
+        assert loaded.earnings_symbols == ["NVDA"]
+
+    def test_save_checkpoint_drops_log(self):
+        append_checkpoint_records(BATCH_DATE, [_ok("AAPL")])
+        checkpoint = load_checkpoint(BATCH_DATE, now=_now())
+
+        save_checkpoint(checkpoint)
+
+        assert get_checkpoint_path(BATCH_DATE).exists()
+        assert not get_checkpoint_log_path(BATCH_DATE).exists()
+        assert load_checkpoint(BATCH_DATE, now=_now()).processed_symbols == ["AAPL"]
+
+    def test_torn_last_line_is_dropped(self):
+        append_checkpoint_records(BATCH_DATE, [_ok(f"S{i}") for i in range(3)])
+        with open(get_checkpoint_log_path(BATCH_DATE), "a") as f:
+            f.write('{"symbol": "TORN", "sta')
+
+        checkpoint = load_checkpoint(BATCH_DATE, now=_now())
+
+        assert checkpoint.processed_symbols == ["S0", "S1", "S2"]
+
+    def test_append_after_torn_line_starts_new_line(self):
+        append_checkpoint_records(BATCH_DATE, [_ok(f"S{i}") for i in range(10)])
+        with open(get_checkpoint_log_path(BATCH_DATE), "a") as f:
+            f.write('{"symbol": "TORN"')
+        append_checkpoint_records(BATCH_DATE, [_ok("LAST")])
+
+        checkpoint = load_checkpoint(BATCH_DATE, now=_now())
+
+        # The torn fragment is not glued onto the next record; it becomes one
+        # malformed line (1 of 12, under the corruption ratio)
+        assert len(checkpoint.processed_symbols) == 11
+        assert checkpoint.is_processed("LAST")
+
+    def test_few_malformed_lines_are_skipped(self):
+        records = [_ok(f"S{i}") for i in range(20)]
+        append_checkpoint_records(BATCH_DATE, records[:10])
+        with open(get_checkpoint_log_path(BATCH_DATE), "a") as f:
+            f.write("not json\n")
+        append_checkpoint_records(BATCH_DATE, records[10:])
+
+        checkpoint = load_checkpoint(BATCH_DATE, now=_now())
+
+        assert len(checkpoint.processed_symbols) == 20
+
+    def test_too_many_malformed_lines_ignores_log(self):
+        append_checkpoint_records(BATCH_DATE, [_ok("AAPL"), _ok("MSFT")])
+        with open(get_checkpoint_log_path(BATCH_DATE), "a") as f:
+            f.write("not json\n" + json.dumps({"status": "ok"}) + "\n")
+        append_checkpoint_records(BATCH_DATE, [_ok("GOOG")])
+
+        assert load_checkpoint(BATCH_DATE, now=_now()) is None
+
+    def test_stale_checkpoint_is_cleared(self):
+        append_checkpoint_records(BATCH_DATE, [_ok("AAPL")])
+        save_checkpoint(load_checkpoint(BATCH_DATE, now=_now()))
+
+        later = _now() + daily_scoring.CHECKPOINT_MAX_AGE + timedelta(minutes=1)
+
+        assert load_checkpoint(BATCH_DATE, now=later) is None
+        assert not get_checkpoint_path(BATCH_DATE).exists()
+
+
+class TestClearCheckpoint:
+    """Tests for clear_checkpoint."""
+
+    def test_removes_snapshot_and_log(self):
+        save_checkpoint(BatchCheckpoint(batch_date=BATCH_DATE))
+        append_checkpoint_records(BATCH_DATE, [_ok("AAPL")])
+
+        clear_checkpoint(BATCH_DATE)
+
+        assert not get_checkpoint_path(BATCH_DATE).exists()
+        assert not get_checkpoint_log_path(BATCH_DATE).exists()
+        assert load_checkpoint(BATCH_DATE) is None
@@ -3,16 +3,21 @@ Tests for SupabaseClient (src/data/supabase_client.py).
 
 Covers:
 - get_scoring_config: normal return, None data, exception logging
+- get_scoring_configs_bulk: single in_() query keyed by strategy_mode
+- scoring_config cache: repeat reads served in-process, invalidated on writes
+- save_judgment_outcomes_batch: chunked upsert, per-row fallback on chunk failure
+- bulk_update_returns: per-row updates without returned representations
 - save_daily_picks_batch: batch save with market_type, delete_existing, error collection
 - save_stock_scores: market_type inclusion/exclusion in upsert data
 - get_unreviewed_batch: returns unreviewed batch, fallback on missing column
+- get_scores_for_dates / get_picks_for_dates: IN filters, paging past the row cap
 """
 
 import logging
 import pytest
 from unittest.mock import MagicMock, patch, call
 
-from src.data.supabase_client import DailyPick, StockScore, SupabaseClient
+from src.data.supabase_client import QUERY_PAGE_SIZE, DailyPick, StockScore, SupabaseClient
 
 
 # ─── Helpers ──────────────────────────────────────────────────
@@ -143,6 +148,145 @@ class TestGetScoringConfig:
             assert "No rows" in logged_msg
 
 
+@patch("src.data.supabase_client.config")
+@patch("src.data.supabase_client.create_client")
+class TestGetScoringConfigsBulk:
+    """Tests for SupabaseClient.get_scoring_configs_bulk()."""
+
+    def test_returns_configs_keyed_by_strategy(self, mock_create_client, mock_config_module):
+        """One in_() query; rows are keyed by strategy_mode."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        rows = [
+            {"strategy_mode": "jp_conservative", "threshold": 60},
+            {"strategy_mode": "jp_aggressive", "threshold": 75},
+        ]
+        mock_sb.table.return_value.select.return_value.in_.return_value \
+            .execute.return_value.data = rows
+
+        result = client.get_scoring_configs_bulk(["jp_conservative", "jp_aggressive"])
+
+        assert result == {
+            "jp_conservative": rows[0],
+            "jp_aggressive": rows[1],
+        }
+        mock_sb.table.return_value.select.return_value.in_.assert_called_once_with(
+            "strategy_mode", ["jp_conservative", "jp_aggressive"]
+        )
+
+    def test_exception_returns_empty(self, mock_create_client, mock_config_module):
+        """Query failure is logged and yields an empty mapping."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        mock_sb.table.return_value.select.return_value.in_.return_value \
+            .execute.side_effect = Exception("DB down")
+
+        assert client.get_scoring_configs_bulk(["conservative"]) == {}
+
+
+@patch("src.data.supabase_client.config")
+@patch("src.data.supabase_client.create_client")
+class TestScoringConfigCache:
+    """Tests for the in-process scoring_config cache."""
+
+    def test_repeat_read_is_served_from_cache(self, mock_create_client, mock_config_module):
+        """A second get_scoring_config for the same strategy issues no query."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        single = mock_sb.table.return_value.select.return_value.eq.return_value.single
+        single.return_value.execute.return_value.data = {"threshold": 60.0}
+
+        assert client.get_scoring_config("conservative") == {"threshold": 60.0}
+        assert client.get_scoring_config("conservative") == {"threshold": 60.0}
+        assert single.return_value.execute.call_count == 1
+
+    def test_bulk_read_populates_cache(self, mock_create_client, mock_config_module):
+        """Rows from get_scoring_configs_bulk satisfy later single reads."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        row = {"strategy_mode": "jp_conservative", "threshold": 60}
+        mock_sb.table.return_value.select.return_value.in_.return_value \
+            .execute.return_value.data = [row]
+
+        client.get_scoring_configs_bulk(["jp_conservative"])
+
+        assert client.get_scoring_config("jp_conservative") == row
+        mock_sb.table.return_value.select.return_value.eq.assert_not_called()
+
+    def test_update_threshold_invalidates(self, mock_create_client, mock_config_module):
+        """update_threshold drops the cached row so the next read refetches."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        single = mock_sb.table.return_value.select.return_value.eq.return_value.single
+        single.return_value.execute.return_value.data = {"threshold": 60.0}
+        client.get_scoring_config("conservative")
+
+        client.update_threshold("conservative", 62.0, "test")
+        single.return_value.execute.return_value.data = {"threshold": 62.0}
+
+        assert client.get_scoring_config("conservative") == {"threshold": 62.0}
+        assert single.return_value.execute.call_count == 2
+
+    def test_mutating_returned_config_does_not_change_cache(
+        self, mock_create_client, mock_config_module
+    ):
+        """Changes to a returned row (e.g. unsaved weights) never reach later reads."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        single = mock_sb.table.return_value.select.return_value.eq.return_value.single
+        single.return_value.execute.return_value.data = {
+            "threshold": 60.0,
+            "factor_weights": {"trend": 0.35},
+        }
+
+        first = client.get_scoring_config("conservative")
+        first["factor_weights"]["trend"] = 0.9
+        second = client.get_scoring_config("conservative")
+        second["threshold"] = 70.0
+
+        assert client.get_scoring_config("conservative") == {
+            "threshold": 60.0,
+            "factor_weights": {"trend": 0.35},
+        }
+        assert single.return_value.execute.call_count == 1
+
+    def test_mutating_bulk_config_does_not_change_cache(
+        self, mock_create_client, mock_config_module
+    ):
+        """Rows returned by the bulk read are not the cached objects."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        mock_sb.table.return_value.select.return_value.in_.return_value \
+            .execute.return_value.data = [
+                {"strategy_mode": "conservative", "factor_weights": {"trend": 0.35}},
+            ]
+
+        rows = client.get_scoring_configs_bulk(["conservative"])
+        rows["conservative"]["factor_weights"]["trend"] = 0.9
+
+        assert client.get_scoring_config("conservative")["factor_weights"] == {"trend": 0.35}
+
+    def test_empty_result_not_cached(self, mock_create_client, mock_config_module):
+        """A missing row is refetched, so a freshly inserted default is seen."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        single = mock_sb.table.return_value.select.return_value.eq.return_value.single
+        single.return_value.execute.return_value.data = None
+
+        client.get_scoring_config("jp_aggressive")
+        client.get_scoring_config("jp_aggressive")
+
+        assert single.return_value.execute.call_count == 2
+
+
 # ============================================================
 # save_daily_picks_batch
 # ============================================================
@@ -179,17 +323,11 @@ class TestSaveDailyPicksBatch:
         mock_sb.table.return_value.delete.return_value.eq.return_value \
             .in_.return_value.execute.return_value.data = []
 
-        # Mock upsert for each save_daily_picks call
+        # Both picks go out in a single upsert
         saved_record_1 = {"id": "1", "strategy_mode": "conservative"}
         saved_record_2 = {"id": "2", "strategy_mode": "aggressive"}
         mock_sb.table.return_value.upsert.return_value.execute.return_value \
-            .data = [saved_record_1]
-
-        # We need to return different data for successive calls
-        mock_sb.table.return_value.upsert.return_value.execute.side_effect = [
-            MagicMock(data=[saved_record_1]),
-            MagicMock(data=[saved_record_2]),
-        ]
+            .data = [saved_record_1, saved_record_2]
 
         with patch("src.data.supabase_client.logger", create=True):
             saved, errors = client.save_daily_picks_batch([pick1, pick2])
@@ -198,6 +336,33 @@ class TestSaveDailyPicksBatch:
         assert errors == []
         assert saved[0] == saved_record_1
         assert saved[1] == saved_record_2
+        mock_sb.table.return_value.upsert.assert_called_once()
+        rows = mock_sb.table.return_value.upsert.call_args[0][0]
+        assert [r["strategy_mode"] for r in rows] == ["conservative", "aggressive"]
+        assert all(r["market_type"] == "us" for r in rows)
+
+    def test_bulk_failure_falls_back_to_per_pick(
+        self, mock_create_client, mock_config_module
+    ):
+        """A failed bulk upsert is retried per pick so only the bad pick errors."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        pick1 = _make_daily_pick(strategy_mode="conservative")
+        pick2 = _make_daily_pick(strategy_mode="aggressive")
+        saved_record_1 = {"id": "1", "strategy_mode": "conservative"}
+        mock_sb.table.return_value.upsert.return_value.execute.side_effect = [
+            Exception("bulk rejected"),
+            MagicMock(data=[saved_record_1]),
+            Exception("bad aggressive row"),
+        ]
+
+        with patch.object(client, "delete_daily_picks_for_date", return_value=0):
+            saved, errors = client.save_daily_picks_batch([pick1, pick2])
+
+        assert saved == [saved_record_1]
+        assert len(errors) == 1
+        assert "aggressive" in errors[0]
 
     def test_delete_existing_false_skips_deletion(
         self, mock_create_client, mock_config_module
@@ -439,6 +604,25 @@ class TestSaveStockScores:
 
         upsert_kwargs = mock_sb.table.return_value.upsert.call_args[1]
         assert upsert_kwargs["on_conflict"] == "batch_date,symbol,strategy_mode"
+        assert upsert_kwargs["returning"] == "representation"
+
+    def test_minimal_returning_passed_through(
+        self, mock_create_client, mock_config_module
+    ):
+        """returning="minimal" is forwarded so the rows are not echoed back."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        mock_sb.table.return_value.upsert.return_value.execute.return_value \
+            .data = []
+
+        result = client.save_stock_scores(
+            [_make_stock_score()], returning="minimal",
+        )
+
+        upsert_kwargs = mock_sb.table.return_value.upsert.call_args[1]
+        assert upsert_kwargs["returning"] == "minimal"
+        assert result == []
 
 
 # ============================================================
@@ -540,3 +724,194 @@ class TestGetUnreviewedBatch:
 
         with pytest.raises(Exception, match="Network timeout"):
             client.get_unreviewed_batch("conservative")
+
+
+# ============================================================
+# save_judgment_outcomes_batch
+# ============================================================
+
+
+@patch("src.data.supabase_client.config")
+@patch("src.data.supabase_client.create_client")
+class TestSaveJudgmentOutcomesBatch:
+    """Tests for SupabaseClient.save_judgment_outcomes_batch()."""
+
+    def _outcomes(self, n):
+        return [
+            {"judgment_id": f"j{i}", "outcome_date": "2025-06-06", "actual_return_5d": 1.23456}
+            for i in range(n)
+        ]
+
+    def test_upserts_in_chunks(self, mock_create_client, mock_config_module):
+        """Rows are sent in chunk_size slices with the judgment/date conflict key."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        saved = client.save_judgment_outcomes_batch(self._outcomes(5), chunk_size=2)
+
+        assert saved == 5
+        upsert = mock_sb.table.return_value.upsert
+        assert [len(c[0][0]) for c in upsert.call_args_list] == [2, 2, 1]
+        first_row = upsert.call_args_list[0][0][0][0]
+        assert first_row == {
+            "judgment_id": "j0",
+            "outcome_date": "2025-06-06",
+            "actual_return_5d": 1.2346,
+        }
+        assert upsert.call_args_list[0][1]["on_conflict"] == "judgment_id,outcome_date"
+
+    def test_failed_chunk_falls_back_to_single_rows(
+        self, mock_create_client, mock_config_module
+    ):
+        """A failing chunk is retried per row; only the bad row is lost."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        def upsert_side_effect(payload, **kwargs):
+            query = MagicMock()
+            bad = isinstance(payload, list) or payload["judgment_id"] == "j1"
+            if bad:
+                query.execute.side_effect = Exception("constraint violation")
+            return query
+
+        mock_sb.table.return_value.upsert.side_effect = upsert_side_effect
+
+        saved = client.save_judgment_outcomes_batch(self._outcomes(3))
+
+        assert saved == 2
+
+    def test_empty_input_makes_no_requests(self, mock_create_client, mock_config_module):
+        """No outcomes means no upsert calls."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        assert client.save_judgment_outcomes_batch([]) == 0
+        mock_sb.table.return_value.upsert.assert_not_called()
+
+
+# ============================================================
+# bulk_update_returns
+# ============================================================
+
+
+@patch("src.data.supabase_client.config")
+@patch("src.data.supabase_client.create_client")
+class TestBulkUpdateReturns:
+    """Tests for SupabaseClient.bulk_update_returns()."""
+
+    def test_single_upsert_with_minimal_return(self, mock_create_client, mock_config_module):
+        """Rows setting the same columns go out in one upsert without echoing rows back."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        updates = [
+            {"batch_date": "2025-06-01", "symbol": "AAPL", "strategy_mode": "conservative", "return_5d": 1.5},
+            {"batch_date": "2025-06-01", "symbol": "MSFT", "strategy_mode": "conservative", "return_5d": -0.5},
+        ]
+
+        assert client.bulk_update_returns(updates) == 2
+
+        upsert = mock_sb.table.return_value.upsert
+        upsert.assert_called_once()
+        rows = upsert.call_args.args[0]
+        assert [r["symbol"] for r in rows] == ["AAPL", "MSFT"]
+        assert upsert.call_args.kwargs["on_conflict"] == "batch_date,symbol,strategy_mode"
+        assert upsert.call_args.kwargs["returning"] == "minimal"
+        mock_sb.table.return_value.update.assert_not_called()
+
+    def test_rows_grouped_by_columns(self, mock_create_client, mock_config_module):
+        """A picked row is upserted apart so unpicked rows never send was_picked."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+
+        updates = [
+            {"batch_date": "2025-06-01", "symbol": "AAPL", "strategy_mode": "conservative", "return_5d": 1.5, "was_picked": True},
+            {"batch_date": "2025-06-01", "symbol": "MSFT", "strategy_mode": "conservative", "return_5d": -0.5, "was_picked": False},
+        ]
+
+        assert client.bulk_update_returns(updates) == 2
+
+        batches = [c.args[0] for c in mock_sb.table.return_value.upsert.call_args_list]
+        assert len(batches) == 2
+        assert all(len({tuple(sorted(r)) for r in batch}) == 1 for batch in batches)
+        assert not any("was_picked" in r for batch in batches for r in batch if r["symbol"] == "MSFT")
+
+    def test_failed_chunk_falls_back_to_row_updates(self, mock_create_client, mock_config_module):
+        """A rejected upsert is retried as per-row updates."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+        mock_sb.table.return_value.upsert.return_value.execute.side_effect = Exception("payload too large")
+
+        updates = [
+            {"batch_date": "2025-06-01", "symbol": "AAPL", "strategy_mode": "conservative", "return_1d": 0.4},
+            {"batch_date": "2025-06-01", "symbol": "MSFT", "strategy_mode": "conservative", "return_1d": 0.2},
+        ]
+
+        assert client.bulk_update_returns(updates) == 2
+        assert mock_sb.table.return_value.update.call_count == 2
+
+
+# ============================================================
+# get_scores_for_dates / get_picks_for_dates
+# ============================================================
+
+
+@patch("src.data.supabase_client.config")
+@patch("src.data.supabase_client.create_client")
+class TestScoresAndPicksForDates:
+    """Tests for the multi-date stock_scores / daily_picks readers."""
+
+    def test_scores_filter_dates_and_strategies(self, mock_create_client, mock_config_module):
+        """One query filters both dates and strategy modes with IN."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+        select = mock_sb.table.return_value.select
+        ordered = select.return_value.in_.return_value.in_.return_value.order.return_value
+        ordered.range.return_value.execute.return_value.data = [
+            {"batch_date": "2025-06-01", "symbol": "AAPL"},
+        ]
+
+        rows = client.get_scores_for_dates(["2025-06-01"], ["conservative", "aggressive"], columns="symbol")
+
+        assert rows == [{"batch_date": "2025-06-01", "symbol": "AAPL"}]
+        mock_sb.table.assert_called_with("stock_scores")
+        select.assert_called_once_with("symbol")
+        select.return_value.in_.assert_called_once_with("batch_date", ["2025-06-01"])
+        select.return_value.in_.return_value.in_.assert_called_once_with(
+            "strategy_mode", ["conservative", "aggressive"]
+        )
+        select.return_value.in_.return_value.in_.return_value.order.assert_called_once_with("id")
+        ordered.range.assert_called_once_with(0, QUERY_PAGE_SIZE - 1)
+
+    def test_scores_page_past_row_cap(self, mock_create_client, mock_config_module):
+        """A full page triggers the next range until a short page comes back."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+        full_page = [{"symbol": f"S{i}"} for i in range(QUERY_PAGE_SIZE)]
+        ordered = (
+            mock_sb.table.return_value.select.return_value
+            .in_.return_value.in_.return_value.order.return_value
+        )
+        ordered.range.return_value.execute.side_effect = [
+            MagicMock(data=full_page),
+            MagicMock(data=[{"symbol": "LAST"}]),
+        ]
+
+        rows = client.get_scores_for_dates(["2025-06-01", "2025-06-02"], ["conservative"])
+
+        assert len(rows) == QUERY_PAGE_SIZE + 1
+        assert rows[-1] == {"symbol": "LAST"}
+        assert [c.args for c in ordered.range.call_args_list] == [
+            (0, QUERY_PAGE_SIZE - 1),
+            (QUERY_PAGE_SIZE, 2 * QUERY_PAGE_SIZE - 1),
+        ]
+
+    def test_picks_empty_result(self, mock_create_client, mock_config_module):
+        """No picks rows yields an empty list."""
+        mock_config_module.supabase = _make_mock_config().supabase
+        client, mock_sb = _build_client(mock_create_client, mock_config_module)
+        select = mock_sb.table.return_value.select
+        select.return_value.in_.return_value.in_.return_value.execute.return_value.data = None
+
+        assert client.get_picks_for_dates(["2025-06-01"], ["conservative"]) == []
+        mock_sb.table.assert_called_with("daily_picks")